@@ -0,0 +1,69 @@
+"""delete polymorphic document associations with triggers
+
+Revision ID: c7d2e9a41b05
+Revises: b1e896750edb
+Create Date: 2026-10-19 09:15:42.118204+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e9a41b05'
+down_revision: Union[str, None] = 'b1e896750edb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Entity tables referenced by document_associations.entity_id, with their entitytype label
+ENTITY_TABLES = {
+    'applications': 'APPLICATION',
+    'opportunities': 'OPPORTUNITY',
+    'companies': 'COMPANY',
+    'contacts': 'CONTACT',
+}
+
+
+def upgrade() -> None:
+    # Step 1: Remove associations already orphaned by previous ORM-side deletes
+    for table, entity_type in ENTITY_TABLES.items():
+        op.execute(f"""
+            DELETE FROM document_associations da
+            WHERE da.entity_type = '{entity_type}'
+            AND NOT EXISTS (SELECT 1 FROM {table} e WHERE e.id = da.entity_id)
+        """)
+
+    # Step 2: Set-based cleanup function, fed by the statement's transition table
+    # (also fires for rows removed by ON DELETE CASCADE, e.g. opportunity -> applications)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION delete_document_associations_for_entities()
+        RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM document_associations da
+            USING deleted_entities d
+            WHERE da.entity_type = TG_ARGV[0]::entitytype
+            AND da.entity_id = d.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Step 3: One statement-level trigger per entity table
+    for table, entity_type in ENTITY_TABLES.items():
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_delete_document_associations
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS deleted_entities
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION delete_document_associations_for_entities('{entity_type}')
+        """)
+
+
+def downgrade() -> None:
+    for table in ENTITY_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_delete_document_associations ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS delete_document_associations_for_entities()")
@@ -0,0 +1,101 @@
+"""add users data_version change counter
+
+Revision ID: d4e1f7a93c20
+Revises: c7d2e9a41b05
+Create Date: 2026-10-19 10:40:07.532918+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e1f7a93c20'
+down_revision: Union[str, None] = 'c7d2e9a41b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables carrying owner_id directly
+OWNED_TABLES = [
+    'companies',
+    'contacts',
+    'products',
+    'documents',
+    'opportunities',
+    'applications',
+    'scheduled_events',
+    'actions',
+]
+
+# Tables without owner_id: (parent table, foreign key column) giving the owner
+CHILD_TABLES = {
+    'opportunity_contacts': ('opportunities', 'opportunity_id'),
+    'opportunity_products': ('opportunities', 'opportunity_id'),
+    'document_associations': ('documents', 'document_id'),
+}
+
+EVENTS = {
+    'insert': 'NEW TABLE',
+    'update': 'NEW TABLE',
+    'delete': 'OLD TABLE',
+}
+
+
+def upgrade() -> None:
+    # Step 1: Per-user counter, bumped on every write to the user's data
+    op.add_column('users', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+    # Step 2: Set-based bump function, fed by the statement's transition table.
+    # Without arguments the rows carry owner_id; otherwise TG_ARGV gives the
+    # parent table and foreign key column to resolve the owner through.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_users_data_version()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                UPDATE users u SET data_version = u.data_version + 1
+                WHERE u.id IN (SELECT DISTINCT c.owner_id FROM changed_rows c);
+            ELSE
+                EXECUTE format(
+                    'UPDATE users u SET data_version = u.data_version + 1
+                     WHERE u.id IN (SELECT DISTINCT p.owner_id FROM %I p JOIN changed_rows c ON p.id = c.%I)',
+                    TG_ARGV[0], TG_ARGV[1]
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Step 3: Statement-level triggers (transition tables need one trigger per event)
+    for table in OWNED_TABLES:
+        for event, transition in EVENTS.items():
+            op.execute(f"""
+                CREATE TRIGGER trg_{table}_{event}_bump_data_version
+                AFTER {event.upper()} ON {table}
+                REFERENCING {transition} AS changed_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION bump_users_data_version()
+            """)
+
+    for table, (parent_table, fk_column) in CHILD_TABLES.items():
+        for event, transition in EVENTS.items():
+            op.execute(f"""
+                CREATE TRIGGER trg_{table}_{event}_bump_data_version
+                AFTER {event.upper()} ON {table}
+                REFERENCING {transition} AS changed_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION bump_users_data_version('{parent_table}', '{fk_column}')
+            """)
+
+
+def downgrade() -> None:
+    for table in [*OWNED_TABLES, *CHILD_TABLES]:
+        for event in EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_{event}_bump_data_version ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS bump_users_data_version()")
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,144 @@
+"""add change_log table for delta sync
+
+Revision ID: e5a2c8d14f67
+Revises: d4e1f7a93c20
+Create Date: 2026-10-19 11:35:51.204377+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a2c8d14f67'
+down_revision: Union[str, None] = 'd4e1f7a93c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same table sets as the data_version triggers (migration d4e1f7a93c20)
+OWNED_TABLES = [
+    'companies',
+    'contacts',
+    'products',
+    'documents',
+    'opportunities',
+    'applications',
+    'scheduled_events',
+    'actions',
+]
+
+CHILD_TABLES = {
+    'opportunity_contacts': ('opportunities', 'opportunity_id'),
+    'opportunity_products': ('opportunities', 'opportunity_id'),
+    'document_associations': ('documents', 'document_id'),
+}
+
+EVENTS = ['insert', 'update', 'delete']
+
+
+def upgrade() -> None:
+    # Step 1: Create change_log table (id is the client sync token)
+    op.create_table('change_log',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('operation', sa.String(length=10), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_owner_id_id', 'change_log', ['owner_id', 'id'], unique=False)
+
+    # Step 2: Backfill existing entities as inserts, so a first sync (since=0) returns everything
+    for table in OWNED_TABLES:
+        op.execute(f"""
+            INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+            SELECT owner_id, '{table}', id, 'insert' FROM {table} ORDER BY id
+        """)
+
+    for table, (parent_table, fk_column) in CHILD_TABLES.items():
+        op.execute(f"""
+            INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+            SELECT p.owner_id, '{table}', c.id, 'insert'
+            FROM {table} c JOIN {parent_table} p ON p.id = c.{fk_column}
+            ORDER BY c.id
+        """)
+
+    # Step 3: The trigger function now also appends to change_log.
+    # users is updated first: its row lock serializes a user's writes,
+    # so change_log ids are allocated in commit order for that user.
+    op.execute("ALTER FUNCTION bump_users_data_version() RENAME TO record_entity_changes")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_entity_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                UPDATE users u SET data_version = u.data_version + 1
+                WHERE u.id IN (SELECT DISTINCT c.owner_id FROM changed_rows c);
+
+                INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                SELECT c.owner_id, TG_TABLE_NAME, c.id, lower(TG_OP)
+                FROM changed_rows c JOIN users u ON u.id = c.owner_id
+                ORDER BY c.id;
+            ELSE
+                EXECUTE format(
+                    'UPDATE users u SET data_version = u.data_version + 1
+                     WHERE u.id IN (SELECT DISTINCT p.owner_id FROM %I p JOIN changed_rows c ON p.id = c.%I)',
+                    TG_ARGV[0], TG_ARGV[1]
+                );
+
+                EXECUTE format(
+                    'INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                     SELECT p.owner_id, $1, c.id, $2
+                     FROM changed_rows c JOIN %I p ON p.id = c.%I
+                     ORDER BY c.id',
+                    TG_ARGV[0], TG_ARGV[1]
+                ) USING TG_TABLE_NAME, lower(TG_OP);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in [*OWNED_TABLES, *CHILD_TABLES]:
+        for event in EVENTS:
+            op.execute(
+                f"ALTER TRIGGER trg_{table}_{event}_bump_data_version ON {table} "
+                f"RENAME TO trg_{table}_{event}_record_changes"
+            )
+
+
+def downgrade() -> None:
+    for table in [*OWNED_TABLES, *CHILD_TABLES]:
+        for event in EVENTS:
+            op.execute(
+                f"ALTER TRIGGER trg_{table}_{event}_record_changes ON {table} "
+                f"RENAME TO trg_{table}_{event}_bump_data_version"
+            )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_entity_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                UPDATE users u SET data_version = u.data_version + 1
+                WHERE u.id IN (SELECT DISTINCT c.owner_id FROM changed_rows c);
+            ELSE
+                EXECUTE format(
+                    'UPDATE users u SET data_version = u.data_version + 1
+                     WHERE u.id IN (SELECT DISTINCT p.owner_id FROM %I p JOIN changed_rows c ON p.id = c.%I)',
+                    TG_ARGV[0], TG_ARGV[1]
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("ALTER FUNCTION record_entity_changes() RENAME TO bump_users_data_version")
+
+    op.drop_index('ix_change_log_owner_id_id', table_name='change_log')
+    op.drop_table('change_log')
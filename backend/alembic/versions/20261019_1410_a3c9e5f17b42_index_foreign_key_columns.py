@@ -0,0 +1,47 @@
+"""index foreign key columns
+
+Revision ID: a3c9e5f17b42
+Revises: f1b7d3e6a829
+Create Date: 2026-10-19 14:10:42.318907+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5f17b42'
+down_revision: Union[str, None] = 'f1b7d3e6a829'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Found by scripts/audit_fk_indexes.py: ON DELETE CASCADE / SET NULL on the
+# parent and the ?<fk>= list filters scanned these tables sequentially.
+FOREIGN_KEY_COLUMNS = [
+    ("applications", "opportunity_id"),
+    ("applications", "resume_used_id"),
+    ("applications", "cover_letter_id"),
+    ("actions", "application_id"),
+    ("actions", "scheduled_event_id"),
+    ("opportunities", "company_id"),
+    ("contacts", "company_id"),
+    ("products", "company_id"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not block writes while building, but cannot run in a
+    # transaction. IF NOT EXISTS makes a rerun after a failed build a no-op for
+    # the indexes already built (an invalid leftover must be dropped by hand).
+    with op.get_context().autocommit_block():
+        for table, column in FOREIGN_KEY_COLUMNS:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_{column} ON {table} ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in reversed(FOREIGN_KEY_COLUMNS):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_{column}")
@@ -0,0 +1,55 @@
+"""add owner scoped composite indexes
+
+Revision ID: b8d4f2a6c913
+Revises: a3c9e5f17b42
+Create Date: 2026-10-19 14:55:07.504218+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f2a6c913'
+down_revision: Union[str, None] = 'a3c9e5f17b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, definition) matching the query shapes of the list endpoints
+COMPOSITE_INDEXES = [
+    # ?status= on the active applications
+    ("ix_applications_owner_id_status_active", "applications (owner_id, status) WHERE is_archived = false"),
+    # GET /actions/ orders by created_at
+    ("ix_actions_owner_id_created_at", "actions (owner_id, created_at)"),
+    # Events of a user by date
+    ("ix_scheduled_events_owner_id_scheduled_date", "scheduled_events (owner_id, scheduled_date)"),
+    # check_user_quota counts the local documents of a user
+    ("ix_documents_owner_id_is_external", "documents (owner_id, is_external)"),
+]
+
+# Single-column indexes made redundant by a composite index with the same leading column
+REDUNDANT_INDEXES = [
+    ("ix_actions_owner_id", "actions (owner_id)"),
+    ("ix_scheduled_events_owner_id", "scheduled_events (owner_id)"),
+    ("ix_documents_owner_id", "documents (owner_id)"),
+]
+
+
+def upgrade() -> None:
+    # Build first, drop afterwards, so owner_id lookups stay indexed throughout
+    with op.get_context().autocommit_block():
+        for name, definition in COMPOSITE_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name, _ in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in REDUNDANT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+        for name, _ in reversed(COMPOSITE_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,49 @@
+"""unique document associations
+
+Revision ID: c5e1a7d39f24
+Revises: b8d4f2a6c913
+Create Date: 2026-10-19 15:40:26.871354+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a7d39f24'
+down_revision: Union[str, None] = 'b8d4f2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Deduplication and index creation share one transaction. Lock the table
+    # first: SHARE ROW EXCLUSIVE blocks concurrent writes (but not reads) until
+    # commit, so no duplicate can be inserted between the DELETE and the index.
+    op.execute("LOCK TABLE document_associations IN SHARE ROW EXCLUSIVE MODE")
+
+    # 1. Keep the oldest association of each (document, entity) pair
+    op.execute("""
+        DELETE FROM document_associations a
+        USING document_associations b
+        WHERE a.document_id = b.document_id
+          AND a.entity_type = b.entity_type
+          AND a.entity_id = b.entity_id
+          AND a.id > b.id
+    """)
+
+    # 2. Unique index (ON CONFLICT target); it also serves document_id lookups
+    op.execute("""
+        CREATE UNIQUE INDEX uq_document_associations_document_entity
+        ON document_associations (document_id, entity_type, entity_id)
+    """)
+
+    # 3. Drop the document_id index, now a prefix of the unique index
+    op.execute("DROP INDEX IF EXISTS ix_document_associations_document_id")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_document_associations_document_id ON document_associations (document_id)")
+    op.execute("DROP INDEX IF EXISTS uq_document_associations_document_entity")
@@ -0,0 +1,124 @@
+"""add users last write at for replica routing
+
+Revision ID: d6f2b8a41c07
+Revises: c5e1a7d39f24
+Create Date: 2026-10-19 16:30:51.207734+01:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f2b8a41c07'
+down_revision: Union[str, None] = 'c5e1a7d39f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without default: adding the column does not rewrite the table
+    op.add_column('users', sa.Column('last_write_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Stamped with data_version: reads of a user who just wrote stay on the primary.
+    # clock_timestamp() is the time of the write statement; now() would be the start
+    # of the transaction, using up part of the window before the write is visible.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_entity_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                UPDATE users u SET data_version = u.data_version + 1, last_write_at = clock_timestamp()
+                WHERE u.id IN (SELECT DISTINCT c.owner_id FROM changed_rows c);
+
+                INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                SELECT c.owner_id, TG_TABLE_NAME, c.id, lower(TG_OP)
+                FROM changed_rows c JOIN users u ON u.id = c.owner_id
+                ORDER BY c.id;
+
+                PERFORM pg_notify('entity_changes', json_build_object(
+                    'owner_id', c.owner_id, 'entity_type', TG_TABLE_NAME,
+                    'entity_id', c.id, 'operation', lower(TG_OP)
+                )::text)
+                FROM changed_rows c;
+            ELSE
+                EXECUTE format(
+                    'UPDATE users u SET data_version = u.data_version + 1, last_write_at = clock_timestamp()
+                     WHERE u.id IN (SELECT DISTINCT p.owner_id FROM %I p JOIN changed_rows c ON p.id = c.%I)',
+                    TG_ARGV[0], TG_ARGV[1]
+                );
+
+                EXECUTE format(
+                    'INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                     SELECT p.owner_id, $1, c.id, $2
+                     FROM changed_rows c JOIN %I p ON p.id = c.%I
+                     ORDER BY c.id',
+                    TG_ARGV[0], TG_ARGV[1]
+                ) USING TG_TABLE_NAME, lower(TG_OP);
+
+                EXECUTE format(
+                    'SELECT pg_notify(''entity_changes'', json_build_object(
+                         ''owner_id'', p.owner_id, ''entity_type'', $1,
+                         ''entity_id'', c.id, ''operation'', $2
+                     )::text)
+                     FROM changed_rows c JOIN %I p ON p.id = c.%I',
+                    TG_ARGV[0], TG_ARGV[1]
+                ) USING TG_TABLE_NAME, lower(TG_OP);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_entity_changes()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                UPDATE users u SET data_version = u.data_version + 1
+                WHERE u.id IN (SELECT DISTINCT c.owner_id FROM changed_rows c);
+
+                INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                SELECT c.owner_id, TG_TABLE_NAME, c.id, lower(TG_OP)
+                FROM changed_rows c JOIN users u ON u.id = c.owner_id
+                ORDER BY c.id;
+
+                PERFORM pg_notify('entity_changes', json_build_object(
+                    'owner_id', c.owner_id, 'entity_type', TG_TABLE_NAME,
+                    'entity_id', c.id, 'operation', lower(TG_OP)
+                )::text)
+                FROM changed_rows c;
+            ELSE
+                EXECUTE format(
+                    'UPDATE users u SET data_version = u.data_version + 1
+                     WHERE u.id IN (SELECT DISTINCT p.owner_id FROM %I p JOIN changed_rows c ON p.id = c.%I)',
+                    TG_ARGV[0], TG_ARGV[1]
+                );
+
+                EXECUTE format(
+                    'INSERT INTO change_log (owner_id, entity_type, entity_id, operation)
+                     SELECT p.owner_id, $1, c.id, $2
+                     FROM changed_rows c JOIN %I p ON p.id = c.%I
+                     ORDER BY c.id',
+                    TG_ARGV[0], TG_ARGV[1]
+                ) USING TG_TABLE_NAME, lower(TG_OP);
+
+                EXECUTE format(
+                    'SELECT pg_notify(''entity_changes'', json_build_object(
+                         ''owner_id'', p.owner_id, ''entity_type'', $1,
+                         ''entity_id'', c.id, ''operation'', $2
+                     )::text)
+                     FROM changed_rows c JOIN %I p ON p.id = c.%I',
+                    TG_ARGV[0], TG_ARGV[1]
+                ) USING TG_TABLE_NAME, lower(TG_OP);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.drop_column('users', 'last_write_at')
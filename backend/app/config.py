@@ -41,6 +41,16 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Read replicas (JSON list of URLs); empty sends every query to DATABASE_URL
+    DATABASE_REPLICA_URLS: List[str] = []
+    # Reads of a user stay on the primary this long after their last write
+    # (users.last_write_at, stamped by the database clock when the write statement
+    # runs, compared with the app host's clock). Must exceed the replication lag
+    # plus the clock skew between app and database hosts (NTP assumed) plus the
+    # time from the write statement to its commit.
+    REPLICA_READ_YOUR_WRITES_SECONDS: int = 5
+    # A replica failing to connect is skipped for this long
+    REPLICA_RETRY_AFTER_SECONDS: int = 30
 
     # Documents
     DOCUMENTS_PATH: str = "/app/documents"
@@ -113,6 +123,43 @@ class Settings(BaseSettings):
         "json": "application/json",
     }
 
+    # Response compression (gzip, or brotli when the brotli package is installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # Only text-like payloads are compressed; PDF, images and Office files already are
+    COMPRESSION_CONTENT_TYPES: set = {
+        "application/json",
+        "text/plain",
+        "text/markdown",
+        "text/csv",
+        "text/tab-separated-values",
+        "text/html",
+    }
+
+    # Per-request SQL statistics (Server-Timing header and request logs)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_WARNING_THRESHOLD: int = 20
+    QUERY_STATS_REPEAT_THRESHOLD: int = 5
+
+    # Slow query log (0 disables it); a sample of slow SELECTs gets EXPLAIN (ANALYZE, BUFFERS)
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+
+    # Prometheus metrics (GET /metrics)
+    METRICS_ENABLED: bool = True
+
+    # On-demand profiling (X-Profile header + this token; empty disables it)
+    PROFILING_ADMIN_TOKEN: str = ""
+    PROFILING_OUTPUT_DIR: str = "/app/profiles"
+
+    # Request tracing: "file" (JSON lines), "otlp" (OTLP/HTTP collector) or "" (disabled)
+    TRACING_EXPORTER: str = ""
+    TRACING_SERVICE_NAME: str = "candidash-api"
+    TRACING_FILE_PATH: str = "/app/traces/spans.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -0,0 +1,204 @@
+"""
+Response compression middleware.
+
+Compresses responses with brotli or gzip depending on the client's Accept-Encoding,
+only when the body is large enough and its content type is in the allowlist.
+Document downloads that are already compressed (PDF, PNG, DOCX, ...) are passed
+through untouched.
+
+Brotli is used when the `brotli` package is installed, gzip (stdlib) otherwise.
+"""
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+class _GzipCompressor:
+    """Incremental gzip compressor (zlib with gzip header/trailer)."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    """Incremental brotli compressor."""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def select_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the best content encoding accepted by the client.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header (e.g. "gzip, deflate, br;q=0.9")
+        available: Encodings the server can produce, in order of preference
+
+    Returns:
+        Encoding name, or None if the client accepts none of them
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing eligible responses with brotli or gzip.
+
+    A response is compressed only if:
+    - the client accepts an available encoding,
+    - it has no Content-Encoding yet,
+    - its media type is in `content_types`,
+    - its body is at least `minimum_size` bytes (streamed bodies always qualify).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = select_encoding(headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def create_compressor(self, encoding: str):
+        """Create a fresh compressor for one response."""
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    """Wraps `send` for a single response, deciding on the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+
+    def _is_eligible(self) -> bool:
+        headers = Headers(raw=self.initial_message["headers"])
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.middleware.content_types
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold the headers until the first body chunk tells us whether to compress
+            self.initial_message = message
+            self.passthrough = not self._is_eligible()
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            if not self.started and self.initial_message:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+
+            if len(body) < self.middleware.minimum_size and not more_body:
+                # Small responses cost more to compress than to send
+                await self._send(self.initial_message)
+                await self._send(message)
+                return
+
+            self.compressor = self.middleware.create_compressor(self.encoding)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.compressor.compress(body)
+            else:
+                message["body"] = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(message["body"]))
+
+            await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        if self.compressor is None:
+            # Small single-chunk response already sent as-is
+            await self._send(message)
+            return
+
+        # Remaining chunks of a streamed response
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        message["body"] = chunk
+        await self._send(message)
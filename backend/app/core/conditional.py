@@ -0,0 +1,110 @@
+"""
+Conditional GET support (weak ETags + 304 Not Modified).
+
+ETags are derived from the user's data_version counter, which database triggers
+increment on every write to any of the user's entities. The counter is loaded
+with the authenticated user, so answering 304 costs no query beyond authentication,
+and no rows are loaded or serialized.
+"""
+import hashlib
+from fastapi import Depends, HTTPException, Request, status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.dependencies import get_current_user
+from app.models.user import User
+
+
+# Clients may store the response but must revalidate it before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(request: Request, user: User) -> str:
+    """
+    Compute the weak ETag of a GET request for a user.
+
+    The tag changes whenever the user's data changes (data_version) and is
+    specific to the URL (path + query string, e.g. filters, fields, expand).
+
+    Args:
+        request: Incoming request
+        user: Authenticated user
+
+    Returns:
+        Weak ETag header value (e.g. W/"42-1f3a9c0b7d2e4a55")
+    """
+    resource = f"{user.id}:{request.url.path}?{request.url.query}".encode()
+    digest = hashlib.blake2b(resource, digest_size=8).hexdigest()
+    return f'W/"{user.data_version}-{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+) -> None:
+    """
+    Router dependency answering conditional GET requests.
+
+    Raises 304 before the endpoint runs when the client's If-None-Match matches
+    the current ETag. Otherwise the ETag is stored in request.state and added
+    to the response by ETagMiddleware (endpoints may return Response objects
+    directly, which bypass dependency-set headers).
+
+    Args:
+        request: Incoming request
+        current_user: Authenticated user (shared with the endpoint's own dependency)
+
+    Raises:
+        HTTPException 304: If the client's cached representation is still current
+    """
+    if request.method != "GET":
+        return
+
+    etag = compute_etag(request, current_user)
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match and _etag_matches(if_none_match, etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+
+    request.state.etag = etag
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware adding the ETag computed by conditional_get to 200 responses.
+
+    Responses that already carry an ETag (e.g. FileResponse) are left untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == status.HTTP_200_OK:
+                etag = scope.get("state", {}).get("etag")
+                if etag is not None and "etag" not in Headers(raw=message["headers"]):
+                    headers = MutableHeaders(raw=message["headers"])
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = CACHE_CONTROL
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
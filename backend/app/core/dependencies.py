@@ -4,8 +4,9 @@ FastAPI dependencies for authentication and authorization.
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, route_reads_to_replica
 from app.core.security import decode_access_token
+from app.core.tracing import traced
 from app.models.user import User
 
 
@@ -13,6 +14,7 @@ from app.models.user import User
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+@traced("auth.get_current_user")
 def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -53,6 +55,9 @@ def get_current_user(
             detail="Inactive user account"
         )
 
+    # The user was read on the primary: its last write decides where the rest goes
+    route_reads_to_replica(db, user.last_write_at)
+
     return user
 
 
@@ -0,0 +1,141 @@
+"""
+Live entity change notifications (Postgres LISTEN/NOTIFY fan-out).
+
+Database triggers NOTIFY the `entity_changes` channel for every committed write
+to an owned entity (see migration f1b7d3e6a829). Each uvicorn worker keeps a
+single LISTEN connection, registered on the event loop (it is opened in a
+worker thread, so a slow database never blocks the loop), and dispatches the
+notifications to the in-process queues of the owner's subscribers.
+Because NOTIFY goes through the database, changes made through any worker
+reach subscribers connected to any other worker.
+"""
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+import anyio
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "entity_changes"
+
+# Sent to subscribers whose notifications may have been lost (client should call /sync)
+RESYNC_EVENT = {"type": "resync"}
+
+
+class ChangeBroker:
+    """
+    Per-process fan-out of entity change notifications to subscribed users.
+
+    The LISTEN connection is opened lazily on the first subscription and
+    re-opened by ensure_listening() if it is lost.
+    """
+
+    def __init__(self, queue_size: int = 1000) -> None:
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._connection = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes the (threaded) connects of concurrent subscribers
+        self._connect_lock = asyncio.Lock()
+
+    async def ensure_listening(self) -> None:
+        """Open the LISTEN connection if not already open (must run on the event loop)."""
+        if self._connection is not None:
+            return
+
+        async with self._connect_lock:
+            if self._connection is not None:
+                return
+            # psycopg2.connect blocks until the database answers: keep it off the loop
+            connection = await anyio.to_thread.run_sync(self._connect)
+
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(connection.fileno(), self._on_readable)
+            self._connection = connection
+
+    @staticmethod
+    def _connect():
+        """Open an autocommit connection listening on CHANNEL (blocking)."""
+        connect_args = engine.url.translate_connect_args(username="user", database="dbname")
+        connection = psycopg2.connect(**connect_args, **engine.url.query)
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return connection
+
+    def close(self) -> None:
+        """Stop listening and close the connection."""
+        if self._connection is None:
+            return
+
+        if self._loop is not None and not self._connection.closed:
+            self._loop.remove_reader(self._connection.fileno())
+        self._connection.close()
+        self._connection = None
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to the changes of a user's entities.
+
+        Args:
+            user_id: Owner whose changes are delivered
+
+        Yields:
+            Queue receiving change dicts (entity_type, entity_id, operation)
+            or RESYNC_EVENT
+        """
+        await self.ensure_listening()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def _on_readable(self) -> None:
+        """Drain pending notifications from the LISTEN connection."""
+        try:
+            self._connection.poll()
+        except psycopg2.Error:
+            logger.warning("Lost LISTEN connection on %s, subscribers must resync", CHANNEL, exc_info=True)
+            self.close()
+            self._broadcast_resync()
+            return
+
+        while self._connection.notifies:
+            notification = self._connection.notifies.pop(0)
+            change = json.loads(notification.payload)
+            owner_id = change.pop("owner_id")
+
+            for queue in self._subscribers.get(owner_id, ()):
+                self._deliver(queue, change)
+
+    def _broadcast_resync(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._deliver(queue, RESYNC_EVENT)
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the backlog and ask the client to resync instead
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC_EVENT)
+
+
+change_broker = ChangeBroker()
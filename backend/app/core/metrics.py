@@ -0,0 +1,181 @@
+"""
+Prometheus metrics.
+
+Exposed on GET /metrics. With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR
+to an empty directory shared by the workers (and wiped before they start); samples
+are then written there by every worker and aggregated at scrape time. Without it,
+each process serves its own metrics (fine for a single worker).
+"""
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHING_DISABLED,
+    NO_CACHE_KEY,
+    NO_DIALECT_SUPPORT,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS_OPEN = Gauge(
+    "db_pool_connections_open",
+    "Database connections opened by the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Database connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_STATEMENTS = Counter(
+    "db_statements_total",
+    "SQL statements executed",
+)
+DB_COMPILED_CACHE = Counter(
+    "db_compiled_cache_total",
+    "SQL compilation cache lookups of executed statements (hit rate: hit / all results)",
+    ["result"],
+)
+OWNED_ENTITY_STATEMENT_CACHE = Counter(
+    "owned_entity_statement_cache_total",
+    "Lookups of the pre-built SELECT statements of get_owned_entity_or_404",
+    ["result"],
+)
+DB_READ_ROUTING = Counter(
+    "db_read_routing_total",
+    "Read-only requests by database serving their reads",
+    ["target"],
+)
+DOCUMENT_TRANSFER_BYTES = Counter(
+    "document_transfer_bytes_total",
+    "Document file bytes transferred (rate() gives bytes per second)",
+    ["direction"],
+)
+ARGON2_OPERATIONS_IN_PROGRESS = Gauge(
+    "argon2_operations_in_progress",
+    "Argon2 password hash/verify operations currently running (CPU queue depth)",
+    ["operation"],
+    multiprocess_mode="livesum",
+)
+TOKEN_REFRESHES = Counter(
+    "auth_token_refreshes_total",
+    "Access token refresh attempts",
+    ["outcome"],
+)
+
+# ExecutionContext.cache_hit -> db_compiled_cache_total label
+_CACHE_RESULTS = {
+    CACHE_HIT: "hit",
+    CACHE_MISS: "miss",
+    CACHING_DISABLED: "disabled",
+    NO_CACHE_KEY: "no_key",
+    NO_DIALECT_SUPPORT: "no_dialect_support",
+}
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    DB_STATEMENTS.inc()
+    # Raw DBAPI SQL (exec_driver_sql) is never compiled
+    if context is not None and context.compiled is not None:
+        DB_COMPILED_CACHE.labels(_CACHE_RESULTS.get(context.cache_hit, "unknown")).inc()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Register pool and statement listeners feeding the database metrics.
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+    """
+    event.listen(engine, "connect", lambda *args: DB_POOL_CONNECTIONS_OPEN.inc())
+    event.listen(engine, "close", lambda *args: DB_POOL_CONNECTIONS_OPEN.dec())
+    event.listen(engine, "checkout", lambda *args: DB_POOL_CONNECTIONS_CHECKED_OUT.inc())
+    event.listen(engine, "checkin", lambda *args: DB_POOL_CONNECTIONS_CHECKED_OUT.dec())
+    event.listen(engine, "after_cursor_execute", _record_statement)
+
+
+def render_metrics() -> tuple:
+    """
+    Render all metrics in the Prometheus text format.
+
+    Returns:
+        Tuple of (payload bytes, content type)
+    """
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop the live gauges of this worker on shutdown (multiprocess mode only)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency and in-flight requests.
+
+    Latency is labelled by route template (e.g. /api/v1/applications/{application_id})
+    to keep cardinality bounded; unmatched paths are grouped under "unmatched".
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.labels(method).dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method,
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,217 @@
+"""
+On-demand profiling of a single request (admin only).
+
+A request sent with `X-Profile: store` (or `X-Profile: html`) and the admin token in
+`X-Profile-Token` runs under a pyinstrument sampling profiler. The flame graph is
+stored in PROFILING_OUTPUT_DIR (`store`, the file name is returned in
+`X-Profile-Report`) or returned instead of the response body (`html`). The
+`X-Profile-Breakdown` header splits the sampled time between DB wait, SQLAlchemy
+ORM (hydration, unit of work), Pydantic validation/serialization and the rest.
+
+Sync endpoints and dependencies run in the threadpool, out of reach of a profiler
+started on the event loop thread. instrument_routes() wraps them so that, when
+their request is profiled, a profiler is started in the worker thread for the
+duration of the call; those profiles are merged into the request's profile. The
+other requests keep running concurrently, unprofiled.
+"""
+import functools
+import hmac
+import inspect
+import re
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from pyinstrument import Profiler
+from pyinstrument.frame import AWAIT_FRAME_IDENTIFIER, OUT_OF_CONTEXT_FRAME_IDENTIFIER
+from pyinstrument.renderers import HTMLRenderer
+from pyinstrument.session import Session
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Profiles of the worker thread calls of the request being profiled (None otherwise).
+# Threadpool calls run in a copy of the request's context, so they see it.
+_worker_sessions: ContextVar[Optional[List[Session]]] = ContextVar("profiling_worker_sessions", default=None)
+
+# (category, file path fragment); the innermost matching frame of a sample wins.
+# pydantic-core is compiled: its time shows up in the Python frames calling it.
+TIME_CATEGORIES = [
+    ("db", "sqlalchemy/engine/default.py"),
+    ("db", "psycopg2"),
+    ("orm", "sqlalchemy/orm/"),
+    ("pydantic", "pydantic"),
+    ("pydantic", "fastapi/_compat.py"),
+    ("pydantic", "app/core/serialization.py"),
+]
+
+# Time spent by the event loop waiting (e.g. for a threadpool call, sampled in its thread)
+IDLE_FRAME_IDENTIFIERS = {AWAIT_FRAME_IDENTIFIER, OUT_OF_CONTEXT_FRAME_IDENTIFIER}
+
+
+def _profile_in_worker_thread(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync callable to profile its calls made for a profiled request."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        sessions = _worker_sessions.get()
+        if sessions is None:
+            return func(*args, **kwargs)
+
+        profiler = Profiler(interval=0.001, async_mode="disabled")
+        profiler.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.stop()
+            sessions.append(profiler.last_session)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def _instrument_dependant(dependant: Dependant) -> None:
+    # Generator dependencies (get_db) are left as is: FastAPI runs their steps
+    # through a context manager, and they do no work worth sampling.
+    for sub_dependant in dependant.dependencies:
+        _instrument_dependant(sub_dependant)
+
+    call = dependant.call
+    if (
+        inspect.isfunction(call)
+        and not inspect.iscoroutinefunction(call)
+        and not inspect.isgeneratorfunction(call)
+        and not getattr(call, "__profiled__", False)
+    ):
+        dependant.call = _profile_in_worker_thread(call)
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """
+    Make the sync endpoints and dependencies of an app profilable in the threadpool.
+
+    Must be called once every router is included. Outside of a profiled request,
+    the wrappers only cost a context variable lookup per call.
+
+    Args:
+        app: FastAPI application whose routes are instrumented
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            _instrument_dependant(route.dependant)
+
+
+def _categorize(file_path: str) -> str:
+    for category, fragment in TIME_CATEGORIES:
+        if fragment in file_path:
+            return category
+    return ""
+
+
+def time_breakdown(session: Session) -> Dict[str, float]:
+    """
+    Split the sampled time of a profile between DB, ORM, Pydantic and other code.
+
+    Args:
+        session: pyinstrument session of the profiled request
+
+    Returns:
+        Seconds per category (db, orm, pydantic, other)
+    """
+    totals = {"db": 0.0, "orm": 0.0, "pydantic": 0.0, "other": 0.0}
+    root = session.root_frame()
+    if root is None:
+        return totals
+
+    # Depth-first walk carrying the innermost category seen on the path
+    stack: List[tuple] = [(root, "other")]
+    while stack:
+        frame, category = stack.pop()
+        category = _categorize(frame.file_path or "") or category
+        if frame.children:
+            stack.extend((child, category) for child in frame.children)
+        elif frame.identifier not in IDLE_FRAME_IDENTIFIERS:
+            totals[category] += frame.time
+    return totals
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests that carry a valid admin token.
+
+    Args:
+        app: ASGI application
+        admin_token: Secret expected in X-Profile-Token (empty disables profiling)
+        output_dir: Directory where stored flame graphs are written
+    """
+
+    def __init__(self, app: ASGIApp, admin_token: str, output_dir: str) -> None:
+        self.app = app
+        self.admin_token = admin_token
+        self.output_dir = Path(output_dir)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        mode = headers.get("x-profile")
+        if mode is None or not self.admin_token:
+            await self.app(scope, receive, send)
+            return
+
+        if mode not in ("store", "html") or not hmac.compare_digest(
+            headers.get("x-profile-token", "").encode(), self.admin_token.encode()
+        ):
+            response = JSONResponse({"detail": "Profiling not allowed"}, status_code=403)
+            await response(scope, receive, send)
+            return
+
+        # Hold the response until the profile (which includes serialization) is complete
+        messages: List[Message] = []
+
+        async def buffer_send(message: Message) -> None:
+            messages.append(message)
+
+        worker_sessions: List[Session] = []
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        token = _worker_sessions.set(worker_sessions)
+        profiler.start()
+        try:
+            await self.app(scope, receive, buffer_send)
+        finally:
+            profiler.stop()
+            _worker_sessions.reset(token)
+
+        session = profiler.last_session
+        for worker_session in worker_sessions:
+            session = Session.combine(session, worker_session)
+        breakdown = ", ".join(
+            f"{category}={seconds * 1000:.1f}ms" for category, seconds in time_breakdown(session).items()
+        )
+        html = HTMLRenderer().render(session)
+
+        if mode == "html":
+            response = Response(html, media_type="text/html", headers={"X-Profile-Breakdown": breakdown})
+            await response(scope, receive, send)
+            return
+
+        report_name = self._store(scope, html)
+        for message in messages:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(raw=message["headers"])
+                response_headers["X-Profile-Breakdown"] = breakdown
+                response_headers["X-Profile-Report"] = report_name
+            await send(message)
+
+    def _store(self, scope: Scope, html: str) -> str:
+        """Write the flame graph and return its file name."""
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-")
+        report_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method'].lower()}-{slug}.html"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / report_name).write_text(html, encoding="utf-8")
+        return report_name
@@ -0,0 +1,157 @@
+"""
+Per-request SQL statement instrumentation.
+
+SQLAlchemy engine events count the statements and the database time of the
+current request (tracked with a context variable, which is shared with the
+threadpool running sync endpoints and dependencies). QueryStatsMiddleware
+exposes the totals in a `Server-Timing` header and the logs, and warns about
+likely N+1 patterns (the same statement executed many times in one request).
+"""
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed during one request."""
+    count: int = 0
+    duration: float = 0.0  # seconds
+    statements: Counter = field(default_factory=Counter)
+    scope: Optional[dict] = field(default=None, repr=False)
+
+    @property
+    def route(self) -> str:
+        """Calling route, e.g. "GET /api/v1/applications/{application_id}"."""
+        if self.scope is None:
+            return "-"
+        route = self.scope.get("route")
+        return f"{self.scope['method']} {route.path if route is not None else self.scope['path']}"
+
+    @property
+    def most_repeated(self) -> int:
+        """Highest number of executions of a single statement."""
+        return max(self.statements.values(), default=0)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Return the statistics of the current request (None outside a request)."""
+    return _current_stats.get()
+
+
+# The start time lives on the execution context (one per statement), not on the
+# pooled connection: failed statements leave nothing behind.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _record(statement: str, started: float) -> None:
+    stats = _current_stats.get()
+    if stats is None:
+        return
+
+    stats.count += 1
+    stats.duration += time.perf_counter() - started
+    stats.statements[statement] += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(statement, vars(context).pop("_query_start"))
+
+
+def _handle_error(exception_context):
+    # Failed statements (e.g. unique violations turned into 400/409) count too;
+    # errors outside a statement carry no start time.
+    context = exception_context.execution_context
+    started = vars(context).pop("_query_start", None) if context is not None else None
+    if started is not None:
+        _record(exception_context.statement, started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Register the statement counting listeners on an engine.
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware collecting the SQL statistics of each HTTP request.
+
+    Adds `Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms>` to responses
+    and logs one line per request. Requests exceeding `warning_threshold` statements,
+    or repeating one statement `repeat_threshold` times, are logged as warnings.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        warning_threshold: int = 20,
+        repeat_threshold: int = 5,
+    ) -> None:
+        self.app = app
+        self.warning_threshold = warning_threshold
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope=scope)
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", app;dur={elapsed_ms:.2f}'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self._log(scope, status_code, stats, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, status_code: Optional[int], stats: QueryStats, elapsed: float) -> None:
+        suspicious = stats.count > self.warning_threshold or stats.most_repeated >= self.repeat_threshold
+        level = logging.WARNING if suspicious else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+
+        logger.log(
+            level,
+            "%s %s %s - %d queries, db %.1f ms, total %.1f ms%s",
+            scope["method"], scope["path"], status_code,
+            stats.count, stats.duration * 1000, elapsed * 1000,
+            f" (possible N+1: a statement ran {stats.most_repeated} times)"
+            if stats.most_repeated >= self.repeat_threshold else "",
+        )
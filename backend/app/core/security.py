@@ -8,6 +8,7 @@ from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, InvalidHashError
 from jose import jwt, JWTError
 from app.config import settings
+from app.core.metrics import ARGON2_OPERATIONS_IN_PROGRESS
 
 
 # Argon2 password hasher with secure defaults
@@ -33,7 +34,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     try:
-        ph.verify(hashed_password, plain_password)
+        with ARGON2_OPERATIONS_IN_PROGRESS.labels("verify").track_inprogress():
+            ph.verify(hashed_password, plain_password)
         return True
     except (VerifyMismatchError, InvalidHashError):
         return False
@@ -49,7 +51,8 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password string
     """
-    return ph.hash(password)
+    with ARGON2_OPERATIONS_IN_PROGRESS.labels("hash").track_inprogress():
+        return ph.hash(password)
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
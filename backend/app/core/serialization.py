@@ -0,0 +1,59 @@
+"""
+Response serialization utilities.
+
+Provides cached Pydantic TypeAdapters so list responses are validated
+from ORM objects and dumped to JSON bytes in a single pass (pydantic-core),
+instead of FastAPI's validate -> to-dict -> JSON encode pipeline.
+"""
+from functools import lru_cache
+from typing import Any, List, Type
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+from app.core.tracing import traced
+
+
+@lru_cache(maxsize=256)
+def get_list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """
+    Return the (cached) TypeAdapter for a list of `schema`.
+
+    Building an adapter compiles its validator/serializer, so it is done
+    once per schema and reused for every request.
+
+    Args:
+        schema: Pydantic response schema (e.g. Application)
+
+    Returns:
+        TypeAdapter for List[schema]
+    """
+    return TypeAdapter(List[schema])
+
+
+@traced("serialize_response")
+def list_json_response(
+    rows: List[Any],
+    schema: Type[BaseModel],
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Validate ORM rows against a schema and return them as a JSON response.
+
+    Returning a Response from an endpoint skips FastAPI's response_model
+    processing, so rows are only validated once (here). The endpoint should
+    still declare response_model for the OpenAPI documentation.
+
+    Args:
+        rows: ORM instances (or row dicts from select_list_rows) to serialize
+        schema: Pydantic response schema (with from_attributes=True)
+        status_code: HTTP status code of the response
+
+    Returns:
+        Response with the JSON-encoded list
+    """
+    adapter = get_list_adapter(schema)
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(validated),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,156 @@
+"""
+Slow query log.
+
+Statements slower than a threshold are logged with their SQL, redacted parameters
+and calling route (when QueryStatsMiddleware is enabled). For a sample of slow
+SELECT statements, an `EXPLAIN (ANALYZE, BUFFERS)` plan is captured in a background
+thread, on its own connection and inside a rolled back transaction, and logged
+afterwards. Only SELECTs are explained: ANALYZE executes the statement again.
+"""
+import logging
+import random
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from app.core.query_stats import get_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Replace parameter values by their type (and length for strings/bytes).
+
+    Args:
+        parameters: DBAPI parameters (dict, sequence, or list of those for executemany)
+        executemany: Whether parameters holds one parameter set per row
+
+    Returns:
+        Redacted representation safe to log (no user data)
+    """
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+
+    def _redact(value: Any) -> str:
+        if value is None:
+            return "NULL"
+        if isinstance(value, (str, bytes)):
+            return f"<{type(value).__name__}:{len(value)}>"
+        return f"<{type(value).__name__}>"
+
+    if isinstance(parameters, dict):
+        return {name: _redact(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return parameters
+
+
+class SlowQueryLogger:
+    """
+    Engine listener logging statements slower than `threshold_ms`.
+
+    Args:
+        engine: Engine to instrument (also used for the EXPLAIN connections)
+        threshold_ms: Minimum duration of a logged statement
+        explain_sample_rate: Fraction of slow SELECTs explained (0 disables EXPLAIN)
+        explain_timeout_ms: statement_timeout applied to EXPLAIN ANALYZE
+        max_pending_explains: EXPLAINs queued at once; further samples are skipped
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        threshold_ms: int = 200,
+        explain_sample_rate: float = 0.1,
+        explain_timeout_ms: int = 5000,
+        max_pending_explains: int = 4,
+    ) -> None:
+        self.engine = engine
+        self.threshold = threshold_ms / 1000
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self._explain_slots = BoundedSemaphore(max_pending_explains)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    # The start time lives on the execution context (one per statement), not on
+    # the pooled connection: nothing is left behind when a statement fails.
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - vars(context).pop("_slow_query_start")
+        if duration < self.threshold or conn.info.get("slow_query_explain"):
+            return
+
+        query_id = self._log(statement, parameters, executemany, duration)
+        if (
+            not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self.explain_sample_rate
+            and self._explain_slots.acquire(blocking=False)
+        ):
+            self._executor.submit(self._explain, query_id, statement, parameters)
+
+    def _handle_error(self, exception_context) -> None:
+        # Failed statements (e.g. cancelled by statement_timeout) are logged too,
+        # never explained. Errors outside a statement carry no start time.
+        context = exception_context.execution_context
+        started = vars(context).pop("_slow_query_start", None) if context is not None else None
+        if started is None:
+            return
+
+        duration = time.perf_counter() - started
+        connection = exception_context.connection
+        if duration < self.threshold or (connection is not None and connection.info.get("slow_query_explain")):
+            return
+
+        self._log(
+            exception_context.statement, exception_context.parameters, context.executemany,
+            duration, error=exception_context.original_exception,
+        )
+
+    def _log(self, statement: str, parameters: Any, executemany: bool, duration: float, error: Any = None) -> str:
+        """Log a slow statement and return its query id."""
+        stats = get_query_stats()
+        query_id = f"{zlib.crc32(statement.encode()):08x}"
+        logger.warning(
+            "Slow query %s (%.1f ms%s) in %s\n%s\nparameters: %s",
+            query_id, duration * 1000, f", failed: {type(error).__name__}" if error is not None else "",
+            stats.route if stats is not None else "-",
+            statement, redact_parameters(parameters, executemany),
+        )
+        return query_id
+
+    def _explain(self, query_id: str, statement: str, parameters: Any) -> None:
+        """Run EXPLAIN (ANALYZE, BUFFERS) and log the plan (background thread)."""
+        try:
+            with self.engine.connect() as conn:
+                conn.info["slow_query_explain"] = True
+                try:
+                    conn.execute(text(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}"))
+                    plan_rows = conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                    ).fetchall()
+                finally:
+                    conn.info.pop("slow_query_explain", None)
+                    conn.rollback()
+
+            plan = "\n".join(row[0] for row in plan_rows)
+            logger.warning("Plan of slow query %s:\n%s", query_id, plan)
+        except Exception:
+            logger.warning("Could not EXPLAIN slow query %s", query_id, exc_info=True)
+        finally:
+            self._explain_slots.release()
+
+    def close(self) -> None:
+        """Stop the EXPLAIN worker thread."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
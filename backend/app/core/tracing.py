@@ -0,0 +1,247 @@
+"""
+Request tracing with OpenTelemetry spans.
+
+Each HTTP request gets a server span (continuing the caller's trace when a W3C
+`traceparent` header is sent), with child spans for the endpoint, the auth
+dependency, ownership checks, SQL statements, response serialization and document
+storage I/O. Spans follow the request into the threadpool (context variables), so
+sync endpoints and dependencies nest under the request as well.
+
+Endpoints returning a value (response_model) have it validated and serialized by
+FastAPI after they return: instrument_routes() notes when the endpoint returned,
+and TracingMiddleware records that interval, up to the response start, as the
+"serialize_response" span.
+
+TRACING_EXPORTER selects where finished spans go:
+- "file": one JSON span per line appended to TRACING_FILE_PATH
+- "otlp": OTLP/HTTP to a collector at TRACING_OTLP_ENDPOINT (Jaeger, Tempo, ...)
+- "" (default): tracing disabled, the spans are no-ops
+"""
+import functools
+import inspect
+import os
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+tracer = trace.get_tracer("candidash")
+
+# Per request, set by TracingMiddleware: "serialization_start" (ns) once the endpoint
+# returned a value FastAPI still has to serialize. The dict is shared with the
+# copies of the context made for the threadpool.
+_response_timing: ContextVar[Optional[Dict[str, int]]] = ContextVar("tracing_response_timing", default=None)
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator running a function (sync or async) inside a span.
+
+    The wrapper keeps the signature of the function (functools.wraps), so it can
+    decorate FastAPI dependencies.
+
+    Args:
+        name: Span name, e.g. "auth.get_current_user"
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def configure_tracing(
+    exporter: str,
+    service_name: str,
+    file_path: str,
+    otlp_endpoint: str,
+) -> Optional[TracerProvider]:
+    """
+    Install the tracer provider and its exporter.
+
+    Args:
+        exporter: "file", "otlp" or "" (disabled)
+        service_name: service.name resource attribute
+        file_path: JSON lines file of the "file" exporter
+        otlp_endpoint: OTLP/HTTP traces endpoint of the "otlp" exporter
+
+    Returns:
+        The provider (shut it down to flush pending spans), None when disabled
+
+    Raises:
+        ValueError: If the exporter is unknown
+    """
+    if not exporter:
+        return None
+
+    if exporter == "file":
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        span_exporter = ConsoleSpanExporter(
+            out=open(file_path, "a", buffering=1, encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    elif exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {exporter!r} (expected 'file' or 'otlp')")
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    return provider
+
+
+def _trace_endpoint(func: Callable) -> Callable:
+    """Run an endpoint in a span and note when it hands a value over to serialization."""
+    name = f"endpoint.{func.__name__}"
+
+    def returned(result: Any) -> Any:
+        timing = _response_timing.get()
+        if timing is not None and not isinstance(result, Response):
+            timing["serialization_start"] = time.time_ns()
+        return result
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name):
+                result = await func(*args, **kwargs)
+            return returned(result)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.start_as_current_span(name):
+            result = func(*args, **kwargs)
+        return returned(result)
+    return wrapper
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """
+    Trace the endpoints of an app (endpoint span and serialization of its result).
+
+    Must be called once every router is included.
+
+    Args:
+        app: FastAPI application whose routes are instrumented
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and inspect.isfunction(route.dependant.call):
+            route.dependant.call = _trace_endpoint(route.dependant.call)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = tracer.start_span(
+        statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL",
+        kind=SpanKind.CLIENT,
+        attributes={"db.system": "postgresql", "db.statement": statement},
+    )
+    conn.info.setdefault("tracing_spans", []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = conn.info["tracing_spans"].pop()
+    if cursor.rowcount >= 0:
+        span.set_attribute("db.rows", cursor.rowcount)
+    span.end()
+
+
+def _handle_error(exception_context):
+    spans = exception_context.connection.info.get("tracing_spans") if exception_context.connection else None
+    if spans:
+        span = spans.pop()
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Trace every SQL statement executed by an engine (SQL text only, no parameters).
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the server span of each HTTP request.
+
+    The span is named after the route template once routing is done
+    (e.g. "POST /api/v1/documents/{document_id}/replace-file").
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        parent = propagate.extract(Headers(scope=scope))
+
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}",
+            context=parent,
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            timing: Dict[str, int] = {}
+            token = _response_timing.set(timing)
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    serialization_start = timing.pop("serialization_start", None)
+                    if serialization_start is not None:
+                        tracer.start_span(
+                            "serialize_response",
+                            context=trace.set_span_in_context(span),
+                            start_time=serialization_start,
+                        ).end()
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                _response_timing.reset(token)
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
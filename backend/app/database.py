@@ -1,7 +1,15 @@
-from sqlalchemy import create_engine
+import itertools
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from fastapi import Request
+from sqlalchemy import Select, create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 from app.config import settings
+from app.core.metrics import DB_READ_ROUTING
 
 # Database engine creation
 engine = create_engine(
@@ -10,16 +18,127 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+# Read replicas (optional)
+replica_engines: List[Engine] = [
+    create_engine(url, echo=settings.DEBUG, pool_pre_ping=True)
+    for url in settings.DATABASE_REPLICA_URLS
+]
+
+# Requests whose handlers only read
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+class ReplicaPool:
+    """
+    Round robin over the read replicas, skipping the unhealthy ones.
+
+    A replica is marked down when a connection to it fails or is lost (engine
+    handle_error event), then tried again after `retry_after` seconds.
+
+    Args:
+        engines: Engines of the replicas
+        retry_after: Seconds during which a failed replica is skipped
+    """
+
+    def __init__(self, engines: List[Engine], retry_after: float) -> None:
+        self.engines = engines
+        self.retry_after = retry_after
+        self._down_until: Dict[Engine, float] = {}
+        self._turn = itertools.count()
+        for replica in engines:
+            event.listen(replica, "handle_error", self._handle_error)
+
+    def choose(self) -> Optional[Engine]:
+        """Return the next healthy replica, or None if every replica is down."""
+        now = time.monotonic()
+        start = next(self._turn)
+        for offset in range(len(self.engines)):
+            replica = self.engines[(start + offset) % len(self.engines)]
+            if self._down_until.get(replica, 0.0) <= now:
+                return replica
+        return None
+
+    def mark_down(self, replica: Engine) -> None:
+        """Skip a replica for the next `retry_after` seconds."""
+        self._down_until[replica] = time.monotonic() + self.retry_after
+
+    def _handle_error(self, context) -> None:
+        # No connection: connecting failed (replica down or unreachable)
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.engine)
+
+
+replica_pool = ReplicaPool(replica_engines, settings.REPLICA_RETRY_AFTER_SECONDS) if replica_engines else None
+
+
+class RoutingSession(Session):
+    """
+    Session sending its SELECTs to the replica chosen by route_reads_to_replica().
+
+    Writes (flush, INSERT/UPDATE/DELETE statements) always go to the primary, and
+    the first write pins the rest of the session to it (read-your-writes within a
+    request). Anything else (textual SQL, db.connection() without a clause) stays
+    on the primary too.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        replica = self.info.get("replica")
+        if replica is not None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                del self.info["replica"]
+            elif isinstance(clause, Select):
+                return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
 # Local session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects keep their state after commit. An INSERT already
+# brings back the server-generated columns (id, created_at) with RETURNING (mappers'
+# default eager_defaults="auto"), so a created entity is returned without reloading it.
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Model base
 Base = declarative_base()
 
 
+def route_reads_to_replica(db: Session, last_write_at: Optional[datetime]) -> None:
+    """
+    Send the remaining reads of a read-only request to a replica.
+
+    Called once the user is authenticated (on the primary). Reads stay on the
+    primary when the request is not read-only, when no replica is healthy, and
+    within REPLICA_READ_YOUR_WRITES_SECONDS of the user's last write, so users
+    always read their own changes, whichever worker served the write.
+
+    Args:
+        db: Session of the request
+        last_write_at: Time of the user's last write (users.last_write_at)
+    """
+    if replica_pool is None or not db.info.get("read_only"):
+        return
+
+    if last_write_at is not None:
+        elapsed = (datetime.now(timezone.utc) - last_write_at).total_seconds()
+        if elapsed < settings.REPLICA_READ_YOUR_WRITES_SECONDS:
+            DB_READ_ROUTING.labels("primary_recent_write").inc()
+            return
+
+    replica = replica_pool.choose()
+    if replica is None:
+        DB_READ_ROUTING.labels("primary_no_healthy_replica").inc()
+        return
+
+    db.info["replica"] = replica
+    DB_READ_ROUTING.labels("replica").inc()
+
+
 # Dependency to get DB session
-def get_db():
+def get_db(request: Request):
     db = SessionLocal()
+    # GET handlers only read: route_reads_to_replica() may move them to a replica
+    db.info["read_only"] = request.method in READ_ONLY_METHODS
     try:
         yield db
     finally:
@@ -1,7 +1,19 @@
 """
 Main FastAPI application.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from app.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.conditional import ETagMiddleware
+from app.core.events import change_broker
+from app.core.query_stats import QueryStatsMiddleware, instrument_engine
+from app.core import metrics
+from app.core.profiling import ProfilingMiddleware, instrument_routes
+from app.core.slow_queries import SlowQueryLogger
+from app.core import tracing
+from app.database import engine, replica_engines
 from app.routers import (
     companies_router,
     documents_router,
@@ -15,14 +27,89 @@ from app.routers import (
     opportunity_products_router,
     document_associations_router,
     auth_router,
-    users_router
+    users_router,
+    sync_router,
+    events_router
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release per-process resources on shutdown."""
+    yield
+    change_broker.close()
+    metrics.mark_worker_dead()
+    for slow_query_logger in slow_query_loggers:
+        slow_query_logger.close()
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
+
+
 app = FastAPI(
     title="CandiDash API",
     description="Job application tracking system API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+app.add_middleware(ETagMiddleware)
+
+# Primary first, then the read replicas (if any)
+engines = [engine, *replica_engines]
+
+if settings.QUERY_STATS_ENABLED:
+    for db_engine in engines:
+        instrument_engine(db_engine)
+    app.add_middleware(
+        QueryStatsMiddleware,
+        warning_threshold=settings.QUERY_STATS_WARNING_THRESHOLD,
+        repeat_threshold=settings.QUERY_STATS_REPEAT_THRESHOLD,
+    )
+
+slow_query_loggers = []
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    slow_query_loggers = [
+        SlowQueryLogger(
+            db_engine,
+            threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+            explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+        )
+        for db_engine in engines
+    ]
+
+if settings.METRICS_ENABLED:
+    for db_engine in engines:
+        metrics.instrument_engine(db_engine)
+    app.add_middleware(metrics.MetricsMiddleware)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+tracer_provider = tracing.configure_tracing(
+    settings.TRACING_EXPORTER,
+    service_name=settings.TRACING_SERVICE_NAME,
+    file_path=settings.TRACING_FILE_PATH,
+    otlp_endpoint=settings.TRACING_OTLP_ENDPOINT,
 )
+if tracer_provider is not None:
+    for db_engine in engines:
+        tracing.instrument_engine(db_engine)
+    app.add_middleware(tracing.TracingMiddleware)
+
+# Outermost, so that the profile covers the whole middleware stack
+if settings.PROFILING_ADMIN_TOKEN:
+    app.add_middleware(
+        ProfilingMiddleware,
+        admin_token=settings.PROFILING_ADMIN_TOKEN,
+        output_dir=settings.PROFILING_OUTPUT_DIR,
+    )
 
 
 @app.get("/health")
@@ -31,6 +118,15 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus scrape endpoint."""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    payload, content_type = metrics.render_metrics()
+    return Response(content=payload, media_type=content_type)
+
+
 # Register routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(users_router, prefix="/api/v1")
@@ -45,3 +141,12 @@ app.include_router(actions_router, prefix="/api/v1")
 app.include_router(opportunity_contacts_router, prefix="/api/v1")
 app.include_router(opportunity_products_router, prefix="/api/v1")
 app.include_router(document_associations_router, prefix="/api/v1")
+app.include_router(sync_router, prefix="/api/v1")
+app.include_router(events_router, prefix="/api/v1")
+
+if tracer_provider is not None:
+    tracing.instrument_routes(app)
+
+if settings.PROFILING_ADMIN_TOKEN:
+    # Sync endpoints and dependencies run in the threadpool: profile them there
+    instrument_routes(app)
@@ -14,6 +14,7 @@ from app.models.opportunity_product import OpportunityProduct
 from app.models.document_association import DocumentAssociation
 from app.models.user import User
 from app.models.refresh_token import RefreshToken
+from app.models.change_log import ChangeLog
 
 __all__ = [
     "Application",
@@ -29,4 +30,5 @@ __all__ = [
     "DocumentAssociation",
     "User",
     "RefreshToken",
+    "ChangeLog",
 ]
@@ -1,7 +1,7 @@
 """
 Action model - represents a follow-up action or note.
 """
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -18,15 +18,20 @@ class Action(Base):
     __tablename__ = "actions"
 
     id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=False, index=True)
     type = Column(String(50), nullable=False)  # follow_up, note, rejection, offer, other
     completed_date = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
-    scheduled_event_id = Column(Integer, ForeignKey("scheduled_events.id", ondelete="SET NULL"), nullable=True)
+    scheduled_event_id = Column(Integer, ForeignKey("scheduled_events.id", ondelete="SET NULL"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
+    # Lists are ordered by creation date
+    __table_args__ = (
+        Index('ix_actions_owner_id_created_at', 'owner_id', 'created_at'),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="actions")
     application = relationship("Application", back_populates="actions")
@@ -1,7 +1,7 @@
 """
 Application model - represents a job application.
 """
-from sqlalchemy import Column, Integer, Date, Float, Boolean, ForeignKey, DateTime, Enum, and_
+from sqlalchemy import Column, Integer, Date, Float, Boolean, ForeignKey, DateTime, Enum, and_, Index, text
 from sqlalchemy.orm import relationship, foreign
 from sqlalchemy.sql import func
 import enum
@@ -30,22 +30,32 @@ class Application(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    opportunity_id = Column(Integer, ForeignKey("opportunities.id", ondelete="CASCADE"), nullable=False)
+    opportunity_id = Column(Integer, ForeignKey("opportunities.id", ondelete="CASCADE"), nullable=False, index=True)
     application_date = Column(Date, nullable=False)
     status = Column(Enum(ApplicationStatus), nullable=False, default=ApplicationStatus.PENDING)
     salary_expectation = Column(Float, nullable=True)  # Your expected salary
-    resume_used_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True)
-    cover_letter_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True)
+    resume_used_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True, index=True)
+    cover_letter_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"), nullable=True, index=True)
     is_archived = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
+    # Status filters on the active (non-archived) applications
+    __table_args__ = (
+        Index(
+            'ix_applications_owner_id_status_active',
+            'owner_id',
+            'status',
+            postgresql_where=text('is_archived = false')
+        ),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="applications")
     opportunity = relationship("Opportunity", back_populates="applications")
     resume_used = relationship("Document", foreign_keys=[resume_used_id])
     cover_letter = relationship("Document", foreign_keys=[cover_letter_id])
-    actions = relationship("Action", back_populates="application", cascade="all, delete-orphan")
+    actions = relationship("Action", back_populates="application", cascade="all, delete-orphan", passive_deletes=True)
     document_associations = relationship(
         "DocumentAssociation",
         primaryjoin=and_(
@@ -53,6 +63,7 @@ class Application(Base):
             DocumentAssociation.entity_type == EntityType.APPLICATION
         ),
         cascade="all, delete-orphan",
+        passive_deletes=True,
         overlaps="document"
     )
 
@@ -0,0 +1,35 @@
+"""
+ChangeLog model - append-only log of writes to owned entities.
+"""
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ChangeLog(Base):
+    """
+    ChangeLog model.
+
+    One row per inserted, updated or deleted entity, written by database triggers
+    (see the change_log migration), never by the application.
+    The id is the monotonic sync token: writes of a single user are serialized
+    by the users.data_version row lock, so a user's ids follow commit order.
+    """
+    __tablename__ = "change_log"
+
+    id = Column(BigInteger, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    # Table name of the changed entity (e.g. "applications") and its id
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    operation = Column(String(10), nullable=False)  # insert, update, delete
+
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_change_log_owner_id_id", "owner_id", "id"),
+    )
+
+    def __repr__(self):
+        return f"<ChangeLog(id={self.id}, entity_type='{self.entity_type}', entity_id={self.entity_id}, operation='{self.operation}')>"
@@ -47,16 +47,17 @@ class Company(Base):
 
     # Relationships
     owner = relationship("User")
-    opportunities = relationship("Opportunity", back_populates="company")
-    contacts = relationship("Contact", back_populates="company")
-    products = relationship("Product", back_populates="company", cascade="all, delete-orphan")
+    opportunities = relationship("Opportunity", back_populates="company", passive_deletes=True)
+    contacts = relationship("Contact", back_populates="company", passive_deletes=True)
+    products = relationship("Product", back_populates="company", cascade="all, delete-orphan", passive_deletes=True)
     document_associations = relationship(
         "DocumentAssociation",
         primaryjoin=and_(
             foreign(DocumentAssociation.entity_id) == id,
             DocumentAssociation.entity_type == EntityType.COMPANY
         ),
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     def __repr__(self):
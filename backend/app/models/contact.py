@@ -31,7 +31,7 @@ class Contact(Base):
     is_independent_recruiter = Column(Boolean, default=False, nullable=False)
 
     notes = Column(Text, nullable=True)
-    company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"), nullable=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Multi-tenancy
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -42,14 +42,15 @@ class Contact(Base):
     # Relationships
     owner = relationship("User")
     company = relationship("Company", back_populates="contacts")
-    opportunity_contacts = relationship("OpportunityContact", back_populates="contact")
+    opportunity_contacts = relationship("OpportunityContact", back_populates="contact", passive_deletes=True)
     document_associations = relationship(
         "DocumentAssociation",
         primaryjoin=and_(
             foreign(DocumentAssociation.entity_id) == id,
             DocumentAssociation.entity_type == EntityType.CONTACT
         ),
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     def __repr__(self):
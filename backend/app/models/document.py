@@ -1,7 +1,7 @@
 """
 Document model - represents a file (resume, cover letter, etc.).
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -61,16 +61,22 @@ class Document(Base):
     is_external = Column(Boolean, nullable=False, default=False, server_default='false')  # True for external links
 
     # Multi-tenancy
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    # Quota check counts the local (non-external) documents of a user
+    __table_args__ = (
+        Index('ix_documents_owner_id_is_external', 'owner_id', 'is_external'),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="documents")
     associations = relationship(
         "DocumentAssociation",
         back_populates="document",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     def __repr__(self):
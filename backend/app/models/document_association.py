@@ -20,8 +20,10 @@ class DocumentAssociation(Base):
     __tablename__ = "document_associations"
 
     id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     entity_type = Column(Enum(EntityType), nullable=False)
+    # Polymorphic reference (no FK): rows are removed by the AFTER DELETE triggers
+    # installed on each entity table (see migration c7d2e9a41b05)
     entity_id = Column(Integer, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -29,6 +31,8 @@ class DocumentAssociation(Base):
 
     __table_args__ = (
         Index('ix_document_associations_entity', 'entity_type', 'entity_id'),
+        # A document is linked at most once to an entity (target of ON CONFLICT)
+        Index('uq_document_associations_document_entity', 'document_id', 'entity_type', 'entity_id', unique=True),
     )
 
     def __repr__(self):
@@ -47,7 +47,7 @@ class Opportunity(Base):
     id = Column(Integer, primary_key=True, index=True)
     job_title = Column(String(255), nullable=False)
     application_type = Column(Enum(ApplicationType), nullable=False)
-    company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"), nullable=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"), nullable=True, index=True)
     position_type = Column(String(100), nullable=True)  # backend, frontend, devops, etc.
     contract_type = Column(Enum(ContractType), nullable=True)
     location = Column(String(255), nullable=True)
@@ -82,16 +82,17 @@ class Opportunity(Base):
     # Relationships
     owner = relationship("User")
     company = relationship("Company", back_populates="opportunities")
-    applications = relationship("Application", back_populates="opportunity", cascade="all, delete-orphan")
-    opportunity_contacts = relationship("OpportunityContact", back_populates="opportunity", cascade="all, delete-orphan")
-    opportunity_products = relationship("OpportunityProduct", back_populates="opportunity", cascade="all, delete-orphan")
+    applications = relationship("Application", back_populates="opportunity", cascade="all, delete-orphan", passive_deletes=True)
+    opportunity_contacts = relationship("OpportunityContact", back_populates="opportunity", cascade="all, delete-orphan", passive_deletes=True)
+    opportunity_products = relationship("OpportunityProduct", back_populates="opportunity", cascade="all, delete-orphan", passive_deletes=True)
     document_associations = relationship(
         "DocumentAssociation",
         primaryjoin=and_(
             foreign(DocumentAssociation.entity_id) == id,
             DocumentAssociation.entity_type == EntityType.OPPORTUNITY
         ),
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     def __repr__(self):
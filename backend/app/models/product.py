@@ -21,7 +21,7 @@ class Product(Base):
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
     website = Column(String(255), nullable=True)
     technologies_used = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -29,7 +29,7 @@ class Product(Base):
     # Relationships
     owner = relationship("User", back_populates="products")
     company = relationship("Company", back_populates="products")
-    opportunity_products = relationship("OpportunityProduct", back_populates="product")
+    opportunity_products = relationship("OpportunityProduct", back_populates="product", passive_deletes=True)
 
     def __repr__(self):
         return f"<Product(id={self.id}, name='{self.name}', owner_id={self.owner_id})>"
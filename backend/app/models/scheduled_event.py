@@ -1,7 +1,7 @@
 """
 ScheduledEvent model - represents a scheduled event (interview, meeting, call).
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -59,14 +59,19 @@ class ScheduledEvent(Base):
     notes = Column(Text, nullable=True)
 
     # Multi-tenancy
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
+    # Agenda queries: events of a user by date
+    __table_args__ = (
+        Index('ix_scheduled_events_owner_id_scheduled_date', 'owner_id', 'scheduled_date'),
+    )
+
     # Relationships
     owner = relationship("User")
-    actions = relationship("Action", back_populates="scheduled_event")
+    actions = relationship("Action", back_populates="scheduled_event", passive_deletes=True)
 
     def __repr__(self):
         return f"<ScheduledEvent(id={self.id}, title='{self.title}', date={self.scheduled_date}, status={self.status}, owner_id={self.owner_id})>"
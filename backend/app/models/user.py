@@ -1,7 +1,7 @@
 """
 User model - represents a system user.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -23,19 +23,24 @@ class User(Base):
     last_name = Column(String(100), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
 
+    # Incremented by database triggers on every write to the user's data (used for ETags)
+    data_version = Column(BigInteger, server_default="0", nullable=False)
+    # Set by the same triggers: reads stay on the primary shortly after a write (replica routing)
+    last_write_at = Column(DateTime(timezone=True), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
     # Relationships
-    opportunities = relationship("Opportunity", back_populates="owner", cascade="all, delete-orphan")
-    companies = relationship("Company", back_populates="owner", cascade="all, delete-orphan")
-    contacts = relationship("Contact", back_populates="owner", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="owner", cascade="all, delete-orphan")
-    scheduled_events = relationship("ScheduledEvent", back_populates="owner", cascade="all, delete-orphan")
-    actions = relationship("Action", back_populates="owner", cascade="all, delete-orphan")
-    applications = relationship("Application", back_populates="owner", cascade="all, delete-orphan")
-    products = relationship("Product", back_populates="owner", cascade="all, delete-orphan")
-    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+    opportunities = relationship("Opportunity", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    companies = relationship("Company", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    contacts = relationship("Contact", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    documents = relationship("Document", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    scheduled_events = relationship("ScheduledEvent", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    actions = relationship("Action", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    applications = relationship("Application", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    products = relationship("Product", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}')>"
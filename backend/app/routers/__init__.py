@@ -14,6 +14,8 @@ from app.routers.opportunity_products import router as opportunity_products_rout
 from app.routers.document_associations import router as document_associations_router
 from app.routers.auth import router as auth_router
 from app.routers.users import router as users_router
+from app.routers.sync import router as sync_router
+from app.routers.events import router as events_router
 
 __all__ = [
     "companies_router",
@@ -29,4 +31,6 @@ __all__ = [
     "document_associations_router",
     "auth_router",
     "users_router",
+    "sync_router",
+    "events_router",
 ]
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.action import Action as ActionModel
 from app.schemas.action import Action, ActionCreate, ActionUpdate
@@ -13,9 +14,17 @@ from app.utils.validators.ownership_validators import (
     validate_application_exists_and_owned,
     validate_scheduled_event_exists_and_owned
 )
-from app.utils.db import get_owned_entity_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    ensure_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 
-router = APIRouter(prefix="/actions", tags=["actions"])
+router = APIRouter(prefix="/actions", tags=["actions"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[Action])
@@ -24,6 +33,7 @@ def get_actions(
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     application_id: Optional[int] = Query(None, description="Filter by application ID"),
     completed: Optional[bool] = Query(None, description="Filter by completion status (true=completed_date IS NOT NULL)"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,type,completed_date)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -34,10 +44,15 @@ def get_actions(
     - **limit**: Maximum number of records to return (max 100)
     - **application_id**: Optional filter by application ID
     - **completed**: Filter by completion (true=completed_date NOT NULL, false=NULL)
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
     """
+    selected_fields = parse_fields_param(fields, Action)
+
     query = db.query(ActionModel).options(
-        joinedload(ActionModel.application),
-        joinedload(ActionModel.scheduled_event)
+        *fieldset_options(ActionModel, selected_fields, {
+            "application": joinedload(ActionModel.application),
+            "scheduled_event": joinedload(ActionModel.scheduled_event),
+        })
     ).filter(
         ActionModel.owner_id == current_user.id
     )
@@ -53,6 +68,9 @@ def get_actions(
             query = query.filter(ActionModel.completed_date.is_(None))
 
     actions = query.order_by(ActionModel.created_at.asc()).offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(actions, Action, selected_fields)
     return actions
 
 @router.get("/{action_id}", response_model=Action)
@@ -106,7 +124,6 @@ def create_action(
     db_action = ActionModel(**action_data)
     db.add(db_action)
     db.commit()
-    db.refresh(db_action)
     return db_action
 
 @router.put("/{action_id}", response_model=Action)
@@ -124,29 +141,27 @@ def update_action(
 
     Returns 404 if action doesn't exist or doesn't belong to the authenticated user.
     """
-    db_action = get_owned_entity_or_404(
-        db=db,
-        entity_model=ActionModel,
-        entity_id=action_id,
-        owner_id=current_user.id,
-        entity_name="Action"
-    )
-
     update_data = action_update.model_dump(exclude_unset=True)
 
+    # The action's own 404 first, then those of the referenced entities
+    if "application_id" in update_data or update_data.get("scheduled_event_id") is not None:
+        ensure_owned_entity_or_404(db, ActionModel, action_id, current_user.id, entity_name="Action")
+
     if "application_id" in update_data :
         validate_application_exists_and_owned(db, update_data["application_id"], current_user)
 
     if "scheduled_event_id" in update_data and update_data["scheduled_event_id"] is not None:
         validate_scheduled_event_exists_and_owned(db, update_data["scheduled_event_id"], current_user)
 
-    # Update fields (no ownership change allowed)
-    for field, value in update_data.items():
-        if field != 'owner_id':  # Protection
-            setattr(db_action, field, value)
-
+    db_action = update_owned_entity_or_404(
+        db=db,
+        entity_model=ActionModel,
+        entity_id=action_id,
+        owner_id=current_user.id,
+        values=update_data,
+        entity_name="Action"
+    )
     db.commit()
-    db.refresh(db_action)
     return db_action
 
 @router.delete("/{action_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -162,14 +177,12 @@ def delete_action(
 
     Returns 404 if action doesn't exist or doesn't belong to the authenticated user.
     """
-    db_action = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=ActionModel,
         entity_id=action_id,
         owner_id=current_user.id,
         entity_name="Action"
     )
-
-    db.delete(db_action)
     db.commit()
     return
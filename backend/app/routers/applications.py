@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.application import Application as ApplicationModel
 from app.models.application import ApplicationStatus
@@ -20,14 +21,26 @@ from app.utils.validators.ownership_validators import (
     validate_opportunity_exists_and_owned,
     validate_company_exists_and_owned
 )
-from app.utils.db import get_owned_entity_or_404
+from app.core.serialization import list_json_response
+from app.utils.db import (
+    get_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_response,
+    parse_expand_param,
+    select_list_rows,
+)
+from app.schemas.document import Document
 from app.utils.documents.helpers import (
     create_or_update_document_association_or_404,
-    remove_document_association
+    remove_document_association,
+    get_entity_documents_or_404
 )
 
 
-router = APIRouter(prefix="/applications", tags=["applications"])
+router = APIRouter(prefix="/applications", tags=["applications"], dependencies=[Depends(conditional_get)])
+
+# Relationship paths clients can request with ?expand= on list endpoints
+APPLICATION_EXPANSIONS = ("opportunity", "opportunity.company", "resume_used", "cover_letter")
 
 @router.get("/", response_model=List[Application])
 def get_applications(
@@ -36,6 +49,8 @@ def get_applications(
     opportunity_id: Optional[int] = Query(None, description="Filter by opportunity ID"),
     status: Optional[ApplicationStatus] = Query(None, description="Filter by application status"),
     is_archived: Optional[bool] = Query(None, description="Filter by archive status"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,status,application_date)"),
+    expand: Optional[str] = Query(None, description=f"Comma-separated relationships to include: {', '.join(APPLICATION_EXPANSIONS)}"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -47,27 +62,36 @@ def get_applications(
     - **opportunity_id**: Optional filter by opportunity ID
     - **status**: Optional filter by status (pending, rejected, accepted, etc.)
     - **is_archived**: Optional filter by archive status
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
+    - **expand**: Optional relationships to embed (opportunity, opportunity.company, resume_used, cover_letter).
+      Non-expanded relationships are returned as null; use the *_id fields instead.
 
     Returns only applications belonging to the authenticated user (owner_id direct).
     """
-    query = db.query(ApplicationModel).options(
-        joinedload(ApplicationModel.opportunity).joinedload(OpportunityModel.company),
-        joinedload(ApplicationModel.resume_used),
-        joinedload(ApplicationModel.cover_letter)
-    ).filter(ApplicationModel.owner_id == current_user.id)
+    selected_fields = parse_fields_param(fields, Application)
+    expanded = parse_expand_param(expand, APPLICATION_EXPANSIONS)
+
+    criteria = [ApplicationModel.owner_id == current_user.id]
 
     if opportunity_id is not None:
         validate_opportunity_exists_and_owned(db, opportunity_id, current_user)
-        query = query.filter(ApplicationModel.opportunity_id == opportunity_id)
+        criteria.append(ApplicationModel.opportunity_id == opportunity_id)
 
     if status is not None:
-        query = query.filter(ApplicationModel.status == status)
+        criteria.append(ApplicationModel.status == status)
 
     if is_archived is not None:
-        query = query.filter(ApplicationModel.is_archived == is_archived)
+        criteria.append(ApplicationModel.is_archived == is_archived)
 
-    applications = query.offset(skip).limit(limit).all()
-    return applications
+    # Hot path: plain rows (expanded relationships joined in the same query), no ORM instances
+    applications = select_list_rows(
+        db, ApplicationModel, criteria,
+        field_names=selected_fields, nested=expanded, skip=skip, limit=limit
+    )
+
+    if selected_fields is not None:
+        return fieldset_response(applications, Application, selected_fields)
+    return list_json_response(applications, Application)
 
 @router.get("/{application_id}", response_model=Application)
 def get_application(
@@ -96,6 +120,34 @@ def get_application(
     )
     return application
 
+@router.get("/{application_id}/documents", response_model=List[Document])
+def get_application_documents(
+    application_id: int,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve the documents associated with a specific application.
+
+    - **application_id**: The ID of the application
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 100)
+
+    Documents are returned in association order (oldest first).
+    Returns 404 if application doesn't exist or doesn't belong to the authenticated user.
+    """
+    return get_entity_documents_or_404(
+        db=db,
+        entity_type="application",
+        entity_id=application_id,
+        current_user=current_user,
+        skip=skip,
+        limit=limit
+    )
+
+
 @router.post("/", response_model=Application, status_code=status.HTTP_201_CREATED)
 def create_application(
     application: ApplicationCreate,
@@ -158,7 +210,6 @@ def create_application(
         )
 
     db.commit()
-    db.refresh(db_application)
     return db_application
 
 @router.post("/with-opportunity", response_model=Application, status_code=status.HTTP_201_CREATED)
@@ -240,7 +291,6 @@ def create_application_with_opportunity(
 
         # Commit both in a single transaction
         db.commit()
-        db.refresh(db_application)
 
         return db_application
 
@@ -19,6 +19,7 @@ from app.core.security import (
 )
 from app.core.cookies import CookieHandler
 from app.core.dependencies import get_current_user
+from app.core.metrics import TOKEN_REFRESHES
 from app.models.user import User
 from app.models.refresh_token import RefreshToken
 from app.schemas.user import UserCreate, User as UserSchema
@@ -56,7 +57,6 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
 
     return db_user
 
@@ -126,6 +126,7 @@ def refresh_token(
     Performs token rotation: invalidates old refresh token and issues a new one.
     """
     if not refreshToken:
+        TOKEN_REFRESHES.labels("rejected").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token missing",
@@ -134,6 +135,7 @@ def refresh_token(
     # 1. Validate JWT structure and signature
     payload = decode_refresh_token(refreshToken)
     if not payload:
+        TOKEN_REFRESHES.labels("rejected").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
@@ -146,6 +148,7 @@ def refresh_token(
     if not stored_token:
         # Token valid cryptographically but not in DB (maybe deleted/expired cleanly)
         CookieHandler.delete_refresh_cookie(response)
+        TOKEN_REFRESHES.labels("rejected").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token not found or expired",
@@ -154,6 +157,7 @@ def refresh_token(
     if stored_token.is_blacklisted:
         # Security Alert: Reuse detection could be implemented here
         CookieHandler.delete_refresh_cookie(response)
+        TOKEN_REFRESHES.labels("rejected").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token revoked",
@@ -162,6 +166,7 @@ def refresh_token(
     # 3. Get User
     user = db.query(User).filter(User.id == stored_token.user_id).first()
     if not user or not user.is_active:
+        TOKEN_REFRESHES.labels("rejected").inc()
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive or not found")
 
     # 4. Token Rotation Logic
@@ -194,6 +199,7 @@ def refresh_token(
 
     # 5. Create NEW Access Token
     access_token = create_access_token(subject=user.email)
+    TOKEN_REFRESHES.labels("success").inc()
 
     return {"access_token": access_token, "token_type": "bearer"}
 
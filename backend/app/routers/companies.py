@@ -1,24 +1,36 @@
 """
 Company routes - CRUD operations for companies.
 """
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.company import Company as CompanyModel
 from app.schemas.company import Company, CompanyCreate, CompanyUpdate
-from app.utils.db import get_owned_entity_or_404
+from app.schemas.document import Document
+from app.utils.documents.helpers import get_entity_documents_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 
 
-router = APIRouter(prefix="/companies", tags=["companies"])
+router = APIRouter(prefix="/companies", tags=["companies"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=list[Company])
 def get_companies(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,name,industry)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -27,12 +39,20 @@ def get_companies(
 
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (max 100)
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only companies belonging to the authenticated user.
     """
-    companies = db.query(CompanyModel).filter(
+    selected_fields = parse_fields_param(fields, Company)
+
+    companies = db.query(CompanyModel).options(
+        *fieldset_options(CompanyModel, selected_fields)
+    ).filter(
         CompanyModel.owner_id == current_user.id
     ).offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(companies, Company, selected_fields)
     return companies
 
 
@@ -59,6 +79,34 @@ def get_company(
     return company
 
 
+@router.get("/{company_id}/documents", response_model=List[Document])
+def get_company_documents(
+    company_id: int,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve the documents associated with a specific company.
+
+    - **company_id**: The ID of the company
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 100)
+
+    Documents are returned in association order (oldest first).
+    Returns 404 if company doesn't exist or doesn't belong to the authenticated user.
+    """
+    return get_entity_documents_or_404(
+        db=db,
+        entity_type="company",
+        entity_id=company_id,
+        current_user=current_user,
+        skip=skip,
+        limit=limit
+    )
+
+
 @router.post("/", response_model=Company, status_code=status.HTTP_201_CREATED)
 def create_company(
     company: CompanyCreate,
@@ -86,7 +134,6 @@ def create_company(
         db_company = CompanyModel(**company_data)
         db.add(db_company)
         db.commit()
-        db.refresh(db_company)
         return db_company
     except IntegrityError as e:
         db.rollback()
@@ -119,23 +166,19 @@ def update_company(
 
     Returns 404 if company doesn't exist or doesn't belong to the authenticated user.
     """
-    db_company = get_owned_entity_or_404(
-        db=db,
-        entity_model=CompanyModel,
-        entity_id=company_id,
-        owner_id=current_user.id,
-        entity_name="Company"
-    )
-
     # Update only provided fields
     update_data = company_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_company, field, value)
 
     try:
+        db_company = update_owned_entity_or_404(
+            db=db,
+            entity_model=CompanyModel,
+            entity_id=company_id,
+            owner_id=current_user.id,
+            values=update_data,
+            entity_name="Company"
+        )
         db.commit()
-        db.refresh(db_company)
         return db_company
     except IntegrityError as e:
         db.rollback()
@@ -170,14 +213,12 @@ def delete_company(
 
     Returns 404 if company doesn't exist or doesn't belong to the authenticated user.
     """
-    db_company = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=CompanyModel,
         entity_id=company_id,
         owner_id=current_user.id,
         entity_name="Company"
     )
-
-    db.delete(db_company)
     db.commit()
     return
@@ -6,13 +6,24 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.contact import Contact as ContactModel
 from app.schemas.contact import Contact, ContactCreate, ContactUpdate
+from app.schemas.document import Document
+from app.utils.documents.helpers import get_entity_documents_or_404
 from app.utils.validators.ownership_validators import validate_company_exists_and_owned
-from app.utils.db import get_owned_entity_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    ensure_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 
-router = APIRouter(prefix="/contacts", tags=["contacts"])
+router = APIRouter(prefix="/contacts", tags=["contacts"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[Contact])
@@ -21,6 +32,7 @@ def get_contacts(
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
     is_independent_recruiter: Optional[bool] = Query(None, description="Filter by independent recruiter status"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,first_name,last_name)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -31,10 +43,17 @@ def get_contacts(
     - **limit**: Maximum number of records to return (max 100)
     - **company_id**: Optional filter by company ID
     - **is_independent_recruiter**: Optional filter by independent recruiter status
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only contacts belonging to the authenticated user.
     """
-    query = db.query(ContactModel).options(joinedload(ContactModel.company)).filter(
+    selected_fields = parse_fields_param(fields, Contact)
+
+    query = db.query(ContactModel).options(
+        *fieldset_options(ContactModel, selected_fields, {
+            "company": joinedload(ContactModel.company),
+        })
+    ).filter(
         ContactModel.owner_id == current_user.id
     )
 
@@ -46,6 +65,9 @@ def get_contacts(
         query = query.filter(ContactModel.is_independent_recruiter == is_independent_recruiter)
 
     contacts = query.offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(contacts, Contact, selected_fields)
     return contacts
 
 
@@ -73,6 +95,34 @@ def get_contact(
     return contact
 
 
+@router.get("/{contact_id}/documents", response_model=List[Document])
+def get_contact_documents(
+    contact_id: int,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve the documents associated with a specific contact.
+
+    - **contact_id**: The ID of the contact
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 100)
+
+    Documents are returned in association order (oldest first).
+    Returns 404 if contact doesn't exist or doesn't belong to the authenticated user.
+    """
+    return get_entity_documents_or_404(
+        db=db,
+        entity_type="contact",
+        entity_id=contact_id,
+        current_user=current_user,
+        skip=skip,
+        limit=limit
+    )
+
+
 @router.post("/", response_model=Contact, status_code=status.HTTP_201_CREATED)
 def create_contact(
     contact: ContactCreate,
@@ -104,7 +154,6 @@ def create_contact(
     db_contact = ContactModel(**contact_data)
     db.add(db_contact)
     db.commit()
-    db.refresh(db_contact)
     return db_contact
 
 
@@ -123,26 +172,23 @@ def update_contact(
 
     Returns 404 if contact doesn't exist or doesn't belong to the authenticated user.
     """
-    db_contact = get_owned_entity_or_404(
-        db=db,
-        entity_model=ContactModel,
-        entity_id=contact_id,
-        owner_id=current_user.id,
-        entity_name="Contact"
-    )
-
     update_data = contact_update.model_dump(exclude_unset=True)
     if "company_id" in update_data and update_data["company_id"] is not None:
+        # The contact's own 404 first, then the referenced company's
+        ensure_owned_entity_or_404(db, ContactModel, contact_id, current_user.id, entity_name="Contact")
         validate_company_exists_and_owned(
             db, update_data["company_id"], current_user
         )
 
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_contact, field, value)
-
+    db_contact = update_owned_entity_or_404(
+        db=db,
+        entity_model=ContactModel,
+        entity_id=contact_id,
+        owner_id=current_user.id,
+        values=update_data,
+        entity_name="Contact"
+    )
     db.commit()
-    db.refresh(db_contact)
     return db_contact
 
 
@@ -159,14 +205,12 @@ def delete_contact(
 
     Returns 404 if contact doesn't exist or doesn't belong to the authenticated user.
     """
-    db_contact = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=ContactModel,
         entity_id=contact_id,
         owner_id=current_user.id,
         entity_name="Contact"
     )
-
-    db.delete(db_contact)
     db.commit()
     return
@@ -3,84 +3,30 @@ DocumentAssociation routes - CRUD operations for polymorphic document associatio
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.document import Document
 from app.models.document_association import DocumentAssociation as DocumentAssociationModel
 from app.models.document_association import EntityType
-from app.models.application import Application
-from app.models.opportunity import Opportunity
-from app.models.company import Company
-from app.models.contact import Contact
 from app.schemas.document_association import (
     DocumentAssociation,
-    DocumentAssociationCreate
+    DocumentAssociationCreate,
+    DocumentAssociationCountsRequest,
+    DocumentSummary,
+    EntityDocumentCount,
 )
+from app.utils.db import load_polymorphic_entities
 from app.utils.validators.ownership_validators import (
     validate_document_exists_and_owned,
     validate_entity_exists_and_owned
 )
 
-router = APIRouter(prefix="/document-associations", tags=["document_associations"])
-
-def populate_polymorphic_entities(db: Session, associations: List[DocumentAssociationModel]):
-    """
-    Helper function to manually fetch and attach polymorphic entities to associations.
-    This avoids N+1 queries by batching fetches by entity type.
-    """
-    if not associations:
-        return
-
-    # 1. Group IDs by type
-    ids_by_type = {
-        EntityType.APPLICATION: set(),
-        EntityType.OPPORTUNITY: set(),
-        EntityType.COMPANY: set(),
-        EntityType.CONTACT: set()
-    }
-
-    for assoc in associations:
-        if assoc.entity_type in ids_by_type:
-            ids_by_type[assoc.entity_type].add(assoc.entity_id)
-
-    # 2. Batch fetch entities
-    fetched_entities = {} # Key: (type, id), Value: Model Instance
-
-    # Applications
-    if ids_by_type[EntityType.APPLICATION]:
-        apps = db.query(Application).filter(Application.id.in_(ids_by_type[EntityType.APPLICATION])).all()
-        for app in apps:
-            fetched_entities[(EntityType.APPLICATION, app.id)] = app
-
-    # Opportunities
-    if ids_by_type[EntityType.OPPORTUNITY]:
-        opps = db.query(Opportunity).filter(Opportunity.id.in_(ids_by_type[EntityType.OPPORTUNITY])).all()
-        for opp in opps:
-            fetched_entities[(EntityType.OPPORTUNITY, opp.id)] = opp
-
-    # Companies
-    if ids_by_type[EntityType.COMPANY]:
-        comps = db.query(Company).filter(Company.id.in_(ids_by_type[EntityType.COMPANY])).all()
-        for comp in comps:
-            fetched_entities[(EntityType.COMPANY, comp.id)] = comp
-
-    # Contacts
-    if ids_by_type[EntityType.CONTACT]:
-        conts = db.query(Contact).filter(Contact.id.in_(ids_by_type[EntityType.CONTACT])).all()
-        for cont in conts:
-            fetched_entities[(EntityType.CONTACT, cont.id)] = cont
-
-    # 3. Attach entities to association objects
-    # We set a temporary attribute on the model instance that Pydantic will read
-    for assoc in associations:
-        key = (assoc.entity_type, assoc.entity_id)
-        if key in fetched_entities:
-            assoc.entity = fetched_entities[key]
-        else:
-            assoc.entity = None
-
+router = APIRouter(prefix="/document-associations", tags=["document_associations"], dependencies=[Depends(conditional_get)])
 
 @router.get("/", response_model=List[DocumentAssociation])
 def get_document_associations(
@@ -132,7 +78,7 @@ def get_document_associations(
     associations = query.offset(skip).limit(limit).all()
 
     # Manually populate the polymorphic 'entity' field
-    populate_polymorphic_entities(db, associations)
+    load_polymorphic_entities(db, associations, current_user.id)
 
     return associations
 
@@ -164,7 +110,7 @@ def get_document_association(
         )
 
     # Manually populate the polymorphic 'entity' field
-    populate_polymorphic_entities(db, [association])
+    load_polymorphic_entities(db, [association], current_user.id)
 
     return association
 
@@ -183,6 +129,7 @@ def create_document_association(
     - **entity_id**: ID of the entity (required)
 
     Both document and entity must belong to the authenticated user.
+    A document can only be associated once with a given entity (400 otherwise).
     The association will be timestamped automatically.
     """
     # Validate document ownership
@@ -193,21 +140,80 @@ def create_document_association(
         db, association.entity_type, association.entity_id, current_user
     )
 
-    db_association = DocumentAssociationModel(**association.model_dump())
-    db.add(db_association)
-    db.commit()
-    db.refresh(db_association)
+    try:
+        db_association = DocumentAssociationModel(**association.model_dump())
+        db.add(db_association)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        # Unique (document_id, entity_type, entity_id): already associated
+        if hasattr(e.orig, 'pgcode') and e.orig.pgcode == '23505':
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Document {association.document_id} is already associated with this {association.entity_type.value}."
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Database integrity error."
+        )
 
     # Reload with document and entity for consistency
     db_association = db.query(DocumentAssociationModel).options(
         joinedload(DocumentAssociationModel.document)
     ).filter(DocumentAssociationModel.id == db_association.id).first()
 
-    populate_polymorphic_entities(db, [db_association])
+    load_polymorphic_entities(db, [db_association], current_user.id)
 
     return db_association
 
 
+@router.post("/counts", response_model=List[EntityDocumentCount])
+def count_document_associations(
+    request: DocumentAssociationCountsRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Count the documents associated with many entities in one call.
+
+    - **entities**: List of `{entity_type, entity_id}` (max 100)
+
+    Returns one item per distinct requested entity, in request order, with the
+    number of associated documents and their summaries (oldest association first).
+    Entities without documents, unknown or not owned get a count of 0.
+
+    All entities are read in a single query through the (entity_type, entity_id) index.
+    """
+    requested = list(dict.fromkeys((e.entity_type, e.entity_id) for e in request.entities))
+
+    rows = db.query(
+        DocumentAssociationModel.entity_type,
+        DocumentAssociationModel.entity_id,
+        Document
+    ).join(Document).options(
+        load_only(Document.id, Document.name, Document.type, Document.format, Document.is_external)
+    ).filter(
+        tuple_(DocumentAssociationModel.entity_type, DocumentAssociationModel.entity_id).in_(requested),
+        Document.owner_id == current_user.id
+    ).order_by(
+        DocumentAssociationModel.created_at, DocumentAssociationModel.id
+    ).all()
+
+    documents_by_entity = {key: [] for key in requested}
+    for entity_type, entity_id, document in rows:
+        documents_by_entity[(entity_type, entity_id)].append(document)
+
+    return [
+        EntityDocumentCount(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            count=len(documents),
+            documents=[DocumentSummary.model_validate(document) for document in documents]
+        )
+        for (entity_type, entity_id), documents in documents_by_entity.items()
+    ]
+
+
 @router.delete("/{association_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_document_association(
     association_id: int,
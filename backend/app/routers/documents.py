@@ -1,16 +1,24 @@
 """
 Document routes - CRUD operations for documents.
 """
-from typing import List
+import aiofiles.os
+from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, status, UploadFile, File, Form, HTTPException
 from fastapi.responses import FileResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
+from app.core.metrics import DOCUMENT_TRANSFER_BYTES
 from app.models.user import User
 from app.models.document import Document as DocumentModel, DocumentFormat
 from app.schemas.document import Document, DocumentCreate, DocumentUpdate
-from app.utils.db import get_owned_entity_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 from app.utils.validators.document_validators import (
     check_user_quota,
     validate_document_storage_update,
@@ -23,13 +31,14 @@ from app.services.storage import get_storage_backend
 from app.config import settings
 
 
-router = APIRouter(prefix="/documents", tags=["documents"])
+router = APIRouter(prefix="/documents", tags=["documents"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[Document])
 def get_documents(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,name,type)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -38,13 +47,21 @@ def get_documents(
 
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (max 100)
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only documents belonging to the authenticated user.
     """
-    query = db.query(DocumentModel).filter(
+    selected_fields = parse_fields_param(fields, Document)
+
+    query = db.query(DocumentModel).options(
+        *fieldset_options(DocumentModel, selected_fields)
+    ).filter(
         DocumentModel.owner_id == current_user.id
     )
     documents = query.offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(documents, Document, selected_fields)
     return documents
 
 
@@ -120,7 +137,6 @@ def create_document(
     db_document = DocumentModel(**document_data)
     db.add(db_document)
     db.commit()
-    db.refresh(db_document)
     return db_document
 
 
@@ -194,7 +210,6 @@ async def upload_document(
 
     db.add(db_document)
     db.commit()
-    db.refresh(db_document)
 
     return db_document
 
@@ -256,11 +271,16 @@ async def download_document(
     format_str = document.format.value
     media_type = settings.EXTENSION_TO_MIME.get(format_str, "application/octet-stream")
 
+    # Stat once here (reused by FileResponse) to account the transferred bytes
+    stat_result = await aiofiles.os.stat(document.path)
+    DOCUMENT_TRANSFER_BYTES.labels("download").inc(stat_result.st_size)
+
     # Return file with appropriate headers
     return FileResponse(
         path=document.path,
         media_type=media_type,
         filename=document.name,
+        stat_result=stat_result,
         headers={
             "Content-Disposition": f'inline; filename="{document.name}"'
         }
@@ -0,0 +1,63 @@
+"""
+Event routes - server-sent events stream of the user's entity changes.
+"""
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.core.dependencies import get_current_user
+from app.core.events import change_broker, RESYNC_EVENT
+from app.models.user import User
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Comment line sent when idle, keeps proxies from closing the connection
+HEARTBEAT_SECONDS = 15
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "Stream of change events"}},
+)
+async def stream_changes(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream change notifications of the current user's entities (Server-Sent Events).
+
+    Events:
+    - **change**: `{"entity_type": "applications", "entity_id": 12, "operation": "update"}`,
+      sent once the write is committed (operation: insert, update or delete)
+    - **resync**: notifications may have been lost, call /sync with the last token
+
+    Authentication uses the usual Bearer header, so clients consume the stream
+    with fetch() rather than EventSource.
+    """
+    user_id = current_user.id
+    await change_broker.ensure_listening()
+
+    async def event_stream():
+        async with change_broker.subscribe(user_id) as queue:
+            yield "retry: 5000\n\n"
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Re-open the LISTEN connection if it was lost meanwhile
+                    await change_broker.ensure_listening()
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event is RESYNC_EVENT:
+                    yield "event: resync\ndata: {}\n\n"
+                else:
+                    yield f"event: change\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
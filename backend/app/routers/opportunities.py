@@ -6,14 +6,26 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.opportunity import Opportunity as OpportunityModel
 from app.models.opportunity import ApplicationType, ContractType
 from app.schemas.opportunity import Opportunity, OpportunityCreate, OpportunityUpdate
+from app.schemas.document import Document
+from app.utils.documents.helpers import get_entity_documents_or_404
 from app.utils.validators.ownership_validators import validate_company_exists_and_owned
-from app.utils.db import get_owned_entity_or_404
-
-router = APIRouter(prefix="/opportunities", tags=["opportunities"])
+from app.core.serialization import list_json_response
+from app.utils.db import (
+    get_owned_entity_or_404,
+    ensure_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_response,
+    select_list_rows,
+)
+
+router = APIRouter(prefix="/opportunities", tags=["opportunities"], dependencies=[Depends(conditional_get)])
 
 @router.get("/", response_model=List[Opportunity])
 def get_opportunities(
@@ -22,6 +34,7 @@ def get_opportunities(
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
     application_type: Optional[ApplicationType] = Query(None, description="Filter by application type"),
     contract_type: Optional[ContractType] = Query(None, description="Filter by contract type"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,job_title,company_id)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -33,25 +46,33 @@ def get_opportunities(
     - **company_id**: Optional filter by company ID
     - **application_type**: Optional filter by type (job_posting, spontaneous, etc.)
     - **contract_type**: Optional filter by contract (permanent, fixed_term, etc.)
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only opportunities belonging to the authenticated user.
     """
-    query = db.query(OpportunityModel).options(joinedload(OpportunityModel.company)).filter(
-        OpportunityModel.owner_id == current_user.id
-    )
+    selected_fields = parse_fields_param(fields, Opportunity)
+
+    criteria = [OpportunityModel.owner_id == current_user.id]
 
     if company_id is not None:
         validate_company_exists_and_owned(db, company_id, current_user)
-        query = query.filter(OpportunityModel.company_id == company_id)
+        criteria.append(OpportunityModel.company_id == company_id)
 
     if application_type is not None:
-        query = query.filter(OpportunityModel.application_type == application_type)
+        criteria.append(OpportunityModel.application_type == application_type)
 
     if contract_type is not None:
-        query = query.filter(OpportunityModel.contract_type == contract_type)
+        criteria.append(OpportunityModel.contract_type == contract_type)
+
+    # Hot path: plain rows (company joined in the same query), no ORM instances
+    opportunities = select_list_rows(
+        db, OpportunityModel, criteria,
+        field_names=selected_fields, nested=("company",), skip=skip, limit=limit
+    )
 
-    opportunities = query.offset(skip).limit(limit).all()
-    return opportunities
+    if selected_fields is not None:
+        return fieldset_response(opportunities, Opportunity, selected_fields)
+    return list_json_response(opportunities, Opportunity)
 
 @router.get("/{opportunity_id}", response_model=Opportunity)
 def get_opportunity(
@@ -76,6 +97,34 @@ def get_opportunity(
     )
     return opportunity
 
+@router.get("/{opportunity_id}/documents", response_model=List[Document])
+def get_opportunity_documents(
+    opportunity_id: int,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve the documents associated with a specific opportunity.
+
+    - **opportunity_id**: The ID of the opportunity
+    - **skip**: Number of records to skip (for pagination)
+    - **limit**: Maximum number of records to return (max 100)
+
+    Documents are returned in association order (oldest first).
+    Returns 404 if opportunity doesn't exist or doesn't belong to the authenticated user.
+    """
+    return get_entity_documents_or_404(
+        db=db,
+        entity_type="opportunity",
+        entity_id=opportunity_id,
+        current_user=current_user,
+        skip=skip,
+        limit=limit
+    )
+
+
 @router.post("/", response_model=Opportunity, status_code=status.HTTP_201_CREATED)
 def create_opportunity(
     opportunity: OpportunityCreate,
@@ -103,7 +152,6 @@ def create_opportunity(
     db_opportunity = OpportunityModel(**opportunity_data)
     db.add(db_opportunity)
     db.commit()
-    db.refresh(db_opportunity)
     return db_opportunity
 
 @router.put("/{opportunity_id}", response_model=Opportunity)
@@ -121,26 +169,23 @@ def update_opportunity(
 
     Returns 404 if opportunity doesn't exist or doesn't belong to the authenticated user.
     """
-    db_opportunity = get_owned_entity_or_404(
-        db=db,
-        entity_model=OpportunityModel,
-        entity_id=opportunity_id,
-        owner_id=current_user.id,
-        entity_name="Opportunity"
-    )
-
     update_data = opportunity_update.model_dump(exclude_unset=True)
     if "company_id" in update_data and update_data["company_id"] is not None:
+        # The opportunity's own 404 first, then the referenced company's
+        ensure_owned_entity_or_404(db, OpportunityModel, opportunity_id, current_user.id, entity_name="Opportunity")
         validate_company_exists_and_owned(
             db, update_data["company_id"], current_user
         )
 
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_opportunity, field, value)
-
+    db_opportunity = update_owned_entity_or_404(
+        db=db,
+        entity_model=OpportunityModel,
+        entity_id=opportunity_id,
+        owner_id=current_user.id,
+        values=update_data,
+        entity_name="Opportunity"
+    )
     db.commit()
-    db.refresh(db_opportunity)
     return db_opportunity
 
 @router.delete("/{opportunity_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -156,14 +201,12 @@ def delete_opportunity(
 
     Returns 404 if opportunity doesn't exist or doesn't belong to the authenticated user.
     """
-    db_opportunity = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=OpportunityModel,
         entity_id=opportunity_id,
         owner_id=current_user.id,
         entity_name="Opportunity"
     )
-
-    db.delete(db_opportunity)
     db.commit()
     return
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.opportunity import Opportunity
 from app.models.opportunity_contact import OpportunityContact as OpportunityContactModel
@@ -14,12 +15,13 @@ from app.schemas.opportunity_contact import (
     OpportunityContactCreate,
     OpportunityContactUpdate
 )
+from app.utils.db import JoinSpec, update_owned_entity_or_404, delete_owned_entity_or_404
 from app.utils.validators.ownership_validators import (
     validate_opportunity_exists_and_owned,
     validate_contact_exists_and_owned
 )
 
-router = APIRouter(prefix="/opportunity-contacts", tags=["opportunity_contacts"])
+router = APIRouter(prefix="/opportunity-contacts", tags=["opportunity_contacts"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[OpportunityContact])
@@ -125,7 +127,6 @@ def create_opportunity_contact(
     db_association = OpportunityContactModel(**association.model_dump())
     db.add(db_association)
     db.commit()
-    db.refresh(db_association)
     return db_association
 
 
@@ -145,28 +146,19 @@ def update_opportunity_contact(
 
     Returns 404 if association doesn't exist or doesn't belong to the authenticated user.
     """
-    db_association = db.query(OpportunityContactModel).join(
-        OpportunityContactModel.opportunity
-    ).filter(
-        OpportunityContactModel.id == association_id,
-        Opportunity.owner_id == current_user.id
-    ).first()
-
-    if not db_association:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="OpportunityContact association not found"
-        )
-
     update_data = association_update.model_dump(exclude_unset=True)
 
     # Update metadata fields only (FK are immutable)
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_association, field, value)
-
+    db_association = update_owned_entity_or_404(
+        db=db,
+        entity_model=OpportunityContactModel,
+        entity_id=association_id,
+        owner_id=current_user.id,
+        values=update_data,
+        entity_name="OpportunityContact association",
+        requires_joins=[JoinSpec(model=Opportunity, owner_field='owner_id')]
+    )
     db.commit()
-    db.refresh(db_association)
     return db_association
 
 
@@ -183,19 +175,13 @@ def delete_opportunity_contact(
 
     Returns 404 if association doesn't exist or doesn't belong to the authenticated user.
     """
-    db_association = db.query(OpportunityContactModel).join(
-        OpportunityContactModel.opportunity
-    ).filter(
-        OpportunityContactModel.id == association_id,
-        Opportunity.owner_id == current_user.id
-    ).first()
-
-    if not db_association:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="OpportunityContact association not found"
-        )
-
-    db.delete(db_association)
+    delete_owned_entity_or_404(
+        db=db,
+        entity_model=OpportunityContactModel,
+        entity_id=association_id,
+        owner_id=current_user.id,
+        entity_name="OpportunityContact association",
+        requires_joins=[JoinSpec(model=Opportunity, owner_field='owner_id')]
+    )
     db.commit()
     return
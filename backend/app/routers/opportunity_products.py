@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.opportunity import Opportunity
 from app.models.opportunity_product import OpportunityProduct as OpportunityProductModel
@@ -13,12 +14,13 @@ from app.schemas.opportunity_product import (
     OpportunityProduct,
     OpportunityProductCreate
 )
+from app.utils.db import JoinSpec, delete_owned_entity_or_404
 from app.utils.validators.ownership_validators import (
     validate_opportunity_exists_and_owned,
     validate_product_exists_and_owned
 )
 
-router = APIRouter(prefix="/opportunity-products", tags=["opportunity_products"])
+router = APIRouter(prefix="/opportunity-products", tags=["opportunity_products"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[OpportunityProduct])
@@ -115,7 +117,6 @@ def create_opportunity_product(
     db_association = OpportunityProductModel(**association.model_dump())
     db.add(db_association)
     db.commit()
-    db.refresh(db_association)
     return db_association
 
 
@@ -132,19 +133,13 @@ def delete_opportunity_product(
 
     Returns 404 if association doesn't exist or doesn't belong to the authenticated user.
     """
-    db_association = db.query(OpportunityProductModel).join(
-        OpportunityProductModel.opportunity
-    ).filter(
-        OpportunityProductModel.id == association_id,
-        Opportunity.owner_id == current_user.id
-    ).first()
-
-    if not db_association:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="OpportunityProduct association not found"
-        )
-
-    db.delete(db_association)
+    delete_owned_entity_or_404(
+        db=db,
+        entity_model=OpportunityProductModel,
+        entity_id=association_id,
+        owner_id=current_user.id,
+        entity_name="OpportunityProduct association",
+        requires_joins=[JoinSpec(model=Opportunity, owner_field='owner_id')]
+    )
     db.commit()
     return
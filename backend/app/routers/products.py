@@ -6,14 +6,23 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.product import Product as ProductModel
 from app.schemas.product import Product, ProductCreate, ProductUpdate
 from app.utils.validators.ownership_validators import validate_company_exists_and_owned
-from app.utils.db import get_owned_entity_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    ensure_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 
 
-router = APIRouter(prefix="/products", tags=["products"])
+router = APIRouter(prefix="/products", tags=["products"], dependencies=[Depends(conditional_get)])
 
 
 @router.get("/", response_model=List[Product])
@@ -21,6 +30,7 @@ def get_products(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,name,company_id)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -30,10 +40,17 @@ def get_products(
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (max 100)
     - **company_id**: Optional filter by company ID
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only products belonging to the authenticated user.
     """
-    query = db.query(ProductModel).options(joinedload(ProductModel.company)).filter(
+    selected_fields = parse_fields_param(fields, Product)
+
+    query = db.query(ProductModel).options(
+        *fieldset_options(ProductModel, selected_fields, {
+            "company": joinedload(ProductModel.company),
+        })
+    ).filter(
         ProductModel.owner_id == current_user.id
     )
 
@@ -42,6 +59,9 @@ def get_products(
         query = query.filter(ProductModel.company_id == company_id)
 
     products = query.offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(products, Product, selected_fields)
     return products
 
 
@@ -94,7 +114,6 @@ def create_product(
     db_product = ProductModel(**product_data)
     db.add(db_product)
     db.commit()
-    db.refresh(db_product)
     return db_product
 
 
@@ -113,26 +132,23 @@ def update_product(
 
     Returns 404 if product doesn't exist or doesn't belong to the authenticated user.
     """
-    db_product = get_owned_entity_or_404(
-        db=db,
-        entity_model=ProductModel,
-        entity_id=product_id,
-        owner_id=current_user.id,
-        entity_name="Product"
-    )
-
     update_data = product_update.model_dump(exclude_unset=True)
     if "company_id" in update_data and update_data["company_id"] is not None:
+        # The product's own 404 first, then the referenced company's
+        ensure_owned_entity_or_404(db, ProductModel, product_id, current_user.id, entity_name="Product")
         validate_company_exists_and_owned(
             db, update_data["company_id"], current_user
         )
 
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_product, field, value)
-
+    db_product = update_owned_entity_or_404(
+        db=db,
+        entity_model=ProductModel,
+        entity_id=product_id,
+        owner_id=current_user.id,
+        values=update_data,
+        entity_name="Product"
+    )
     db.commit()
-    db.refresh(db_product)
     return db_product
 
 
@@ -149,14 +165,12 @@ def delete_product(
 
     Returns 404 if product doesn't exist or doesn't belong to the authenticated user.
     """
-    db_product = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=ProductModel,
         entity_id=product_id,
         owner_id=current_user.id,
         entity_name="Product"
     )
-
-    db.delete(db_product)
     db.commit()
     return
@@ -6,19 +6,28 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
 from app.models.user import User
 from app.models.scheduled_event import ScheduledEvent as ScheduledEventModel
 from app.models.scheduled_event import EventStatus
 from app.schemas.scheduled_event import ScheduledEvent, ScheduledEventCreate, ScheduledEventUpdate
-from app.utils.db import get_owned_entity_or_404
+from app.utils.db import (
+    get_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+)
 
-router = APIRouter(prefix="/scheduled-events", tags=["scheduled_events"])
+router = APIRouter(prefix="/scheduled-events", tags=["scheduled_events"], dependencies=[Depends(conditional_get)])
 
 @router.get("/", response_model=List[ScheduledEvent])
 def get_scheduled_events(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     status: Optional[EventStatus] = Query(None, description="Filter by event status"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return (e.g. id,title,scheduled_date)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -28,10 +37,15 @@ def get_scheduled_events(
     - **skip**: Number of records to skip (for pagination)
     - **limit**: Maximum number of records to return (max 100)
     - **status**: Optional filter by event status (pending, confirmed, etc.)
+    - **fields**: Optional comma-separated fieldset (only these columns are loaded and returned)
 
     Returns only scheduled events belonging to the authenticated user.
     """
-    query = db.query(ScheduledEventModel).filter(
+    selected_fields = parse_fields_param(fields, ScheduledEvent)
+
+    query = db.query(ScheduledEventModel).options(
+        *fieldset_options(ScheduledEventModel, selected_fields)
+    ).filter(
         ScheduledEventModel.owner_id == current_user.id
     )
 
@@ -39,6 +53,9 @@ def get_scheduled_events(
         query = query.filter(ScheduledEventModel.status == status)
 
     events = query.offset(skip).limit(limit).all()
+
+    if selected_fields is not None:
+        return fieldset_response(events, ScheduledEvent, selected_fields)
     return events
 
 @router.get("/{event_id}", response_model=ScheduledEvent)
@@ -85,7 +102,6 @@ def create_scheduled_event(
     db_event = ScheduledEventModel(**event_data)
     db.add(db_event)
     db.commit()
-    db.refresh(db_event)
     return db_event
 
 @router.put("/{event_id}", response_model=ScheduledEvent)
@@ -103,22 +119,17 @@ def update_scheduled_event(
 
     Returns 404 if event doesn't exist or doesn't belong to the authenticated user.
     """
-    db_event = get_owned_entity_or_404(
+    update_data = event_update.model_dump(exclude_unset=True)
+
+    db_event = update_owned_entity_or_404(
         db=db,
         entity_model=ScheduledEventModel,
         entity_id=event_id,
         owner_id=current_user.id,
+        values=update_data,
         entity_name="ScheduledEvent"
     )
-
-    update_data = event_update.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        if field != 'owner_id':
-            setattr(db_event, field, value)
-
     db.commit()
-    db.refresh(db_event)
     return db_event
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -134,14 +145,12 @@ def delete_scheduled_event(
 
     Returns 404 if event doesn't exist or doesn't belong to the authenticated user.
     """
-    db_event = get_owned_entity_or_404(
+    delete_owned_entity_or_404(
         db=db,
         entity_model=ScheduledEventModel,
         entity_id=event_id,
         owner_id=current_user.id,
         entity_name="ScheduledEvent"
     )
-
-    db.delete(db_event)
     db.commit()
     return
@@ -0,0 +1,160 @@
+"""
+Sync routes - incremental "changes since" feed for offline clients.
+"""
+from typing import Any, Dict, List, Tuple, Type
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel, Field, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, noload
+from app.database import get_db
+from app.core.dependencies import get_current_user
+from app.core.conditional import conditional_get
+from app.models.user import User
+from app.models.change_log import ChangeLog
+from app.models import (
+    Action as ActionModel,
+    Application as ApplicationModel,
+    Company as CompanyModel,
+    Contact as ContactModel,
+    Document as DocumentModel,
+    DocumentAssociation as DocumentAssociationModel,
+    Opportunity as OpportunityModel,
+    OpportunityContact as OpportunityContactModel,
+    OpportunityProduct as OpportunityProductModel,
+    Product as ProductModel,
+    ScheduledEvent as ScheduledEventModel,
+)
+from app.schemas import (
+    Action,
+    Application,
+    Company,
+    Contact,
+    Document,
+    DocumentAssociation,
+    Opportunity,
+    OpportunityContact,
+    OpportunityProduct,
+    Product,
+    ScheduledEvent,
+    SyncChange,
+    SyncResponse,
+)
+
+router = APIRouter(prefix="/sync", tags=["sync"], dependencies=[Depends(conditional_get)])
+
+# change_log.entity_type (table name) -> (model, response schema)
+SYNC_ENTITIES = {
+    "companies": (CompanyModel, Company),
+    "contacts": (ContactModel, Contact),
+    "products": (ProductModel, Product),
+    "documents": (DocumentModel, Document),
+    "opportunities": (OpportunityModel, Opportunity),
+    "applications": (ApplicationModel, Application),
+    "scheduled_events": (ScheduledEventModel, ScheduledEvent),
+    "actions": (ActionModel, Action),
+    "opportunity_contacts": (OpportunityContactModel, OpportunityContact),
+    "opportunity_products": (OpportunityProductModel, OpportunityProduct),
+    "document_associations": (DocumentAssociationModel, DocumentAssociation),
+}
+
+
+def _payload_schema(entity_model: Type[Any], schema: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Derive the sync payload of an entity from its response schema: columns only.
+
+    Nested objects (relationships, polymorphic entity) are not loaded by the feed,
+    so their fields are made optional and excluded from the payload; the schema's
+    validators and column fields are kept as is.
+
+    Args:
+        entity_model: SQLAlchemy model class of the entity
+        schema: Response schema of the entity
+
+    Returns:
+        Subclass of the schema dumping the model's columns only
+    """
+    # Mapper.columns is available before the mappers are configured (import time)
+    columns = set(inspect(entity_model).columns.keys())
+    return create_model(
+        f"{schema.__name__}SyncPayload",
+        __base__=schema,
+        **{
+            name: (Any, Field(None, exclude=True))
+            for name in schema.model_fields
+            if name not in columns
+        },
+    )
+
+
+# change_log.entity_type -> payload schema
+SYNC_PAYLOADS = {
+    entity_type: _payload_schema(entity_model, schema)
+    for entity_type, (entity_model, schema) in SYNC_ENTITIES.items()
+}
+
+
+@router.get("/", response_model=SyncResponse)
+def sync_changes(
+    since: int = Query(0, ge=0, description="Token returned by the previous sync (0 for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum number of change log entries to read"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieve every owned entity created, updated or deleted after a change token.
+
+    - **since**: Token returned as next_token by the previous call (0 = everything)
+    - **limit**: Maximum number of change log entries read per call (max 1000)
+
+    Multiple changes of the same entity are collapsed into its latest state:
+    upserts carry the current entity, deletes are tombstones.
+    Rows removed by a cascade from their parent (e.g. opportunity contacts of a
+    deleted opportunity) are covered by the parent's tombstone.
+
+    Returns only changes of entities belonging to the authenticated user.
+    """
+    entries = db.query(ChangeLog).filter(
+        ChangeLog.owner_id == current_user.id,
+        ChangeLog.id > since
+    ).order_by(ChangeLog.id).limit(limit + 1).all()
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # Keep the latest entry per entity, ordered by that entry's token
+    latest: Dict[Tuple[str, int], ChangeLog] = {}
+    for entry in entries:
+        key = (entry.entity_type, entry.entity_id)
+        latest.pop(key, None)
+        latest[key] = entry
+
+    # Load current state of upserted entities, one query per entity type
+    upserted_ids: Dict[str, List[int]] = {}
+    for (entity_type, entity_id), entry in latest.items():
+        if entry.operation != "delete":
+            upserted_ids.setdefault(entity_type, []).append(entity_id)
+
+    current_state: Dict[Tuple[str, int], dict] = {}
+    for entity_type, ids in upserted_ids.items():
+        entity_model = SYNC_ENTITIES[entity_type][0]
+        schema = SYNC_PAYLOADS[entity_type]
+        rows = db.query(entity_model).options(noload("*")).filter(entity_model.id.in_(ids)).all()
+        for row in rows:
+            current_state[(entity_type, row.id)] = schema.model_validate(row).model_dump(mode="json")
+
+    changes = []
+    for key, entry in latest.items():
+        if entry.operation == "delete":
+            changes.append(SyncChange(
+                token=entry.id, entity_type=entry.entity_type,
+                entity_id=entry.entity_id, operation="delete"
+            ))
+        elif key in current_state:
+            changes.append(SyncChange(
+                token=entry.id, entity_type=entry.entity_type,
+                entity_id=entry.entity_id, operation="upsert", data=current_state[key]
+            ))
+        # else: deleted after this page was read, its tombstone comes with the next sync
+
+    next_token = entries[-1].id if entries else since
+    return SyncResponse(changes=changes, next_token=next_token, has_more=has_more)
@@ -66,12 +66,20 @@ from app.schemas.document_association import (
     DocumentAssociation,
     DocumentAssociationCreate,
     DocumentAssociationInDB,
+    DocumentAssociationCountsRequest,
+    DocumentSummary,
+    EntityDocumentCount,
+    EntityReference,
 )
 from app.schemas.token import (
     Token,
     TokenData,
     TokenPayload,
 )
+from app.schemas.sync import (
+    SyncChange,
+    SyncResponse,
+)
 from app.schemas.user import (
     User,
     UserCreate,
@@ -125,9 +133,15 @@ __all__ = [
     "DocumentAssociation",
     "DocumentAssociationCreate",
     "DocumentAssociationInDB",
+    "DocumentAssociationCountsRequest",
+    "DocumentSummary",
+    "EntityDocumentCount",
+    "EntityReference",
     "Token",
     "TokenData",
     "TokenPayload",
+    "SyncChange",
+    "SyncResponse",
     "User",
     "UserCreate",
     "UserUpdate",
@@ -79,7 +79,7 @@ class Application(ApplicationBase):
     opportunity_id: int = Field(..., description="ID of the related opportunity")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
-    opportunity: Opportunity
+    opportunity: Optional[Opportunity] = None
     resume_used: Optional[Document] = None
     cover_letter: Optional[Document] = None
 
@@ -1,7 +1,8 @@
 """Pydantic schemas for DocumentAssociation entity."""
 from datetime import datetime
-from typing import Union, Optional
+from typing import List, Union, Optional
 from pydantic import BaseModel, ConfigDict, Field
+from app.models.document import DocumentFormat
 from app.models.document_association import EntityType
 from app.schemas.document import Document
 from app.schemas.application import Application
@@ -37,3 +38,36 @@ class DocumentAssociation(DocumentAssociationBase):
 class DocumentAssociationInDB(DocumentAssociation):
     """Complete schema representing the association as stored in database."""
     pass
+
+
+class EntityReference(BaseModel):
+    """Reference to an entity that can have associated documents."""
+    entity_type: EntityType = Field(..., description="Type of the entity (application, opportunity, company, contact)")
+    entity_id: int = Field(..., gt=0, description="ID of the entity")
+
+
+class DocumentAssociationCountsRequest(BaseModel):
+    """Schema for counting the documents of many entities at once (POST /counts)."""
+    entities: List[EntityReference] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Entities to count documents for (max 100)"
+    )
+
+
+class DocumentSummary(BaseModel):
+    """Lightweight document representation for badges and previews."""
+    id: int = Field(..., description="Unique identifier")
+    name: str = Field(..., description="Document name")
+    type: str = Field(..., description="Document type")
+    format: DocumentFormat = Field(..., description="File format")
+    is_external: bool = Field(..., description="Whether document is an external link")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EntityDocumentCount(EntityReference):
+    """Number and summaries of the documents associated with one entity."""
+    count: int = Field(..., description="Number of associated documents")
+    documents: List[DocumentSummary] = Field(default_factory=list, description="Associated documents, oldest association first")
@@ -0,0 +1,30 @@
+"""
+Pydantic schemas for the delta sync feed.
+"""
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class SyncChange(BaseModel):
+    """
+    Latest change of one entity since the requested token.
+
+    Upserts carry the current columns of the entity (no nested objects, use the *_id fields).
+    Deletes are tombstones without data.
+    """
+    token: int = Field(..., description="Change token of this entity's latest change")
+    entity_type: str = Field(..., description="Entity collection (e.g. applications, opportunity_contacts)")
+    entity_id: int = Field(..., description="ID of the changed entity")
+    operation: Literal["upsert", "delete"] = Field(..., description="upsert (created or updated) or delete")
+    data: Optional[Dict[str, Any]] = Field(None, description="Current entity for upserts, null for deletes")
+
+
+class SyncResponse(BaseModel):
+    """
+    Delta sync page.
+
+    Pass next_token as `since` on the next call; repeat while has_more is true.
+    """
+    changes: List[SyncChange]
+    next_token: int = Field(..., description="Token to pass as `since` on the next sync")
+    has_more: bool = Field(..., description="True if more changes are available after next_token")
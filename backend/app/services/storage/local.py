@@ -6,6 +6,7 @@ import uuid
 from pathlib import Path
 from app.services.storage.base import StorageBackend
 from app.config import settings
+from app.core.tracing import traced
 
 
 class LocalStorage(StorageBackend):
@@ -48,6 +49,7 @@ class LocalStorage(StorageBackend):
 
         return full_path
 
+    @traced("storage.save_file")
     async def save_file(
         self,
         file_data: bytes,
@@ -87,6 +89,7 @@ class LocalStorage(StorageBackend):
         # Return absolute path
         return str(file_path)
 
+    @traced("storage.get_file")
     async def get_file(self, file_path: str) -> bytes:
         """
         Retrieve file from local filesystem.
@@ -111,6 +114,7 @@ class LocalStorage(StorageBackend):
         async with aiofiles.open(full_path, 'rb') as f:
             return await f.read()
 
+    @traced("storage.delete_file")
     async def delete_file(self, file_path: str) -> bool:
         """
         Delete file from local filesystem.
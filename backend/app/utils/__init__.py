@@ -6,7 +6,14 @@ This package provides reusable components for:
 - Input validation (format and ownership validators)
 - Document operations (file upload, storage management)
 """
-from .db import get_owned_entity_or_404, JoinSpec
+from .db import (
+    get_owned_entity_or_404,
+    JoinSpec,
+    parse_fields_param,
+    fieldset_options,
+    fieldset_response,
+    parse_expand_param,
+)
 from .validators import (
     # Format Validators
     validate_name,
@@ -47,6 +54,10 @@ __all__ = [
     # from db
     "get_owned_entity_or_404",
     "JoinSpec",
+    "parse_fields_param",
+    "fieldset_options",
+    "fieldset_response",
+    "parse_expand_param",
 
     # from validators.format_validators
     "validate_name",
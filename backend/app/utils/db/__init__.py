@@ -1,4 +1,28 @@
 """Database utility functions and helpers."""
-from .helpers import get_owned_entity_or_404, JoinSpec
+from .helpers import (
+    get_owned_entity_or_404,
+    ensure_owned_entity_or_404,
+    update_owned_entity_or_404,
+    delete_owned_entity_or_404,
+    JoinSpec,
+)
+from .fieldsets import parse_fields_param, fieldset_options, fieldset_response
+from .expansions import parse_expand_param
+from .core_reads import select_list_rows
+from .polymorphic import POLYMORPHIC_TARGETS, PolymorphicTarget, load_polymorphic_entities
 
-__all__ = ["get_owned_entity_or_404", "JoinSpec"]
+__all__ = [
+    "get_owned_entity_or_404",
+    "ensure_owned_entity_or_404",
+    "update_owned_entity_or_404",
+    "delete_owned_entity_or_404",
+    "JoinSpec",
+    "parse_fields_param",
+    "fieldset_options",
+    "fieldset_response",
+    "parse_expand_param",
+    "select_list_rows",
+    "POLYMORPHIC_TARGETS",
+    "PolymorphicTarget",
+    "load_polymorphic_entities",
+]
@@ -0,0 +1,43 @@
+"""
+Opt-in relationship expansion for list endpoints.
+
+Lets clients request nested objects explicitly (e.g. ?expand=opportunity.company,resume_used)
+instead of always paying for eager joins. The validated paths are passed to
+select_list_rows (`nested=`), which LEFT OUTER JOINs them in the list query itself;
+relationships that are not expanded are returned as null and never loaded.
+"""
+from typing import Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+
+
+def parse_expand_param(
+    expand: Optional[str],
+    allowed: Sequence[str],
+) -> Tuple[str, ...]:
+    """
+    Parse and validate a comma-separated `expand` query parameter.
+
+    Args:
+        expand: Raw query parameter value (e.g. "opportunity.company,resume_used")
+        allowed: Dotted relationship paths the endpoint accepts
+
+    Returns:
+        Tuple of requested relationship paths (empty if nothing is expanded)
+
+    Raises:
+        HTTPException 400: If a requested path is not allowed
+    """
+    if expand is None:
+        return ()
+
+    requested = [path.strip() for path in expand.split(",") if path.strip()]
+
+    unknown = [path for path in requested if path not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown expansion(s): {', '.join(unknown)}. Allowed expansions: {', '.join(allowed)}"
+        )
+
+    return tuple(dict.fromkeys(requested))
+
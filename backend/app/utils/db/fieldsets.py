@@ -0,0 +1,122 @@
+"""
+Sparse fieldset helpers for list endpoints.
+
+Lets clients request a subset of fields (e.g. ?fields=id,job_title,status)
+so that only the matching columns are SELECTed and serialized.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from app.core.tracing import traced
+
+
+def parse_fields_param(
+    fields: Optional[str],
+    schema: Type[BaseModel],
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parse and validate a comma-separated `fields` query parameter.
+
+    Args:
+        fields: Raw query parameter value (e.g. "id,job_title,company")
+        schema: Pydantic response schema the fields are picked from
+
+    Returns:
+        Tuple of requested field names (always including "id"),
+        or None if no fieldset was requested
+
+    Raises:
+        HTTPException 400: If a requested field is not part of the schema
+    """
+    if fields is None:
+        return None
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    if not requested:
+        return None
+
+    unknown = [name for name in requested if name not in schema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed fields: {', '.join(schema.model_fields)}"
+        )
+
+    # Keep the identifier so clients can always correlate rows
+    selected = ["id"] + [name for name in requested if name != "id"]
+    return tuple(dict.fromkeys(selected))
+
+
+def fieldset_options(
+    entity_model: Type[Any],
+    field_names: Optional[Tuple[str, ...]],
+    relationship_loaders: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """
+    Build query options restricting loaded columns and relationships to a fieldset.
+
+    Args:
+        entity_model: SQLAlchemy model class being queried
+        field_names: Fieldset returned by parse_fields_param (None = full entity)
+        relationship_loaders: Mapping of relationship name to its eager loading option
+                              (e.g. {"company": joinedload(Opportunity.company)})
+
+    Returns:
+        List of SQLAlchemy query options (load_only + requested eager loads)
+    """
+    relationship_loaders = relationship_loaders or {}
+
+    if field_names is None:
+        return list(relationship_loaders.values())
+
+    column_names = inspect(entity_model).column_attrs.keys()
+    columns = [getattr(entity_model, name) for name in field_names if name in column_names]
+
+    options: List[Any] = [load_only(*columns)]
+    options.extend(
+        loader for name, loader in relationship_loaders.items() if name in field_names
+    )
+    return options
+
+
+@lru_cache(maxsize=256)
+def _partial_adapter(schema: Type[BaseModel], field_names: Tuple[str, ...]) -> TypeAdapter:
+    """Build (once per fieldset) a list adapter for a schema restricted to field_names."""
+    partial_fields = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in field_names
+    }
+    partial_schema = create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **partial_fields
+    )
+    return TypeAdapter(List[partial_schema])
+
+
+@traced("serialize_response")
+def fieldset_response(
+    rows: List[Any],
+    schema: Type[BaseModel],
+    field_names: Tuple[str, ...],
+) -> Response:
+    """
+    Serialize ORM rows restricted to a fieldset.
+
+    Bypasses the endpoint response_model (which requires every field),
+    so deferred columns are never touched during serialization.
+
+    Args:
+        rows: ORM instances loaded with fieldset_options, or row dicts from select_list_rows
+        schema: Full Pydantic response schema
+        field_names: Fieldset returned by parse_fields_param
+
+    Returns:
+        JSON Response containing only the requested fields
+    """
+    adapter = _partial_adapter(schema, field_names)
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(validated), media_type="application/json")
@@ -5,9 +5,12 @@ Provides reusable functions for querying owned entities with proper
 error handling and multi-tenancy enforcement.
 """
 from dataclasses import dataclass
-from typing import Type, Any, Optional, List, TypeVar
-from sqlalchemy.orm import Session, Query
+from typing import Type, Any, Dict, Optional, List, Sequence, Tuple, TypeVar
+from sqlalchemy import Select, bindparam, delete, select, update
+from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.core.metrics import OWNED_ENTITY_STATEMENT_CACHE
+from app.core.tracing import traced
 
 T = TypeVar('T')
 
@@ -36,6 +39,81 @@ class JoinSpec:
     owner_field: Optional[str] = None
 
 
+# SELECT statements of get_owned_entity_or_404, per (model, joins, options) shape
+_OWNED_ENTITY_STATEMENTS: Dict[Tuple[Any, ...], Select] = {}
+
+
+def _owned_entity_statement(
+    entity_model: Type[Any],
+    requires_joins: Optional[List[JoinSpec]],
+    options: Optional[Sequence[Any]],
+) -> Select:
+    """
+    Return the SELECT of an owned entity, with bound parameters :entity_id and :owner_id.
+
+    Building the statement (joins, options, criteria) and its SQL cache key costs
+    more Python time than running it. A statement object memoizes its cache key,
+    so reusing one per shape also skips the key computation on every execution.
+    Loader options are compared by their own cache key. Options embedding literal
+    values (e.g. with_loader_criteria) are never cached: the cached statement
+    would keep the first values.
+
+    Raises:
+        ValueError: If requires_joins is provided but contains no owner_field
+    """
+    joins_key = tuple((spec.model, spec.owner_field) for spec in requires_joins or ())
+    options_key: Optional[Tuple[Any, ...]] = ()
+    for option in options or ():
+        option_key = option._generate_cache_key()
+        if option_key is None or option_key.bindparams:
+            options_key = None
+            break
+        options_key += (option_key.key,)
+
+    key = (entity_model, joins_key, options_key)
+    if options_key is not None:
+        statement = _OWNED_ENTITY_STATEMENTS.get(key)
+        if statement is not None:
+            OWNED_ENTITY_STATEMENT_CACHE.labels("hit").inc()
+            return statement
+
+    statement = select(entity_model)
+    if options:
+        statement = statement.options(*options)
+
+    # Apply joins if required
+    if requires_joins:
+        for join_spec in requires_joins:
+            statement = statement.join(join_spec.model)
+
+        # Find the model with owner_field
+        owner_spec = next(
+            (spec for spec in requires_joins if spec.owner_field is not None),
+            None
+        )
+        if not owner_spec:
+            raise ValueError(
+                "requires_joins must contain at least one JoinSpec with owner_field"
+            )
+        owner_column = getattr(owner_spec.model, owner_spec.owner_field)
+    else:
+        # Direct ownership
+        owner_column = entity_model.owner_id
+
+    statement = statement.where(
+        entity_model.id == bindparam("entity_id"),
+        owner_column == bindparam("owner_id"),
+    ).limit(1)
+
+    if options_key is None:
+        OWNED_ENTITY_STATEMENT_CACHE.labels("uncacheable").inc()
+    else:
+        _OWNED_ENTITY_STATEMENTS[key] = statement
+        OWNED_ENTITY_STATEMENT_CACHE.labels("miss").inc()
+    return statement
+
+
+@traced("ownership.get_owned_entity")
 def get_owned_entity_or_404(
     db: Session,
     entity_model: Type[T],
@@ -50,7 +128,8 @@ def get_owned_entity_or_404(
     Retrieve an entity by its ID with ownership validation.
 
     Supports both direct ownership (entity.owner_id) and inherited ownership
-    through JOIN relationships. Returns the entity in a single query.
+    through JOIN relationships. Returns the entity in a single query, whose
+    statement is built once per (model, joins, options) shape and then reused.
 
     Args:
         db: SQLAlchemy session
@@ -89,46 +168,207 @@ def get_owned_entity_or_404(
         raise ValueError("entity_model cannot be None")
 
     entity_name = entity_name or entity_model.__name__
-    query: Query = db.query(entity_model)
 
-    # Apply query options (optimizations like joinedload)
-    if options:
-        for option in options:
-            query = query.options(option)
+    # Built once per shape; only the id and the owner are bound per call
+    statement = _owned_entity_statement(entity_model, requires_joins, options)
+    entity = db.execute(
+        statement, {"entity_id": entity_id, "owner_id": owner_id}
+    ).scalars().unique().first()
+    if not entity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{entity_name} not found",
+        )
 
-    # Apply joins if required
-    if requires_joins:
-        for join_spec in requires_joins:
-            query = query.join(join_spec.model)
+    return entity
 
-        # Find the model with owner_field
-        owner_spec = next(
-            (spec for spec in requires_joins if spec.owner_field is not None),
-            None
+
+def _ownership_criteria(
+    entity_model: Type[Any],
+    entity_id: int,
+    owner_id: int,
+    requires_joins: Optional[List[JoinSpec]] = None,
+) -> List[Any]:
+    """
+    WHERE criteria matching one owned entity, for UPDATE/DELETE statements.
+
+    UPDATE and DELETE cannot take the JOINs of a SELECT, so inherited ownership
+    is expressed as `id IN (SELECT id ... JOIN ... WHERE owner)`.
+
+    Raises:
+        ValueError: If entity_id <= 0 or requires_joins contains no owner_field
+    """
+    if entity_id <= 0:
+        raise ValueError(f"entity_id must be a positive integer, got: {entity_id}")
+
+    if not requires_joins:
+        return [entity_model.id == entity_id, entity_model.owner_id == owner_id]
+
+    owner_spec = next(
+        (spec for spec in requires_joins if spec.owner_field is not None),
+        None
+    )
+    if not owner_spec:
+        raise ValueError(
+            "requires_joins must contain at least one JoinSpec with owner_field"
         )
-        if not owner_spec:
-            raise ValueError(
-                "requires_joins must contain at least one JoinSpec with owner_field"
-            )
 
-        # Filter by entity ID and owner
-        query = query.filter(
-            entity_model.id == entity_id,
-            getattr(owner_spec.model, owner_spec.owner_field) == owner_id,
+    owned_ids = select(entity_model.id)
+    for join_spec in requires_joins:
+        owned_ids = owned_ids.join(join_spec.model)
+    owned_ids = owned_ids.where(
+        entity_model.id == entity_id,
+        getattr(owner_spec.model, owner_spec.owner_field) == owner_id,
+    )
+    return [entity_model.id == entity_id, entity_model.id.in_(owned_ids)]
+
+
+@traced("ownership.ensure_owned_entity")
+def ensure_owned_entity_or_404(
+    db: Session,
+    entity_model: Type[Any],
+    entity_id: int,
+    owner_id: int,
+    *,
+    entity_name: Optional[str] = None,
+    requires_joins: Optional[List[JoinSpec]] = None,
+) -> None:
+    """
+    Check that an owned entity exists, without loading it.
+
+    A single `SELECT EXISTS (...)`. Used before validating the foreign keys of an
+    update, so that a missing or foreign entity is reported as such (404 on the
+    entity itself) rather than through the entities it references.
+
+    Args:
+        db: SQLAlchemy session
+        entity_model: SQLAlchemy model class (e.g., Action, Contact)
+        entity_id: Primary key of the entity (must be positive)
+        owner_id: ID of the user who should own the entity
+        entity_name: Optional human-readable name for error messages
+                    (defaults to model.__name__)
+        requires_joins: List of JoinSpec for entities whose ownership
+                       is inherited through relationships
+
+    Raises:
+        ValueError: If entity_id <= 0
+        HTTPException: 404 if the entity does not exist or is not owned by the user
+    """
+    owned = select(entity_model.id).where(
+        *_ownership_criteria(entity_model, entity_id, owner_id, requires_joins)
+    ).exists()
+    if not db.scalar(select(owned)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{entity_name or entity_model.__name__} not found",
         )
-    else:
-        # Direct ownership
-        query = query.filter(
-            entity_model.id == entity_id,
-            entity_model.owner_id == owner_id,
+
+
+@traced("ownership.update_owned_entity")
+def update_owned_entity_or_404(
+    db: Session,
+    entity_model: Type[T],
+    entity_id: int,
+    owner_id: int,
+    values: Dict[str, Any],
+    *,
+    entity_name: Optional[str] = None,
+    requires_joins: Optional[List[JoinSpec]] = None,
+) -> T:
+    """
+    Update an owned entity in a single statement.
+
+    Issues `UPDATE ... WHERE id = :id AND owner_id = :owner RETURNING *` instead
+    of SELECT, attribute changes and flush: ownership check, update and reload
+    are one round trip. Column `onupdate` defaults (updated_at) still apply.
+    Use it only when the update has no Python-side side effects.
+
+    Args:
+        db: SQLAlchemy session (not committed, let the caller manage transaction)
+        entity_model: SQLAlchemy model class (e.g., Company, Action)
+        entity_id: Primary key of the entity to update (must be positive)
+        owner_id: ID of the user who should own the entity
+        values: Column values to set (owner_id is ignored)
+        entity_name: Optional human-readable name for error messages
+                    (defaults to model.__name__)
+        requires_joins: List of JoinSpec for entities whose ownership
+                       is inherited through relationships
+
+    Returns:
+        The updated entity instance
+
+    Raises:
+        ValueError: If entity_id <= 0
+        HTTPException: 404 if the entity does not exist or is not owned by the user
+
+    Examples:
+        company = update_owned_entity_or_404(
+            db=db,
+            entity_model=Company,
+            entity_id=company_id,
+            owner_id=current_user.id,
+            values=company_update.model_dump(exclude_unset=True)
+        )
+    """
+    values = {field: value for field, value in values.items() if field != 'owner_id'}
+    if not values:
+        # Nothing to update: an UPDATE without SET is invalid
+        return get_owned_entity_or_404(
+            db, entity_model, entity_id, owner_id,
+            entity_name=entity_name, requires_joins=requires_joins
         )
 
-    # Execute the query
-    entity = query.first()
-    if not entity:
+    stmt = update(entity_model).where(
+        *_ownership_criteria(entity_model, entity_id, owner_id, requires_joins)
+    ).values(**values).returning(entity_model).execution_options(populate_existing=True)
+
+    entity = db.scalars(stmt).first()
+    if entity is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{entity_name} not found",
+            detail=f"{entity_name or entity_model.__name__} not found",
         )
 
     return entity
+
+
+@traced("ownership.delete_owned_entity")
+def delete_owned_entity_or_404(
+    db: Session,
+    entity_model: Type[Any],
+    entity_id: int,
+    owner_id: int,
+    *,
+    entity_name: Optional[str] = None,
+    requires_joins: Optional[List[JoinSpec]] = None,
+) -> None:
+    """
+    Delete an owned entity in a single statement.
+
+    Issues `DELETE ... WHERE id = :id AND owner_id = :owner RETURNING id`. The
+    entity is not loaded, so ORM cascades do not run: dependent rows must be
+    handled by the database (ON DELETE CASCADE / SET NULL, triggers).
+
+    Args:
+        db: SQLAlchemy session (not committed, let the caller manage transaction)
+        entity_model: SQLAlchemy model class (e.g., Company, Action)
+        entity_id: Primary key of the entity to delete (must be positive)
+        owner_id: ID of the user who should own the entity
+        entity_name: Optional human-readable name for error messages
+                    (defaults to model.__name__)
+        requires_joins: List of JoinSpec for entities whose ownership
+                       is inherited through relationships
+
+    Raises:
+        ValueError: If entity_id <= 0
+        HTTPException: 404 if the entity does not exist or is not owned by the user
+    """
+    stmt = delete(entity_model).where(
+        *_ownership_criteria(entity_model, entity_id, owner_id, requires_joins)
+    ).returning(entity_model.id)
+
+    if db.execute(stmt).first() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{entity_name or entity_model.__name__} not found",
+        )
@@ -0,0 +1,89 @@
+"""
+Foreign key index audit.
+
+PostgreSQL does not index the referencing side of a foreign key. Without an
+index, every ON DELETE CASCADE / SET NULL on the parent scans the child table,
+and filtered lists (e.g. ?opportunity_id=) scan it as well.
+
+A foreign key is covered when an index, unique constraint or primary key starts
+with its columns (in any order).
+"""
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+from sqlalchemy import MetaData
+from sqlalchemy.engine import Engine
+from sqlalchemy import inspect
+
+
+@dataclass(frozen=True)
+class UnindexedForeignKey:
+    """Foreign key without an index on its columns."""
+    table: str
+    columns: Tuple[str, ...]
+    referred_table: str
+
+    @property
+    def suggested_index(self) -> str:
+        """Name following the `index=True` convention (ix_<table>_<column>)."""
+        return f"ix_{self.table}_{'_'.join(self.columns)}"
+
+    def __str__(self) -> str:
+        return f"{self.table}({', '.join(self.columns)}) -> {self.referred_table}"
+
+
+def _is_covered(fk_columns: Sequence[str], index_columns: Iterable[Sequence[str]]) -> bool:
+    wanted = set(fk_columns)
+    return any(set(columns[:len(wanted)]) == wanted for columns in index_columns)
+
+
+def find_unindexed_foreign_keys(metadata: MetaData) -> List[UnindexedForeignKey]:
+    """
+    List foreign keys declared in the models without a covering index.
+
+    Args:
+        metadata: Model metadata (Base.metadata)
+
+    Returns:
+        Unindexed foreign keys, sorted by table and columns
+    """
+    missing = []
+    for table in metadata.sorted_tables:
+        index_columns = [[column.name for column in index.columns] for index in table.indexes]
+        index_columns += [
+            [column.name for column in constraint.columns]
+            for constraint in table.constraints
+            if constraint.__visit_name__ in ("primary_key_constraint", "unique_constraint")
+        ]
+        for fk in table.foreign_key_constraints:
+            columns = tuple(column.name for column in fk.columns)
+            if not _is_covered(columns, index_columns):
+                missing.append(UnindexedForeignKey(table.name, columns, fk.referred_table.name))
+
+    return sorted(missing, key=lambda fk: (fk.table, fk.columns))
+
+
+def find_unindexed_foreign_keys_in_database(engine: Engine) -> List[UnindexedForeignKey]:
+    """
+    List foreign keys of the live database without a covering index.
+
+    Catches drift between the models and the migrations actually applied.
+
+    Args:
+        engine: Engine connected to the database to audit
+
+    Returns:
+        Unindexed foreign keys, sorted by table and columns
+    """
+    inspector = inspect(engine)
+    missing = []
+    for table in inspector.get_table_names():
+        index_columns = [index["column_names"] for index in inspector.get_indexes(table)]
+        index_columns += [constraint["column_names"] for constraint in inspector.get_unique_constraints(table)]
+        index_columns.append(inspector.get_pk_constraint(table)["constrained_columns"])
+        for fk in inspector.get_foreign_keys(table):
+            columns = tuple(fk["constrained_columns"])
+            if not _is_covered(columns, index_columns):
+                missing.append(UnindexedForeignKey(table, columns, fk["referred_table"]))
+
+    return sorted(missing, key=lambda fk: (fk.table, fk.columns))
@@ -0,0 +1,101 @@
+"""
+Polymorphic entity loading for document associations.
+
+DocumentAssociation points to its entity with (entity_type, entity_id), without a
+foreign key, so the ORM cannot load `entity` by itself. The registry below maps
+each entity type to its model, its owner column and the eager loading matching
+the nested objects of its response schema. Loading a page of associations then
+costs one query per entity type present, whatever the number of rows (no lazy
+load during serialization).
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+from sqlalchemy.orm import Session, joinedload
+from app.models.application import Application
+from app.models.company import Company
+from app.models.contact import Contact
+from app.models.document_association import DocumentAssociation, EntityType
+from app.models.opportunity import Opportunity
+
+
+@dataclass(frozen=True)
+class PolymorphicTarget:
+    """
+    How to load the entities of one EntityType.
+
+    Attributes:
+        model: SQLAlchemy model class of the entity
+        owner_field: Name of the owner_id column on the model
+        loader_options: Returns the eager loading of the relationships nested in
+                        the response schema (all many-to-one: joined in the same
+                        query). Built on use, so importing this module does not
+                        configure the mappers.
+    """
+    model: Type[Any]
+    owner_field: str
+    loader_options: Callable[[], Tuple[Any, ...]] = tuple
+
+
+POLYMORPHIC_TARGETS: Dict[EntityType, PolymorphicTarget] = {
+    EntityType.APPLICATION: PolymorphicTarget(
+        model=Application,
+        owner_field="owner_id",
+        loader_options=lambda: (
+            joinedload(Application.opportunity).joinedload(Opportunity.company),
+            joinedload(Application.resume_used),
+            joinedload(Application.cover_letter),
+        ),
+    ),
+    EntityType.OPPORTUNITY: PolymorphicTarget(
+        model=Opportunity,
+        owner_field="owner_id",
+        loader_options=lambda: (joinedload(Opportunity.company),),
+    ),
+    EntityType.COMPANY: PolymorphicTarget(
+        model=Company,
+        owner_field="owner_id",
+    ),
+    EntityType.CONTACT: PolymorphicTarget(
+        model=Contact,
+        owner_field="owner_id",
+        loader_options=lambda: (joinedload(Contact.company),),
+    ),
+}
+
+
+def load_polymorphic_entities(
+    db: Session,
+    associations: Sequence[DocumentAssociation],
+    owner_id: int,
+) -> None:
+    """
+    Fetch the entities of document associations and attach them as `entity`.
+
+    One query per entity type present, restricted to entities of `owner_id`.
+    Associations whose entity is missing (or not owned) get `entity = None`.
+
+    Args:
+        db: Database session
+        associations: DocumentAssociation instances to populate
+        owner_id: ID of the user the entities must belong to
+    """
+    if not associations:
+        return
+
+    ids_by_type: Dict[EntityType, set] = {}
+    for association in associations:
+        ids_by_type.setdefault(association.entity_type, set()).add(association.entity_id)
+
+    fetched: Dict[Tuple[EntityType, int], Any] = {}
+    for entity_type, ids in ids_by_type.items():
+        target = POLYMORPHIC_TARGETS[entity_type]
+        entities: List[Any] = db.query(target.model).options(*target.loader_options()).filter(
+            target.model.id.in_(ids),
+            getattr(target.model, target.owner_field) == owner_id
+        ).all()
+        for entity in entities:
+            fetched[(entity_type, entity.id)] = entity
+
+    # Not a mapped attribute: read by the `entity` field of the response schema
+    for association in associations:
+        association.entity = fetched.get((association.entity_type, association.entity_id))
@@ -9,11 +9,15 @@ This module provides helpers for document file operations:
 from typing import Tuple
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
-from app.models.document import DocumentFormat
+from app.models.document import Document, DocumentFormat
 from app.models.document_association import DocumentAssociation, EntityType
 from app.config import settings
 from app.services.storage import get_storage_backend
-from typing import Optional
+from app.core.metrics import DOCUMENT_TRANSFER_BYTES
+from app.core.tracing import traced
+from typing import List, Optional
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.models.user import User
 
@@ -156,9 +160,11 @@ async def save_uploaded_file(
         user_id=user_id,
         original_filename=original_filename
     )
+    DOCUMENT_TRANSFER_BYTES.labels("upload").inc(len(file_data))
     return file_path
 
 
+@traced("documents.process_uploaded_file")
 async def process_uploaded_file(
     file: UploadFile,
     user_id: int
@@ -237,6 +243,7 @@ async def delete_local_file_safe(file_path: str) -> None:
     except Exception as e:
         print(f"⚠ Warning: Could not delete file {file_path}: {e}")
 
+@traced("documents.upsert_association")
 def create_or_update_document_association_or_404(
     db: Session,
     document_id: int,
@@ -247,7 +254,12 @@ def create_or_update_document_association_or_404(
     """
     Create or return existing document association.
 
-    Validates that document exists and belongs to owner before creating association.
+    Single statement in the common case: the document ownership check and the
+    insert run as one INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING,
+    relying on the unique (document_id, entity_type, entity_id) index, so
+    concurrent requests cannot create duplicates. Only when nothing is inserted
+    (already associated, or document not owned) is a second query needed; if
+    the existing association was deleted in between, the upsert is retried once.
 
     Args:
         db: Database session
@@ -261,38 +273,55 @@ def create_or_update_document_association_or_404(
 
     Raises:
         HTTPException 404: If document doesn't exist or doesn't belong to owner
+        HTTPException 409: If the association keeps changing concurrently
     """
     if document_id is None:
         return None
 
-    # Validate document exists and belongs to user
-    from app.utils.validators import validate_document_exists_and_owned
-    validate_document_exists_and_owned (
-        db=db,
-        document_id=document_id,
-        current_user=current_user
+    entity_type = EntityType(entity_type)
+    owned_document = select(Document.id).where(
+        Document.id == document_id,
+        Document.owner_id == current_user.id
     )
-
-    # Check if association already exists
-    existing = db.query(DocumentAssociation).filter(
-        DocumentAssociation.document_id == document_id,
-        DocumentAssociation.entity_type == EntityType(entity_type),
-        DocumentAssociation.entity_id == entity_id
-    ).first()
-
-    if existing:
-        return existing
-
-    # Create new association
-    association = DocumentAssociation(
-        document_id=document_id,
-        entity_type=EntityType(entity_type),
-        entity_id=entity_id
-    )
-    db.add(association)
+    stmt = insert(DocumentAssociation).from_select(
+        ["document_id", "entity_type", "entity_id"],
+        select(
+            literal(document_id),
+            literal(entity_type, DocumentAssociation.entity_type.type),
+            literal(entity_id)
+        ).where(owned_document.exists())
+    ).on_conflict_do_nothing(
+        index_elements=["document_id", "entity_type", "entity_id"]
+    ).returning(DocumentAssociation)
     # Note: No commit here, let the caller manage transaction
+    # Two attempts: an existing association deleted concurrently between the
+    # upsert and the lookup leaves nothing to return, the retry inserts it.
+    for _ in range(2):
+        association = db.scalars(stmt).first()
+        if association is not None:
+            return association
+
+        existing = db.query(DocumentAssociation).join(Document).filter(
+            DocumentAssociation.document_id == document_id,
+            DocumentAssociation.entity_type == entity_type,
+            DocumentAssociation.entity_id == entity_id,
+            Document.owner_id == current_user.id
+        ).first()
+        if existing is not None:
+            return existing
+
+        # Raises the same 404 as the other document ownership checks
+        from app.utils.validators import validate_document_exists_and_owned
+        validate_document_exists_and_owned(
+            db=db,
+            document_id=document_id,
+            current_user=current_user
+        )
 
-    return association
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Document association was modified concurrently, please retry"
+    )
 
 
 def remove_document_association(
@@ -322,3 +351,44 @@ def remove_document_association(
     if association:
         db.delete(association)
         # Note: No commit here, let the caller manage transaction
+
+
+def get_entity_documents_or_404(
+    db: Session,
+    entity_type: str,
+    entity_id: int,
+    current_user: User,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Document]:
+    """
+    List the documents associated with an entity.
+
+    Validates that the entity exists and belongs to the user, then reads the
+    associations through the (entity_type, entity_id) index.
+
+    Args:
+        db: Database session
+        entity_type: Type of entity (application, opportunity, company, contact)
+        entity_id: ID of entity
+        current_user: Current authenticated user (for validation)
+        skip: Number of documents to skip
+        limit: Maximum number of documents to return
+
+    Returns:
+        Documents, oldest association first
+
+    Raises:
+        HTTPException 404: If entity doesn't exist or doesn't belong to user
+    """
+    from app.utils.validators import validate_entity_exists_and_owned
+    entity_type = EntityType(entity_type)
+    validate_entity_exists_and_owned(db, entity_type, entity_id, current_user)
+
+    return db.query(Document).join(DocumentAssociation).filter(
+        DocumentAssociation.entity_type == entity_type,
+        DocumentAssociation.entity_id == entity_id,
+        Document.owner_id == current_user.id
+    ).order_by(
+        DocumentAssociation.created_at, DocumentAssociation.id
+    ).offset(skip).limit(limit).all()
@@ -0,0 +1,153 @@
+"""
+Benchmark the read path of the hot list endpoints: ORM vs Core rows.
+
+For each list below, renders a page the way the endpoint did before
+(db.query + eager loading + validation from ORM instances) and the way it does
+now (app.utils.db.select_list_rows: plain rows validated from dicts), both
+through list_json_response. Both read the same page (ordered by id), and each
+round uses a fresh session, like a request.
+
+Reported per strategy: latency (median and p95 per page) and, in a separate
+pass under tracemalloc, the peak memory allocated while rendering a page (ORM
+instances, their state and the intermediate rows all count).
+
+Requires a database with generated tenants (python -m benchmarks.datagen).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_list_reads [--email loadtest-1@example.com] [--limit 100] [--rounds 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add backend directory to python path to allow imports from app
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(backend_dir))
+
+# SQL echo would dominate the measurements
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy.orm import joinedload, noload, selectinload
+
+from app.core.serialization import list_json_response
+from app.database import SessionLocal
+from app.models import Application, Opportunity, User
+from app.schemas.application import Application as ApplicationSchema
+from app.schemas.opportunity import Opportunity as OpportunitySchema
+from app.utils.db import select_list_rows
+from benchmarks.loadtest import EMAIL_TEMPLATE
+
+
+def orm_opportunities(db, owner_id, limit):
+    rows = db.query(Opportunity).options(joinedload(Opportunity.company)).filter(
+        Opportunity.owner_id == owner_id
+    ).order_by(Opportunity.id).limit(limit).all()
+    return list_json_response(rows, OpportunitySchema).body
+
+
+def core_opportunities(db, owner_id, limit):
+    rows = select_list_rows(db, Opportunity, [Opportunity.owner_id == owner_id], nested=("company",), limit=limit)
+    return list_json_response(rows, OpportunitySchema).body
+
+
+def orm_expand_options(expanded):
+    """Loader options of the former ORM path: chained selectinload per expanded path, noload elsewhere."""
+    options = [noload("*")]
+    for path in expanded:
+        model, loader = Application, None
+        for segment in path.split("."):
+            attribute = getattr(model, segment)
+            loader = selectinload(attribute) if loader is None else loader.selectinload(attribute)
+            model = attribute.property.mapper.class_
+        options.append(loader.noload("*"))
+    return options
+
+
+def orm_applications(db, owner_id, limit, expanded=()):
+    rows = db.query(Application).options(*orm_expand_options(expanded)).filter(
+        Application.owner_id == owner_id
+    ).order_by(Application.id).limit(limit).all()
+    return list_json_response(rows, ApplicationSchema).body
+
+
+def core_applications(db, owner_id, limit, expanded=()):
+    rows = select_list_rows(db, Application, [Application.owner_id == owner_id], nested=expanded, limit=limit)
+    return list_json_response(rows, ApplicationSchema).body
+
+
+EXPANDED = ("opportunity.company", "resume_used", "cover_letter")
+
+# list label -> (ORM path, Core path)
+CASES = {
+    "GET /opportunities/": (orm_opportunities, core_opportunities),
+    "GET /applications/": (orm_applications, core_applications),
+    "GET /applications/?expand=...": (
+        lambda db, owner_id, limit: orm_applications(db, owner_id, limit, EXPANDED),
+        lambda db, owner_id, limit: core_applications(db, owner_id, limit, EXPANDED),
+    ),
+}
+
+
+def run_once(func, owner_id, limit):
+    db = SessionLocal()
+    try:
+        return func(db, owner_id, limit)
+    finally:
+        db.close()
+
+
+def measure(func, owner_id, limit, rounds):
+    """Return (median ms, p95 ms, peak KiB, body size) of one strategy."""
+    body = run_once(func, owner_id, limit)  # warm-up (compiles statements and adapters)
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run_once(func, owner_id, limit)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+
+    # Allocations are measured apart: tracemalloc slows every allocation down
+    tracemalloc.start()
+    peaks = []
+    for _ in range(max(1, rounds // 10)):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run_once(func, owner_id, limit)
+        peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    tracemalloc.stop()
+
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return statistics.median(timings), p95, statistics.median(peaks), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", default=EMAIL_TEMPLATE.format(1), help="Tenant whose lists are read")
+    parser.add_argument("--limit", type=int, default=100, help="Rows per page")
+    parser.add_argument("--rounds", type=int, default=200, help="Pages rendered per strategy")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    owner_id = db.query(User.id).filter(User.email == args.email).scalar()
+    db.close()
+    if owner_id is None:
+        sys.exit(f"No user {args.email}: generate tenants first (python -m benchmarks.datagen)")
+
+    print(f"{args.limit}-row pages of {args.email} x {args.rounds} rounds\n")
+    print(f"{'list':<30} {'path':<5} {'median':>9} {'p95':>9} {'peak':>11} {'bytes':>10}")
+    for label, strategies in CASES.items():
+        results = {}
+        for path, func in zip(("orm", "core"), strategies):
+            median, p95, peak, size = measure(func, owner_id, args.limit, args.rounds)
+            results[path] = median
+            print(f"{label:<30} {path:<5} {median:7.2f}ms {p95:7.2f}ms {peak:8.0f}KiB {size:>10,}")
+        print(f"{'':<30} speedup x{results['orm'] / results['core']:.2f}\n")
+
+
+if __name__ == "__main__":
+    main()
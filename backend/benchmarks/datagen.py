@@ -0,0 +1,575 @@
+"""
+High-volume synthetic data generator.
+
+Generates valid rows for every business table, tenant by tenant:
+- users (loadtest-<n>@example.com, one shared password)
+- companies with Luhn-valid SIRETs, contacts with E.164 phones, products
+- opportunities with realistic text sizes, applications with a realistic
+  status mix, scheduled events, actions (some linked to an event)
+- opportunity/contact and opportunity/product links
+- documents (small real PDF, TXT, Markdown, CSV, JSON and PNG files written
+  to DOCUMENTS_PATH as hard links to one template per format, or external
+  links), and their polymorphic document associations. Resumes and cover
+  letters used by an application are associated with it, like the API does.
+
+Rows are streamed to PostgreSQL with `COPY ... FROM STDIN` in chunks, parents
+before children, with explicit ids (sequences are moved past them at the end).
+The change tracking triggers fire as for any insert, so the data_version
+counters and the change_log stay consistent.
+
+With --disable-triggers (database superuser required), the load and the deletion
+of previous tenants run with `session_replication_role = replica`: no foreign key
+checks or cascades, no per-row change notifications. The change_log and the
+data_version counters are then filled in set-based statements at the end. This is
+several times faster for millions of rows; the rows are consistent by construction.
+
+Output is deterministic for a given --seed: each tenant has its own random
+generator, so the same tenant gets the same data whatever the volumes of the
+others. Ids are identical when the tables start empty.
+
+Refresh tokens and the change log are runtime tables, not generated.
+Previously generated tenants are deleted first.
+
+Usage (from the backend directory):
+    python -m benchmarks.datagen [--users 10] [--opportunities 2000] [--applications 2000]
+        [--actions 4000] [--companies 200] [--contacts 300] [--documents 40] [--seed 42]
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, List
+
+import phonenumbers
+from sqlalchemy import delete, select
+
+from app.config import settings
+from app.core.security import get_password_hash
+from app.database import engine
+from app.models import User
+from app.models.application import ApplicationStatus
+from app.models.document import DocumentFormat
+from app.models.document_association import EntityType
+from app.models.opportunity import ApplicationType, ContractType, RemotePolicy
+from app.models.scheduled_event import CommunicationMethod, EventStatus
+from benchmarks.loadtest import DEFAULT_PASSWORD, EMAIL_TEMPLATE, SAMPLE_PDF
+
+# Rows buffered (all tables) before a COPY round
+COPY_CHUNK_ROWS = 50_000
+
+# Columns written per table, in COPY (and foreign key) order
+TABLES = {
+    "users": ["id", "email", "hashed_password", "first_name", "last_name", "is_active", "created_at"],
+    "companies": [
+        "id", "name", "siret", "website", "headquarters", "is_intermediary", "company_type",
+        "industry", "notes", "owner_id", "created_at",
+    ],
+    "contacts": [
+        "id", "last_name", "first_name", "position", "email", "phone", "linkedin", "relationship_notes",
+        "is_independent_recruiter", "notes", "company_id", "owner_id", "created_at",
+    ],
+    "products": ["id", "owner_id", "name", "description", "company_id", "website", "technologies_used", "created_at"],
+    "documents": ["id", "name", "type", "format", "path", "description", "is_external", "owner_id", "created_at"],
+    "opportunities": [
+        "id", "job_title", "application_type", "company_id", "position_type", "contract_type", "location",
+        "job_posting_url", "job_description", "required_skills", "technologies", "salary_min", "salary_max",
+        "salary_info", "remote_policy", "remote_details", "source", "recruitment_process", "owner_id", "created_at",
+    ],
+    "applications": [
+        "id", "owner_id", "opportunity_id", "application_date", "status", "salary_expectation",
+        "resume_used_id", "cover_letter_id", "is_archived", "created_at",
+    ],
+    "scheduled_events": [
+        "id", "title", "event_type", "scheduled_date", "duration_minutes", "communication_method", "event_link",
+        "phone_number", "location", "instructions", "status", "notes", "owner_id", "created_at",
+    ],
+    "actions": [
+        "id", "owner_id", "application_id", "type", "completed_date", "notes", "scheduled_event_id", "created_at",
+    ],
+    "opportunity_contacts": [
+        "id", "opportunity_id", "contact_id", "is_primary_contact", "contact_role", "origin", "notes", "created_at",
+    ],
+    "opportunity_products": ["id", "opportunity_id", "product_id", "created_at"],
+    "document_associations": ["id", "document_id", "entity_type", "entity_id", "created_at"],
+}
+
+# Tables without owner_id: owner resolved through (parent table, foreign key), like the triggers do
+CHILD_TABLES = {
+    "opportunity_contacts": ("opportunities", "opportunity_id"),
+    "opportunity_products": ("opportunities", "opportunity_id"),
+    "document_associations": ("documents", "document_id"),
+}
+
+# Realistic status mix: most applications never get an answer
+STATUS_WEIGHTS = {
+    ApplicationStatus.PENDING: 45,
+    ApplicationStatus.REJECTED: 30,
+    ApplicationStatus.FOLLOW_UP_SCHEDULED: 10,
+    ApplicationStatus.INTERVIEW_SCHEDULED: 8,
+    ApplicationStatus.OBSOLETE: 5,
+    ApplicationStatus.ACCEPTED: 2,
+}
+
+WORDS = (
+    "python fastapi postgresql docker kubernetes react typescript api backend frontend team product "
+    "customers data pipeline cloud aws gcp azure microservices testing ci cd agile scrum mentoring "
+    "architecture performance security scalability ownership roadmap features delivery quality code "
+    "review design startup growth mission impact remote office paris lyon benefits salary equity "
+    "experience years degree english french communication collaboration autonomy curiosity"
+).split()
+FIRST_NAMES = ["Camille", "Lea", "Manon", "Chloe", "Ines", "Lucas", "Hugo", "Louis", "Nathan", "Jules", "Sarah", "Adam"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau"]
+JOB_TITLES = [
+    "Backend Developer", "Data Engineer", "DevOps Engineer", "Fullstack Developer", "Site Reliability Engineer",
+    "Tech Lead", "Python Developer", "Platform Engineer", "Machine Learning Engineer", "Engineering Manager",
+]
+CITIES = ["Paris", "Lyon", "Nantes", "Bordeaux", "Lille", "Toulouse", "Remote"]
+DOCUMENT_TYPES = ["resume", "cover_letter", "portfolio", "certificate", "job_posting", "other"]
+ACTION_TYPES = ["follow_up", "note", "rejection", "offer", "other"]
+CONTACT_ROLES = ["HR", "technical", "manager", "recruiter", "other"]
+APPLICATION_TYPES = [member.name for member in ApplicationType]
+CONTRACT_TYPES = [member.name for member in ContractType]
+REMOTE_POLICIES = [member.name for member in RemotePolicy]
+EVENT_STATUSES = [member.name for member in EventStatus]
+
+# 1x1 transparent PNG
+SAMPLE_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+SAMPLE_FILES = {
+    DocumentFormat.PDF: SAMPLE_PDF,
+    DocumentFormat.TXT: b"Experience\n- Backend developer, 5 years\n",
+    DocumentFormat.MD: b"# Resume\n\n- Python\n- PostgreSQL\n",
+    DocumentFormat.CSV: b"company,position,status\nAcme,Backend Developer,pending\n",
+    DocumentFormat.JSON: b'{"skills": ["python", "postgresql"]}\n',
+    DocumentFormat.PNG: SAMPLE_PNG,
+}
+
+
+def siret(number: int) -> str:
+    """14-digit SIRET derived from `number`, with a valid Luhn checksum."""
+    payload = f"{number % 10 ** 13:013d}"
+    total = 0
+    for position, digit in enumerate(reversed(payload)):
+        value = int(digit) * (2 if position % 2 == 0 else 1)
+        total += value - 9 if value > 9 else value
+    return payload + str((10 - total % 10) % 10)
+
+
+def french_mobile(rng: random.Random) -> str:
+    """Valid French mobile number in E.164 format, as stored by the API."""
+    while True:
+        number = f"+33{rng.choice('67')}{rng.randrange(10 ** 8):08d}"
+        if phonenumbers.is_valid_number(phonenumbers.parse(number)):
+            return number
+
+
+# Text fields are slices of this corpus (much faster than drawing words one by one)
+CORPUS = " ".join(random.Random(0).choices(WORDS, k=40_000))
+
+
+def paragraph(rng: random.Random, median_chars: int, max_chars: int) -> str:
+    """Lorem-ipsum style text with a log-normal length around `median_chars`."""
+    length = max(10, min(max_chars, int(rng.lognormvariate(0, 0.6) * median_chars)))
+    start = CORPUS.find(" ", rng.randrange(len(CORPUS) - max_chars)) + 1
+    return CORPUS[start:start + length].strip().capitalize()
+
+
+class CopyWriter:
+    """CSV buffer of one table, loaded with COPY FROM STDIN."""
+
+    def __init__(self, table: str, columns: List[str], first_id: int) -> None:
+        self.table = table
+        self.columns = columns
+        self.next_id = first_id
+        self.rows = 0
+        self.total = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def add(self, *values) -> int:
+        """
+        Buffer a row (without its id) and return the id assigned to it.
+
+        None is written as NULL, dates and datetimes in their ISO-like str() form
+        and enums must be passed by name (Postgres enum labels).
+        """
+        row_id = self.next_id
+        self.next_id += 1
+        self._writer.writerow((row_id, *values))
+        self.rows += 1
+        return row_id
+
+    def flush(self, cursor) -> None:
+        if not self.rows:
+            return
+        self._buffer.seek(0)
+        cursor.copy_expert(
+            f"COPY {self.table} ({', '.join(self.columns)}) FROM STDIN WITH (FORMAT csv)",
+            self._buffer,
+        )
+        self.total += self.rows
+        self.rows = 0
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+
+class Generator:
+    """Generates tenants into one CopyWriter per table."""
+
+    def __init__(self, args, hashed_password: str, first_ids: dict) -> None:
+        self.args = args
+        self.hashed_password = hashed_password
+        self.writers = {table: CopyWriter(table, columns, first_ids[table]) for table, columns in TABLES.items()}
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.template_dir = Path(settings.DOCUMENTS_PATH) / ".datagen"
+
+    def buffered_rows(self) -> int:
+        return sum(writer.rows for writer in self.writers.values())
+
+    def flush(self, cursor) -> None:
+        for writer in self.writers.values():  # TABLES order: parents first
+            writer.flush(cursor)
+
+    def write_templates(self) -> None:
+        """Write the template file of each local document format."""
+        self.template_dir.mkdir(parents=True, exist_ok=True)
+        for document_format, content in SAMPLE_FILES.items():
+            (self.template_dir / f"template.{document_format.value}").write_bytes(content)
+
+    def _document_file(self, user_dir: Path, document_id: int, document_format: DocumentFormat) -> str:
+        """Create a document file (hard link to the template) and return its path."""
+        path = user_dir / f"datagen-{document_id}.{document_format.value}"
+        template = self.template_dir / f"template.{document_format.value}"
+        path.unlink(missing_ok=True)
+        try:
+            os.link(template, path)
+        except OSError:
+            shutil.copyfile(template, path)
+        return str(path)
+
+    def _created_at(self, rng: random.Random) -> datetime:
+        return self.now - timedelta(seconds=rng.randrange(2 * 365 * 86400))
+
+    def tenant(self, index: int) -> None:
+        """Generate one user and all their data."""
+        args, w = self.args, self.writers
+        rng = random.Random(f"{args.seed}:{index}")
+
+        user_id = w["users"].add(
+            EMAIL_TEMPLATE.format(index), self.hashed_password, rng.choice(FIRST_NAMES),
+            rng.choice(LAST_NAMES), True, self._created_at(rng),
+        )
+
+        company_ids = []
+        for _ in range(args.companies):
+            company_id = w["companies"].next_id
+            company_ids.append(w["companies"].add(
+                f"{rng.choice(LAST_NAMES)} {rng.choice(['Tech', 'Labs', 'Consulting', 'Systems', 'Data'])} {company_id}",
+                siret(company_id) if rng.random() < 0.8 else None,
+                f"https://company-{company_id}.example.com",
+                f"{rng.randint(1, 200)} rue de la Paix, {rng.choice(CITIES)}",
+                rng.random() < 0.2,
+                rng.choice(["ESN", "startup", "enterprise", "SME"]),
+                rng.choice(["Software", "Healthcare", "Finance", "Retail", "Automotive"]),
+                paragraph(rng, 200, 2000) if rng.random() < 0.3 else None,
+                user_id, self._created_at(rng),
+            ))
+
+        contact_ids = []
+        for _ in range(args.contacts):
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            handle = f"{first_name}-{last_name}-{w['contacts'].next_id}".lower()
+            contact_ids.append(w["contacts"].add(
+                last_name, first_name, rng.choice(["Talent Acquisition", "CTO", "Engineering Manager", "Recruiter"]),
+                f"{handle}@example.com",
+                french_mobile(rng) if rng.random() < 0.7 else None,
+                f"https://www.linkedin.com/in/{handle}" if rng.random() < 0.6 else None,
+                paragraph(rng, 80, 500) if rng.random() < 0.4 else None,
+                rng.random() < 0.15,
+                None,
+                rng.choice(company_ids) if company_ids and rng.random() < 0.85 else None,
+                user_id, self._created_at(rng),
+            ))
+
+        product_ids = []
+        if company_ids:
+            for _ in range(args.products):
+                product_ids.append(w["products"].add(
+                    user_id, f"{rng.choice(WORDS).capitalize()} {rng.choice(['Cloud', 'App', 'Platform', 'API'])}",
+                    paragraph(rng, 300, 2000), rng.choice(company_ids),
+                    f"https://product-{w['products'].next_id}.example.com",
+                    ", ".join(rng.sample(WORDS, 4)), self._created_at(rng),
+                ))
+
+        user_dir = Path(settings.DOCUMENTS_PATH) / str(user_id)
+        user_dir.mkdir(parents=True, exist_ok=True)
+        resume_ids, cover_letter_ids, document_ids = [], [], []
+        local_formats = list(SAMPLE_FILES)
+        for n in range(args.documents):
+            document_id = w["documents"].next_id
+            document_type = ("resume", "cover_letter")[n % 2] if n < args.documents // 2 else rng.choice(DOCUMENT_TYPES)
+            if rng.random() < args.external_ratio:
+                document_format, path, is_external = (
+                    DocumentFormat.EXTERNAL, f"https://drive.example.com/file/{document_id}", True
+                )
+            else:
+                document_format = DocumentFormat.PDF if document_type in ("resume", "cover_letter") else rng.choice(local_formats)
+                path, is_external = self._document_file(user_dir, document_id, document_format), False
+            w["documents"].add(
+                f"{document_type.replace('_', ' ').capitalize()} v{n}", document_type, document_format.name, path,
+                paragraph(rng, 60, 500) if rng.random() < 0.3 else None, is_external, user_id, self._created_at(rng),
+            )
+            document_ids.append(document_id)
+            if document_type == "resume":
+                resume_ids.append(document_id)
+            elif document_type == "cover_letter":
+                cover_letter_ids.append(document_id)
+
+        opportunity_ids = []
+        for _ in range(args.opportunities):
+            salary_min = 35000 + 1000 * rng.randint(0, 40)
+            opportunity_ids.append(w["opportunities"].add(
+                rng.choice(JOB_TITLES),
+                rng.choice(APPLICATION_TYPES),
+                rng.choice(company_ids) if company_ids and rng.random() < 0.9 else None,
+                rng.choice(["backend", "frontend", "fullstack", "devops", "data"]),
+                rng.choice(CONTRACT_TYPES),
+                rng.choice(CITIES),
+                f"https://jobs.example.com/{user_id}/{w['opportunities'].next_id}",
+                paragraph(rng, 1500, 5000),
+                paragraph(rng, 250, 5000),
+                ", ".join(rng.sample(WORDS, 6)),
+                salary_min, salary_min + 1000 * rng.randint(0, 20),
+                "13th month, meal vouchers" if rng.random() < 0.3 else None,
+                rng.choice(REMOTE_POLICIES),
+                "2 days per week on-site" if rng.random() < 0.3 else None,
+                rng.choice(["LinkedIn", "Indeed", "Welcome to the Jungle", "Malt", "Referral"]),
+                paragraph(rng, 300, 10000) if rng.random() < 0.5 else None,
+                user_id, self._created_at(rng),
+            ))
+
+        # (document_id, entity_type, entity_id) already associated
+        associations = set()
+
+        def associate(document_id: int, entity_type: EntityType, entity_id: int) -> None:
+            if (document_id, entity_type, entity_id) not in associations:
+                associations.add((document_id, entity_type, entity_id))
+                w["document_associations"].add(document_id, entity_type.name, entity_id, self._created_at(rng))
+
+        statuses, weights = zip(*STATUS_WEIGHTS.items())
+        application_ids = []
+        for opportunity_id in rng.sample(opportunity_ids, min(args.applications, len(opportunity_ids))):
+            created_at = self._created_at(rng)
+            resume_id = rng.choice(resume_ids) if resume_ids and rng.random() < 0.9 else None
+            cover_letter_id = rng.choice(cover_letter_ids) if cover_letter_ids and rng.random() < 0.4 else None
+            application_id = w["applications"].add(
+                user_id, opportunity_id, created_at.date(), rng.choices(statuses, weights)[0].name,
+                45000 + 1000 * rng.randint(0, 30), resume_id, cover_letter_id, rng.random() < 0.1, created_at,
+            )
+            application_ids.append(application_id)
+            for document_id in (resume_id, cover_letter_id):
+                if document_id is not None:
+                    associate(document_id, EntityType.APPLICATION, application_id)
+
+        event_ids = []
+        for _ in range(args.scheduled_events):
+            method = rng.choice(list(CommunicationMethod))
+            event_ids.append(w["scheduled_events"].add(
+                rng.choice(["Technical interview", "HR call", "Culture fit", "Take-home review"]),
+                rng.choice(["interview", "call", "meeting"]),
+                self.now + timedelta(days=rng.randint(-365, 60), hours=rng.randint(8, 18)),
+                rng.choice([30, 45, 60, 90]),
+                method.name,
+                "https://meet.example.com/abc-defg-hij" if method == CommunicationMethod.VIDEO else None,
+                french_mobile(rng) if method == CommunicationMethod.PHONE else None,
+                f"{rng.randint(1, 200)} avenue des Champs, Paris" if method == CommunicationMethod.IN_PERSON else None,
+                "Ask for the hiring manager at reception" if rng.random() < 0.2 else None,
+                rng.choice(EVENT_STATUSES),
+                paragraph(rng, 100, 1000) if rng.random() < 0.3 else None,
+                user_id, self._created_at(rng),
+            ))
+
+        if application_ids:
+            for _ in range(args.actions):
+                w["actions"].add(
+                    user_id, rng.choice(application_ids), rng.choice(ACTION_TYPES),
+                    self._created_at(rng) if rng.random() < 0.8 else None,
+                    paragraph(rng, 120, 1000) if rng.random() < 0.6 else None,
+                    rng.choice(event_ids) if event_ids and rng.random() < 0.2 else None,
+                    self._created_at(rng),
+                )
+
+        if contact_ids:
+            for opportunity_id in rng.sample(opportunity_ids, len(opportunity_ids) // 3):
+                for position, contact_id in enumerate(rng.sample(contact_ids, min(len(contact_ids), rng.randint(1, 3)))):
+                    w["opportunity_contacts"].add(
+                        opportunity_id, contact_id, position == 0, rng.choice(CONTACT_ROLES),
+                        rng.choice(["direct_approach", "recruiter_approach", "spontaneous_application"]),
+                        None, self._created_at(rng),
+                    )
+
+        if product_ids:
+            for opportunity_id in rng.sample(opportunity_ids, len(opportunity_ids) // 5):
+                for product_id in rng.sample(product_ids, min(len(product_ids), rng.randint(1, 2))):
+                    w["opportunity_products"].add(opportunity_id, product_id, self._created_at(rng))
+
+        # Other polymorphic associations (portfolio linked to a company, job posting to an opportunity, ...)
+        targets = [
+            (EntityType.OPPORTUNITY, opportunity_ids),
+            (EntityType.COMPANY, company_ids),
+            (EntityType.CONTACT, contact_ids),
+            (EntityType.APPLICATION, application_ids),
+        ]
+        targets = [(entity_type, ids) for entity_type, ids in targets if ids]
+        if targets:
+            for document_id in document_ids:
+                for _ in range(rng.randint(0, 2 * args.associations)):
+                    entity_type, ids = rng.choice(targets)
+                    associate(document_id, entity_type, rng.choice(ids))
+
+
+def first_ids(conn) -> dict:
+    """Next free id of each table."""
+    return {
+        table: conn.exec_driver_sql(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").scalar()
+        for table in TABLES
+    }
+
+
+def delete_previous_tenants(conn, disable_triggers: bool = False) -> int:
+    """
+    Delete generated users and their document directories.
+
+    Rows of other tables cascade, or are deleted table by table (children first)
+    when triggers are disabled.
+    """
+    user_ids = conn.execute(
+        select(User.id).where(User.email.like(EMAIL_TEMPLATE.format("%")))
+    ).scalars().all()
+    if user_ids:
+        if disable_triggers:
+            conn.exec_driver_sql("SET LOCAL session_replication_role = replica")
+            for table in reversed(TABLES):
+                if table in CHILD_TABLES:
+                    parent_table, fk_column = CHILD_TABLES[table]
+                    conn.exec_driver_sql(
+                        f"DELETE FROM {table} c USING {parent_table} p "
+                        f"WHERE p.id = c.{fk_column} AND p.owner_id = ANY(%(ids)s)",
+                        {"ids": list(user_ids)},
+                    )
+                elif table != "users":
+                    conn.exec_driver_sql(f"DELETE FROM {table} WHERE owner_id = ANY(%(ids)s)", {"ids": list(user_ids)})
+            conn.exec_driver_sql("DELETE FROM change_log WHERE owner_id = ANY(%(ids)s)", {"ids": list(user_ids)})
+            conn.exec_driver_sql("DELETE FROM refresh_tokens WHERE user_id = ANY(%(ids)s)", {"ids": list(user_ids)})
+        conn.execute(delete(User).where(User.id.in_(user_ids)))
+        for user_id in user_ids:
+            shutil.rmtree(Path(settings.DOCUMENTS_PATH) / str(user_id), ignore_errors=True)
+    return len(user_ids)
+
+
+def record_changes(cursor, first_ids: dict) -> None:
+    """Fill the change_log and bump data_version for rows loaded without triggers."""
+    for table in TABLES:
+        if table == "users":
+            continue
+        if table in CHILD_TABLES:
+            parent_table, fk_column = CHILD_TABLES[table]
+            source = f"{table} c JOIN {parent_table} p ON p.id = c.{fk_column}"
+        else:
+            source = f"{table} c JOIN {table} p ON p.id = c.id"
+        cursor.execute(
+            f"INSERT INTO change_log (owner_id, entity_type, entity_id, operation) "
+            f"SELECT p.owner_id, %s, c.id, 'insert' FROM {source} WHERE c.id >= %s ORDER BY c.id",
+            (table, first_ids[table]),
+        )
+    cursor.execute("UPDATE users SET data_version = data_version + 1 WHERE id >= %s", (first_ids["users"],))
+
+
+def generate(args, tenants: Iterable[int]) -> dict:
+    """
+    Generate and load the tenants.
+
+    Args:
+        args: Parsed command line arguments (volumes per tenant)
+        tenants: Tenant numbers to generate
+
+    Returns:
+        Rows loaded per table
+    """
+    hashed_password = get_password_hash(args.password)  # hashed once, Argon2 is slow on purpose
+
+    with engine.begin() as conn:
+        deleted = delete_previous_tenants(conn, args.disable_triggers)
+        if deleted:
+            print(f"Deleted {deleted} previously generated users")
+        ids = first_ids(conn)
+    generator = Generator(args, hashed_password, ids)
+    generator.write_templates()
+
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        if args.disable_triggers:
+            cursor.execute("SET session_replication_role = replica")
+        for index in tenants:
+            generator.tenant(index)
+            if generator.buffered_rows() >= COPY_CHUNK_ROWS:
+                generator.flush(cursor)
+                raw_connection.commit()
+        generator.flush(cursor)
+
+        if args.disable_triggers:
+            cursor.execute("RESET session_replication_role")
+            record_changes(cursor, ids)
+
+        # Move the id sequences past the explicit ids
+        for table in TABLES:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), GREATEST(MAX(id), 1)) FROM {table}"
+            )
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+    return {table: writer.total for table, writer in generator.writers.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10, help="Number of tenants to generate")
+    parser.add_argument("--companies", type=int, default=200, help="Companies per user")
+    parser.add_argument("--contacts", type=int, default=300, help="Contacts per user")
+    parser.add_argument("--products", type=int, default=100, help="Products per user")
+    parser.add_argument("--documents", type=int, default=40, help="Documents per user (MAX_DOCUMENTS_PER_USER applies to uploads)")
+    parser.add_argument("--external-ratio", type=float, default=0.2, help="Fraction of documents that are external links")
+    parser.add_argument("--associations", type=int, default=1, help="Mean extra polymorphic associations per document")
+    parser.add_argument("--opportunities", type=int, default=2000, help="Opportunities per user")
+    parser.add_argument("--applications", type=int, default=2000, help="Applications per user (at most one per opportunity)")
+    parser.add_argument("--scheduled-events", type=int, default=300, help="Scheduled events per user")
+    parser.add_argument("--actions", type=int, default=4000, help="Actions per user")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Password of every generated user")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--disable-triggers", action="store_true",
+        help="Skip triggers and foreign key checks during the load (superuser only, much faster)",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    totals = generate(args, range(1, args.users + 1))
+    elapsed = time.perf_counter() - started
+
+    for table, count in totals.items():
+        print(f"{table:<24} {count:>12,}")
+    print(f"Loaded {sum(totals.values()):,} rows in {elapsed:.1f} s ({sum(totals.values()) / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Load test suite: generate tenants (benchmarks.datagen), then drive a mixed
+workload against a running API (run.py).
+
+Usage (from the backend directory):
+    python -m benchmarks.datagen --users 10
+    python -m benchmarks.loadtest.run --users 20 --duration 60
+
+or the whole stack in Docker: ./run_loadtest.sh (compose.loadtest.yaml).
+"""
+
+EMAIL_TEMPLATE = "loadtest-{}@example.com"
+DEFAULT_PASSWORD = "LoadTest123!"
+
+# Minimal valid PDF (detected as application/pdf by libmagic), seeded and uploaded
+SAMPLE_PDF = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n"
+    b"trailer<</Root 1 0 R>>\n%%EOF\n"
+)
@@ -0,0 +1,284 @@
+"""
+Load test of a running API with a mixed, realistic workload.
+
+Virtual users log in as the tenants created by benchmarks.datagen (user n uses
+tenant n modulo --tenants) and loop over weighted scenarios until --duration
+elapses:
+- list: a page of applications (optionally expanded), opportunities, companies or actions
+- detail: one application, opportunity or company
+- create: an opportunity, or an action on an existing application
+- upload: a small PDF upload (the document is deleted right after)
+- download: a seeded document file
+- login: a fresh password login (Argon2 verification)
+
+Latency percentiles (p50/p95/p99) and throughput are reported per endpoint,
+labelled by route template. Expired access tokens are renewed with a new login.
+The exit code is 1 when the error rate exceeds --max-error-rate.
+
+Usage (from the backend directory):
+    python -m benchmarks.loadtest.run [--base-url http://localhost:8000/api/v1] [--users 20]
+        [--duration 60] [--tenants 10] [--mix list=50,detail=25,create=10,upload=3,download=10,login=2]
+        [--json results.json]
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+from benchmarks.loadtest import DEFAULT_PASSWORD, EMAIL_TEMPLATE, SAMPLE_PDF
+
+DEFAULT_MIX = "list=50,detail=25,create=10,upload=3,download=10,login=2"
+LIST_ENDPOINTS = [
+    "/applications/",
+    "/applications/?expand=opportunity.company",
+    "/opportunities/",
+    "/companies/",
+    "/actions/",
+]
+
+
+class Recorder:
+    """Latency samples and errors per endpoint label."""
+
+    def __init__(self) -> None:
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, label: str, elapsed: float, status_code: int) -> None:
+        self.samples[label].append(elapsed)
+        self.statuses[label][status_code] += 1
+        if status_code >= 400:
+            self.errors[label] += 1
+
+    def error(self, label: str, elapsed: float) -> None:
+        """Record a transport error (timeout, connection reset)."""
+        self.samples[label].append(elapsed)
+        self.statuses[label]["transport_error"] += 1
+        self.errors[label] += 1
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class VirtualUser:
+    """One simulated client, logged in as one tenant."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, email: str, password: str, rng: random.Random):
+        self.client = client
+        self.recorder = recorder
+        self.email = email
+        self.password = password
+        self.rng = rng
+        self.headers = {}
+        self.ids = {"applications": [], "opportunities": [], "companies": [], "documents": []}
+
+    async def request(self, label: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, record its latency under `label`, renew the token on 401."""
+        for attempt in range(2):
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, headers=self.headers, **kwargs)
+            except httpx.HTTPError:
+                self.recorder.error(label, time.perf_counter() - started)
+                return None
+
+            if response.status_code == 401 and attempt == 0 and label != "POST /auth/login":
+                await self.login()
+                continue
+            self.recorder.record(label, time.perf_counter() - started, response.status_code)
+            return response
+
+    async def login(self) -> None:
+        self.headers = {}
+        response = await self.request(
+            "POST /auth/login", "POST", "/auth/login",
+            data={"username": self.email, "password": self.password},
+        )
+        if response is None or response.status_code != 200:
+            raise RuntimeError(f"Login failed for {self.email} (was the database seeded?)")
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def start(self) -> None:
+        """Log in and collect entity ids used by the detail/create/download scenarios."""
+        await self.login()
+        for name in self.ids:
+            response = await self.request(f"GET /{name}/", "GET", f"/{name}/", params={"limit": 100})
+            if response is not None and response.status_code == 200:
+                # Only local documents can be downloaded
+                self.ids[name] = [item["id"] for item in response.json() if not item.get("is_external")]
+
+    async def scenario_list(self) -> None:
+        endpoint = self.rng.choice(LIST_ENDPOINTS)
+        path, _, query = endpoint.partition("?")
+        params = dict(pair.split("=") for pair in query.split("&")) if query else {}
+        params.update(skip=self.rng.choice([0, 0, 0, 100, 500]), limit=100)
+        await self.request(f"GET {endpoint}", "GET", path, params=params)
+
+    async def scenario_detail(self) -> None:
+        name = self.rng.choice(["applications", "opportunities", "companies"])
+        if self.ids[name]:
+            entity_id = self.rng.choice(self.ids[name])
+            await self.request(f"GET /{name}/{{id}}", "GET", f"/{name}/{entity_id}")
+
+    async def scenario_create(self) -> None:
+        if self.rng.random() < 0.5 or not self.ids["applications"]:
+            await self.request("POST /opportunities/", "POST", "/opportunities/", json={
+                "job_title": f"Load test position {self.rng.randint(1, 10 ** 6)}",
+                "application_type": "job_posting",
+                "company_id": self.rng.choice(self.ids["companies"]) if self.ids["companies"] else None,
+                "job_description": "Python, FastAPI, PostgreSQL. " * 20,
+            })
+        else:
+            await self.request("POST /actions/", "POST", "/actions/", json={
+                "application_id": self.rng.choice(self.ids["applications"]),
+                "type": "follow_up",
+                "notes": "Sent a follow-up email.",
+            })
+
+    async def scenario_upload(self) -> None:
+        response = await self.request(
+            "POST /documents/upload", "POST", "/documents/upload",
+            data={"name": "Load test resume", "type": "resume"},
+            files={"file": ("resume.pdf", SAMPLE_PDF, "application/pdf")},
+        )
+        # Delete it again, so that long runs stay under the per-user document quota
+        if response is not None and response.status_code == 201:
+            document_id = response.json()["id"]
+            await self.request("DELETE /documents/{id}", "DELETE", f"/documents/{document_id}")
+
+    async def scenario_download(self) -> None:
+        if self.ids["documents"]:
+            document_id = self.rng.choice(self.ids["documents"])
+            await self.request("GET /documents/{id}/download", "GET", f"/documents/{document_id}/download")
+
+    async def scenario_login(self) -> None:
+        await self.login()
+
+    async def run(self, deadline: float, scenarios: list, weights: list, think_time: float) -> None:
+        while time.perf_counter() < deadline:
+            scenario = self.rng.choices(scenarios, weights)[0]
+            await getattr(self, f"scenario_{scenario}")()
+            if think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / think_time))
+
+
+def parse_mix(mix: str) -> dict:
+    """Parse "list=50,detail=25" into {"list": 50, "detail": 25}."""
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if not hasattr(VirtualUser, f"scenario_{name.strip()}"):
+            raise SystemExit(f"Unknown scenario in --mix: {name!r}")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def report(recorder: Recorder, elapsed: float) -> dict:
+    """Print the latency table and return it as a dict."""
+    rows = {}
+    for label in sorted(recorder.samples):
+        values = sorted(recorder.samples[label])
+        rows[label] = {
+            "requests": len(values),
+            "errors": recorder.errors[label],
+            "throughput_rps": len(values) / elapsed,
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p95_ms": percentile(values, 0.95) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+            "max_ms": values[-1] * 1000,
+            "statuses": {str(code): count for code, count in recorder.statuses[label].items()},
+        }
+
+    print(f"\n{'endpoint':<46} {'reqs':>7} {'err':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for label, row in rows.items():
+        print(
+            f"{label:<46} {row['requests']:>7} {row['errors']:>5} {row['throughput_rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+
+    all_values = sorted(value for values in recorder.samples.values() for value in values)
+    total = {
+        "requests": len(all_values),
+        "errors": sum(recorder.errors.values()),
+        "throughput_rps": len(all_values) / elapsed,
+        "p50_ms": percentile(all_values, 0.50) * 1000,
+        "p95_ms": percentile(all_values, 0.95) * 1000,
+        "p99_ms": percentile(all_values, 0.99) * 1000,
+    }
+    print(
+        f"\n{total['requests']} requests in {elapsed:.1f} s ({total['throughput_rps']:.1f} req/s), "
+        f"{total['errors']} errors, p50 {total['p50_ms']:.1f} ms, p95 {total['p95_ms']:.1f} ms, p99 {total['p99_ms']:.1f} ms"
+    )
+    return {"duration_s": elapsed, "total": total, "endpoints": rows}
+
+
+async def run(args) -> dict:
+    weights = parse_mix(args.mix)
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        users = [
+            VirtualUser(
+                client, recorder, EMAIL_TEMPLATE.format(n % args.tenants + 1), args.password,
+                random.Random(rng.random()),
+            )
+            for n in range(args.users)
+        ]
+        # Warm-up (logins and id collection) is not part of the measurement
+        await asyncio.gather(*(user.start() for user in users))
+        recorder = Recorder()
+        for user in users:
+            user.recorder = recorder
+
+        print(f"Running {args.users} virtual users for {args.duration} s against {args.base_url}")
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            user.run(deadline, list(weights), list(weights.values()), args.think_time) for user in users
+        ))
+        return report(recorder, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1", help="API base URL")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Measured duration in seconds")
+    parser.add_argument("--tenants", type=int, default=10, help="Number of seeded tenants to log in as")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Password of the seeded tenants")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Scenario weights")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between requests of a user (seconds)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the scenario choices")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Fail (exit 1) above this error rate")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(result, indent=2))
+
+    total = result["total"]
+    if total["requests"] and total["errors"] / total["requests"] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
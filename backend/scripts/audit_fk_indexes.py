@@ -0,0 +1,51 @@
+"""
+Audit foreign key columns lacking an index.
+
+Checks the models (Base.metadata) and, with --database, the live database
+(DATABASE_URL). Exits with status 1 when an unindexed foreign key is found,
+so it can run in CI.
+
+Usage:
+    python scripts/audit_fk_indexes.py [--database]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to python path to allow imports from app
+# Assuming script is in backend/scripts/
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(backend_dir))
+
+from app.database import Base, engine
+import app.models  # noqa: F401 (registers the models on Base.metadata)
+from app.utils.db.index_audit import find_unindexed_foreign_keys, find_unindexed_foreign_keys_in_database
+
+
+def report(label: str, missing: list) -> None:
+    if not missing:
+        print(f"✅ {label}: every foreign key is indexed.")
+        return
+    print(f"❌ {label}: {len(missing)} unindexed foreign key(s):")
+    for fk in missing:
+        print(f"   - {fk}  (suggested: {fk.suggested_index})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", action="store_true", help="Also audit the database at DATABASE_URL")
+    args = parser.parse_args()
+
+    missing = find_unindexed_foreign_keys(Base.metadata)
+    report("Models", missing)
+
+    if args.database:
+        database_missing = find_unindexed_foreign_keys_in_database(engine)
+        report("Database", database_missing)
+        missing += database_missing
+
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import time
 import os
 import uuid
 import psycopg2
+import re
 from urllib.parse import urlparse
 
 # Configuration
@@ -134,3 +135,25 @@ def second_user_headers(api_url):
         "Content-Type": "application/json",
         "Authorization": f"Bearer {token}"
     }
+
+@pytest.fixture(scope="session")
+def query_count():
+    """
+    Return a function reading the number of SQL statements a request ran
+    (from the Server-Timing header added by QueryStatsMiddleware).
+    """
+    def _query_count(response):
+        server_timing = response.headers.get("Server-Timing", "")
+        match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', server_timing)
+        assert match, f"No query count in Server-Timing header: {server_timing!r}"
+        return int(match.group(1))
+
+    return _query_count
+
+@pytest.fixture(scope="function")
+def db_connection():
+    """Direct (autocommit) connection to the test database, for schema and plan checks."""
+    conn = psycopg2.connect(DB_DSN)
+    conn.autocommit = True
+    yield conn
+    conn.close()
@@ -0,0 +1,125 @@
+"""
+Tests for Application list shaping (expand / fields query parameters), conditional GET
+and updates of their actions.
+"""
+import requests
+
+
+def _create_application(api_url, headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Expand Corp"}, headers=headers).json()['id']
+    opp_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Expand Job",
+        "application_type": "job_posting",
+        "company_id": company_id
+    }, headers=headers).json()['id']
+    doc_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Expand CV",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/expand-cv.pdf",
+        "is_external": True
+    }, headers=headers).json()['id']
+
+    response = requests.post(f"{api_url}/applications/", json={
+        "opportunity_id": opp_id,
+        "application_date": "2025-02-01",
+        "resume_used_id": doc_id
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_list_applications_ids_only_by_default(api_url, auth_headers):
+    created = _create_application(api_url, auth_headers)
+
+    response = requests.get(f"{api_url}/applications/", headers=auth_headers)
+    assert response.status_code == 200
+    item = response.json()[0]
+
+    assert item["opportunity_id"] == created["opportunity_id"]
+    assert item["resume_used_id"] == created["resume_used_id"]
+    assert item["opportunity"] is None
+    assert item["resume_used"] is None
+
+
+def test_list_applications_expand(api_url, auth_headers):
+    _create_application(api_url, auth_headers)
+
+    response = requests.get(
+        f"{api_url}/applications/",
+        params={"expand": "opportunity.company,resume_used"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    item = response.json()[0]
+
+    assert item["opportunity"]["job_title"] == "Expand Job"
+    assert item["opportunity"]["company"]["name"] == "Expand Corp"
+    assert item["resume_used"]["name"] == "Expand CV"
+    assert item["cover_letter"] is None
+
+    # Expanding the opportunity alone leaves its company out
+    response = requests.get(f"{api_url}/applications/?expand=opportunity", headers=auth_headers)
+    item = response.json()[0]
+    assert item["opportunity"]["job_title"] == "Expand Job"
+    assert item["opportunity"]["company"] is None
+
+    # Unknown relationships are rejected
+    response = requests.get(f"{api_url}/applications/?expand=owner", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_list_applications_fields_with_expand(api_url, auth_headers):
+    _create_application(api_url, auth_headers)
+
+    response = requests.get(
+        f"{api_url}/applications/",
+        params={"fields": "status,opportunity", "expand": "opportunity"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    item = response.json()[0]
+    assert set(item.keys()) == {"id", "status", "opportunity"}
+    assert item["opportunity"]["job_title"] == "Expand Job"
+
+
+def test_list_applications_conditional_get(api_url, auth_headers, second_user_headers):
+    created = _create_application(api_url, auth_headers)
+
+    first = requests.get(f"{api_url}/applications/", headers=auth_headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # Unchanged data: 304 without body
+    cached = requests.get(f"{api_url}/applications/", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # Another user's writes do not invalidate the tag
+    requests.post(f"{api_url}/companies/", json={"name": "Other Corp"}, headers=second_user_headers)
+    assert requests.get(f"{api_url}/applications/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    # Any write to the user's data (here a related company) changes the tag
+    company_id = requests.get(f"{api_url}/opportunities/{created['opportunity_id']}", headers=auth_headers).json()["company_id"]
+    requests.put(f"{api_url}/companies/{company_id}", json={"name": "Renamed Corp"}, headers=auth_headers)
+    refreshed = requests.get(f"{api_url}/applications/", headers={**auth_headers, "If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_update_other_user_action_reports_action_first(api_url, auth_headers, second_user_headers):
+    """The action's own 404 comes before the checks of the referenced entities."""
+    application_id = _create_application(api_url, auth_headers)["id"]
+    action_id = requests.post(f"{api_url}/actions/", json={
+        "application_id": application_id,
+        "type": "follow_up"
+    }, headers=auth_headers).json()['id']
+
+    for payload in ({"application_id": 99999}, {"scheduled_event_id": 99999}, {"application_id": application_id}):
+        response = requests.put(f"{api_url}/actions/{action_id}", json=payload, headers=second_user_headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Action not found"
+
+    response = requests.put(f"{api_url}/actions/99999", json={"application_id": application_id}, headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Action not found"
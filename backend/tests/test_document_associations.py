@@ -186,3 +186,240 @@ def test_list_documents_by_entity(api_url, auth_headers):
     assert len(associations) == 3
     retrieved_doc_ids = {a["document_id"] for a in associations}
     assert retrieved_doc_ids == set(doc_ids)
+
+
+def test_delete_opportunity_cascades_to_application_associations(api_url, auth_headers):
+    """Test that deleting an opportunity removes its applications, actions and their associations."""
+
+    # Create Opportunity
+    opp_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Cascade Job",
+        "application_type": "spontaneous"
+    }, headers=auth_headers).json()['id']
+
+    # Create Document
+    doc_resp = requests.post(f"{api_url}/documents/", json={
+        "name": "Cascade CV",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/cascade-cv.pdf",
+        "is_external": True
+    }, headers=auth_headers)
+    assert doc_resp.status_code == 201
+    document_id = doc_resp.json()['id']
+
+    # Create Application (auto-creates the resume association) and an Action
+    app_resp = requests.post(f"{api_url}/applications/", json={
+        "opportunity_id": opp_id,
+        "application_date": "2025-01-15",
+        "resume_used_id": document_id
+    }, headers=auth_headers)
+    assert app_resp.status_code == 201
+    app_id = app_resp.json()['id']
+
+    action_resp = requests.post(f"{api_url}/actions/", json={
+        "application_id": app_id,
+        "type": "follow_up"
+    }, headers=auth_headers)
+    assert action_resp.status_code == 201
+    action_id = action_resp.json()['id']
+
+    assoc_list = requests.get(
+        f"{api_url}/document-associations/",
+        params={"document_id": document_id},
+        headers=auth_headers
+    ).json()
+    assert len(assoc_list) == 1
+
+    # Delete Opportunity
+    delete_resp = requests.delete(f"{api_url}/opportunities/{opp_id}", headers=auth_headers)
+    assert delete_resp.status_code == 204
+
+    # Verify children and polymorphic associations are gone, document is kept
+    assert requests.get(f"{api_url}/applications/{app_id}", headers=auth_headers).status_code == 404
+    assert requests.get(f"{api_url}/actions/{action_id}", headers=auth_headers).status_code == 404
+    assert requests.get(f"{api_url}/documents/{document_id}", headers=auth_headers).status_code == 200
+
+    assoc_list = requests.get(
+        f"{api_url}/document-associations/",
+        params={"document_id": document_id},
+        headers=auth_headers
+    ).json()
+    assert assoc_list == []
+
+
+def test_duplicate_document_association_rejected(api_url, auth_headers):
+    """A document can only be associated once with the same entity."""
+    company_id = requests.post(
+        f"{api_url}/companies/", json={"name": "Unique Corp"}, headers=auth_headers
+    ).json()['id']
+    doc_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Unique Doc",
+        "type": "other",
+        "format": "external",
+        "path": "https://example.com/unique.pdf",
+        "is_external": True
+    }, headers=auth_headers).json()['id']
+
+    payload = {"document_id": doc_id, "entity_type": "company", "entity_id": company_id}
+    assert requests.post(f"{api_url}/document-associations/", json=payload, headers=auth_headers).status_code == 201
+
+    dup_resp = requests.post(f"{api_url}/document-associations/", json=payload, headers=auth_headers)
+    assert dup_resp.status_code == 400
+    assert "already associated" in dup_resp.json()["detail"]
+
+
+def test_application_document_associations_are_not_duplicated(api_url, auth_headers):
+    """Re-sending the same resume/cover letter keeps a single association each."""
+    opp_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Upsert Job",
+        "application_type": "spontaneous"
+    }, headers=auth_headers).json()['id']
+    doc_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Upsert CV",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/upsert.pdf",
+        "is_external": True
+    }, headers=auth_headers).json()['id']
+
+    # Same document as resume and cover letter: the second upsert hits the conflict
+    app_resp = requests.post(f"{api_url}/applications/", json={
+        "opportunity_id": opp_id,
+        "application_date": "2026-01-15",
+        "resume_used_id": doc_id,
+        "cover_letter_id": doc_id
+    }, headers=auth_headers)
+    assert app_resp.status_code == 201
+    app_id = app_resp.json()['id']
+
+    update_resp = requests.put(
+        f"{api_url}/applications/{app_id}",
+        json={"resume_used_id": doc_id},
+        headers=auth_headers
+    )
+    assert update_resp.status_code == 200
+
+    list_resp = requests.get(
+        f"{api_url}/document-associations/",
+        params={"entity_type": "application", "entity_id": app_id},
+        headers=auth_headers
+    )
+    assert list_resp.status_code == 200
+    assert [a["document_id"] for a in list_resp.json()] == [doc_id]
+
+
+def test_application_with_foreign_document_returns_404(api_url, auth_headers, second_user_headers):
+    """The upsert only links documents owned by the current user."""
+    opp_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Foreign Doc Job",
+        "application_type": "spontaneous"
+    }, headers=auth_headers).json()['id']
+    foreign_doc_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Someone else's CV",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/foreign.pdf",
+        "is_external": True
+    }, headers=second_user_headers).json()['id']
+
+    resp = requests.post(f"{api_url}/applications/", json={
+        "opportunity_id": opp_id,
+        "application_date": "2026-01-15",
+        "resume_used_id": foreign_doc_id
+    }, headers=auth_headers)
+    assert resp.status_code == 404
+
+
+def test_get_entity_documents(api_url, auth_headers, second_user_headers):
+    """GET /{entity}/{id}/documents lists the documents attached to the entity."""
+    company_id = requests.post(
+        f"{api_url}/companies/", json={"name": "Attached Corp"}, headers=auth_headers
+    ).json()['id']
+    doc_ids = []
+    for i in range(2):
+        doc_ids.append(requests.post(f"{api_url}/documents/", json={
+            "name": f"Attached {i}",
+            "type": "other",
+            "format": "external",
+            "path": f"https://example.com/attached{i}.pdf",
+            "is_external": True
+        }, headers=auth_headers).json()['id'])
+        requests.post(f"{api_url}/document-associations/", json={
+            "document_id": doc_ids[-1], "entity_type": "company", "entity_id": company_id
+        }, headers=auth_headers)
+
+    resp = requests.get(f"{api_url}/companies/{company_id}/documents", headers=auth_headers)
+    assert resp.status_code == 200
+    assert [d["id"] for d in resp.json()] == doc_ids
+
+    # Other entity types expose the same route
+    opp_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "No Doc Job", "application_type": "spontaneous"
+    }, headers=auth_headers).json()['id']
+    assert requests.get(f"{api_url}/opportunities/{opp_id}/documents", headers=auth_headers).json() == []
+
+    # Not owned
+    resp = requests.get(f"{api_url}/companies/{company_id}/documents", headers=second_user_headers)
+    assert resp.status_code == 404
+
+
+def test_document_association_counts(api_url, auth_headers, second_user_headers, query_count):
+    """POST /document-associations/counts returns counts and summaries per entity."""
+    company_id = requests.post(
+        f"{api_url}/companies/", json={"name": "Counted Corp"}, headers=auth_headers
+    ).json()['id']
+    contact_id = requests.post(f"{api_url}/contacts/", json={
+        "first_name": "Counted", "last_name": "Contact"
+    }, headers=auth_headers).json()['id']
+    doc_ids = []
+    for i in range(3):
+        doc_ids.append(requests.post(f"{api_url}/documents/", json={
+            "name": f"Counted {i}",
+            "type": "resume",
+            "format": "external",
+            "path": f"https://example.com/counted{i}.pdf",
+            "is_external": True
+        }, headers=auth_headers).json()['id'])
+    for doc_id in doc_ids:
+        requests.post(f"{api_url}/document-associations/", json={
+            "document_id": doc_id, "entity_type": "company", "entity_id": company_id
+        }, headers=auth_headers)
+    requests.post(f"{api_url}/document-associations/", json={
+        "document_id": doc_ids[0], "entity_type": "contact", "entity_id": contact_id
+    }, headers=auth_headers)
+
+    entities = [
+        {"entity_type": "contact", "entity_id": contact_id},
+        {"entity_type": "company", "entity_id": company_id},
+        {"entity_type": "application", "entity_id": 999999},
+        {"entity_type": "company", "entity_id": company_id},  # duplicate, returned once
+    ]
+    resp = requests.post(f"{api_url}/document-associations/counts", json={"entities": entities}, headers=auth_headers)
+    assert resp.status_code == 200
+    assert query_count(resp) == 2  # auth + one query for all entities
+    data = resp.json()
+
+    assert [(item["entity_type"], item["entity_id"], item["count"]) for item in data] == [
+        ("contact", contact_id, 1),
+        ("company", company_id, 3),
+        ("application", 999999, 0),
+    ]
+    assert [d["id"] for d in data[1]["documents"]] == doc_ids
+    assert data[0]["documents"][0] == {
+        "id": doc_ids[0], "name": "Counted 0", "type": "resume", "format": "external", "is_external": True
+    }
+
+    # Another user sees no documents on these entities
+    resp = requests.post(f"{api_url}/document-associations/counts", json={"entities": entities}, headers=second_user_headers)
+    assert [item["count"] for item in resp.json()] == [0, 0, 0]
+
+    # Empty and oversized batches are rejected
+    assert requests.post(
+        f"{api_url}/document-associations/counts", json={"entities": []}, headers=auth_headers
+    ).status_code == 422
+    assert requests.post(
+        f"{api_url}/document-associations/counts",
+        json={"entities": [{"entity_type": "company", "entity_id": i} for i in range(1, 102)]},
+        headers=auth_headers
+    ).status_code == 422
@@ -127,6 +127,7 @@ def test_download_local_document(api_url, auth_headers):
     assert download_resp.status_code == 200
     assert download_resp.headers['Content-Type'] == 'application/pdf'
     assert 'Content-Disposition' in download_resp.headers
+    assert 'Content-Encoding' not in download_resp.headers  # PDFs are never re-compressed
     assert len(download_resp.content) > 0
 
 
@@ -0,0 +1,28 @@
+"""
+Tests for the server-sent events change stream.
+"""
+import json
+import requests
+
+
+def test_change_stream_receives_committed_writes(api_url, auth_headers, second_user_headers):
+    with requests.get(f"{api_url}/events/stream", headers=auth_headers, stream=True, timeout=10) as stream:
+        assert stream.status_code == 200
+        assert stream.headers["Content-Type"].startswith("text/event-stream")
+        lines = stream.iter_lines(decode_unicode=True)
+        assert next(lines).startswith("retry:")  # subscribed
+
+        # Another user's write must not be delivered
+        requests.post(f"{api_url}/companies/", json={"name": "Hidden Corp"}, headers=second_user_headers)
+        company_id = requests.post(f"{api_url}/companies/", json={"name": "Live Corp"}, headers=auth_headers).json()['id']
+
+        event_lines = []
+        for line in lines:
+            if line.startswith("data:"):
+                event_lines.append(line)
+                break
+            event_lines.append(line)
+
+    assert "event: change" in event_lines
+    change = json.loads(event_lines[-1].removeprefix("data: "))
+    assert change == {"entity_type": "companies", "entity_id": company_id, "operation": "insert"}
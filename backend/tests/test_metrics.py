@@ -0,0 +1,26 @@
+"""
+Tests for the Prometheus /metrics endpoint.
+"""
+import requests
+
+
+def test_metrics_expose_route_latency_and_db_stats(api_url, auth_headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Metrics Corp"}, headers=auth_headers).json()['id']
+    for _ in range(2):
+        requests.get(f"{api_url}/companies/{company_id}", headers=auth_headers)
+
+    response = requests.get(api_url.replace("/api/v1", "/metrics"))
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain")
+    body = response.text
+
+    # Latency is labelled by route template, not by concrete path
+    assert 'route="/api/v1/companies/{company_id}"' in body
+    assert f'route="/api/v1/companies/{company_id}"' not in body
+    assert "http_requests_in_progress" in body
+    assert "db_pool_connections_checked_out" in body
+    assert "db_statements_total" in body
+    # Statements repeated across requests are compiled once
+    assert 'db_compiled_cache_total{result="hit"}' in body
+    assert 'owned_entity_statement_cache_total{result="hit"}' in body
+    assert "argon2_operations_in_progress" in body
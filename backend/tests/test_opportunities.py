@@ -27,3 +27,68 @@ def test_opportunity_isolation(api_url, auth_headers, second_user_headers):
     opp_id = opp_resp.json()['id']
 
     assert requests.get(f"{api_url}/opportunities/{opp_id}", headers=second_user_headers).status_code == 404
+
+def test_opportunities_sparse_fieldset(api_url, auth_headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Sparse Corp"}, headers=auth_headers).json()['id']
+    requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Sparse Job",
+        "application_type": "job_posting",
+        "company_id": company_id,
+        "job_description": "A very long description" * 50
+    }, headers=auth_headers)
+
+    response = requests.get(f"{api_url}/opportunities/?fields=job_title,company", headers=auth_headers)
+    assert response.status_code == 200
+    item = response.json()[0]
+    assert set(item.keys()) == {"id", "job_title", "company"}
+    assert item["job_title"] == "Sparse Job"
+    assert item["company"]["name"] == "Sparse Corp"
+
+    # Unknown fields are rejected
+    response = requests.get(f"{api_url}/opportunities/?fields=job_title,password", headers=auth_headers)
+    assert response.status_code == 400
+
+def test_opportunities_list_is_compressed(api_url, auth_headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Gzip Corp"}, headers=auth_headers).json()['id']
+    requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Compressed Job",
+        "application_type": "job_posting",
+        "company_id": company_id,
+        "job_description": "A very long description" * 100
+    }, headers=auth_headers)
+
+    response = requests.get(f"{api_url}/opportunities/", headers={**auth_headers, "Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json()[0]["job_title"] == "Compressed Job"
+
+def test_opportunities_list_embeds_company(api_url, auth_headers, second_user_headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Embed Corp"}, headers=auth_headers).json()['id']
+    requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "With Company",
+        "application_type": "job_posting",
+        "company_id": company_id,
+        "contract_type": "permanent"
+    }, headers=auth_headers)
+    requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Without Company",
+        "application_type": "spontaneous"
+    }, headers=auth_headers)
+
+    response = requests.get(f"{api_url}/opportunities/", headers=auth_headers)
+    assert response.status_code == 200
+    items = {item["job_title"]: item for item in response.json()}
+    assert items["With Company"]["company"]["name"] == "Embed Corp"
+    assert items["With Company"]["contract_type"] == "permanent"
+    assert items["With Company"]["created_at"] is not None
+    assert items["Without Company"]["company"] is None
+
+    # Filters apply to the same query
+    response = requests.get(f"{api_url}/opportunities/?application_type=spontaneous", headers=auth_headers)
+    assert [item["job_title"] for item in response.json()] == ["Without Company"]
+    response = requests.get(f"{api_url}/opportunities/?company_id={company_id}", headers=auth_headers)
+    assert [item["job_title"] for item in response.json()] == ["With Company"]
+
+    assert requests.get(f"{api_url}/opportunities/", headers=second_user_headers).json() == []
@@ -44,3 +44,19 @@ def test_create_product_other_user_company(api_url, auth_headers, second_user_he
     }, headers=second_user_headers)
 
     assert response.status_code == 404  # Validation should prevent this
+
+def test_update_other_user_product_reports_product_first(api_url, auth_headers, second_user_headers):
+    """The product's own 404 comes before the check of the referenced company."""
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Owner Corp"}, headers=auth_headers).json()['id']
+    prod_id = requests.post(f"{api_url}/products/", json={"name": "Owned", "company_id": company_id}, headers=auth_headers).json()['id']
+    intruder_company_id = requests.post(f"{api_url}/companies/", json={"name": "Intruder Corp"}, headers=second_user_headers).json()['id']
+
+    for product, company in ((prod_id, 99999), (prod_id, intruder_company_id), (99999, company_id)):
+        response = requests.put(f"{api_url}/products/{product}", json={"company_id": company}, headers=second_user_headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Product not found"
+
+    # The owner still gets the company's 404
+    response = requests.put(f"{api_url}/products/{prod_id}", json={"company_id": intruder_company_id}, headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] != "Product not found"
@@ -0,0 +1,82 @@
+"""
+Unit tests for on-demand request profiling (X-Profile / X-Profile-Token).
+
+Runs a small in-process app: the sync endpoint below executes in the threadpool,
+like the API's endpoints.
+"""
+import time
+
+import anyio.to_thread
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import ProfilingMiddleware, instrument_routes
+
+pytestmark = pytest.mark.unit
+
+ADMIN_TOKEN = "profiling-test-token"
+
+
+def busy_dependency():
+    time.sleep(0.02)
+    return 1
+
+
+def busy_endpoint(value: int = Depends(busy_dependency)):
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return {"value": value}
+
+
+@pytest.fixture
+def client(tmp_path):
+    original_run_sync = anyio.to_thread.run_sync
+    app = FastAPI()
+    app.get("/busy")(busy_endpoint)
+    app.add_middleware(ProfilingMiddleware, admin_token=ADMIN_TOKEN, output_dir=str(tmp_path))
+    instrument_routes(app)
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    # Profiling must not replace library functions
+    assert anyio.to_thread.run_sync is original_run_sync
+
+
+def test_request_without_header_is_not_profiled(client):
+    response = client.get("/busy")
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert "X-Profile-Breakdown" not in response.headers
+    assert "X-Profile-Report" not in response.headers
+
+
+def test_wrong_token_is_rejected(client):
+    response = client.get("/busy", headers={"X-Profile": "html", "X-Profile-Token": "wrong"})
+    assert response.status_code == 403
+
+    response = client.get("/busy", headers={"X-Profile": "html"})
+    assert response.status_code == 403
+
+
+def test_html_profile_samples_the_threadpool(client):
+    response = client.get("/busy", headers={"X-Profile": "html", "X-Profile-Token": ADMIN_TOKEN})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/html")
+    # The endpoint and its dependency ran in worker threads, and were sampled there
+    assert "busy_endpoint" in response.text
+    assert "busy_dependency" in response.text
+    breakdown = dict(item.split("=") for item in response.headers["X-Profile-Breakdown"].split(", "))
+    assert float(breakdown["other"].removesuffix("ms")) >= 40
+
+
+def test_stored_profile_keeps_the_response(client, tmp_path):
+    response = client.get("/busy", headers={"X-Profile": "store", "X-Profile-Token": ADMIN_TOKEN})
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert (tmp_path / response.headers["X-Profile-Report"]).is_file()
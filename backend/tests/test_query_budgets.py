@@ -0,0 +1,185 @@
+"""
+Query budgets: maximum number of SQL statements per endpoint.
+
+Budgets do not depend on the number of rows, so exceeding one usually means
+an N+1 regression (a lazy load or a query per row).
+"""
+import pytest
+import requests
+
+# Authentication costs 1 statement (user lookup) on every request
+LIST_BUDGETS = {
+    "applications/": 2,
+    # Expanded relationships are joined in the same query
+    "applications/?expand=opportunity.company,resume_used,cover_letter": 2,
+    "opportunities/": 2,
+    "companies/": 2,
+    "contacts/": 2,
+    "products/": 2,
+    "documents/": 2,
+    "scheduled-events/": 2,
+    "actions/": 2,
+    "opportunity-contacts/": 2,
+    "opportunity-products/": 2,
+    # + 1 statement per entity type present (applications here)
+    "document-associations/": 3,
+}
+
+
+@pytest.fixture(scope="function")
+def populated_account(api_url, auth_headers):
+    """Create several applications with their opportunity, company and resume."""
+    document_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Budget CV",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/budget-cv.pdf",
+        "is_external": True
+    }, headers=auth_headers).json()['id']
+
+    application_ids = []
+    for i in range(5):
+        company_id = requests.post(f"{api_url}/companies/", json={"name": f"Budget Corp {i}"}, headers=auth_headers).json()['id']
+        opportunity_id = requests.post(f"{api_url}/opportunities/", json={
+            "job_title": f"Budget Job {i}",
+            "application_type": "job_posting",
+            "company_id": company_id
+        }, headers=auth_headers).json()['id']
+        application_ids.append(requests.post(f"{api_url}/applications/", json={
+            "opportunity_id": opportunity_id,
+            "application_date": "2025-03-01",
+            "resume_used_id": document_id
+        }, headers=auth_headers).json()['id'])
+
+    return {"document_id": document_id, "application_ids": application_ids}
+
+
+@pytest.mark.parametrize("path,budget", LIST_BUDGETS.items())
+def test_list_endpoint_query_budget(api_url, auth_headers, populated_account, query_count, path, budget):
+    response = requests.get(f"{api_url}/{path}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert query_count(response) <= budget, f"GET {path} ran {query_count(response)} queries (budget {budget})"
+
+
+def test_update_application_query_budget(api_url, auth_headers, populated_account, query_count):
+    application_id = populated_account["application_ids"][0]
+    new_document_id = requests.post(f"{api_url}/documents/", json={
+        "name": "Budget CV v2",
+        "type": "resume",
+        "format": "external",
+        "path": "https://example.com/budget-cv-v2.pdf",
+        "is_external": True
+    }, headers=auth_headers).json()['id']
+
+    response = requests.put(f"{api_url}/applications/{application_id}", json={
+        "resume_used_id": new_document_id
+    }, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert query_count(response) <= 12
+
+
+def test_document_associations_query_budget_all_entity_types(api_url, auth_headers, populated_account, query_count):
+    """Each entity type is loaded once, with the objects nested in its schema."""
+    document_id = populated_account["document_id"]
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Linked Corp"}, headers=auth_headers).json()['id']
+    opportunity_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Linked Job",
+        "application_type": "job_posting",
+        "company_id": company_id
+    }, headers=auth_headers).json()['id']
+    contact_id = requests.post(f"{api_url}/contacts/", json={
+        "first_name": "Linked",
+        "last_name": "Contact",
+        "company_id": company_id
+    }, headers=auth_headers).json()['id']
+    for entity_type, entity_id in [("company", company_id), ("opportunity", opportunity_id), ("contact", contact_id)]:
+        assert requests.post(f"{api_url}/document-associations/", json={
+            "document_id": document_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id
+        }, headers=auth_headers).status_code == 201
+
+    response = requests.get(f"{api_url}/document-associations/", headers=auth_headers)
+
+    assert response.status_code == 200
+    # auth + associations + one per entity type
+    assert query_count(response) <= 6, f"GET document-associations/ ran {query_count(response)} queries (budget 6)"
+
+    entities = {(a["entity_type"], a["entity_id"]): a["entity"] for a in response.json()}
+    assert len(entities) == 8
+    for application_id in populated_account["application_ids"]:
+        application = entities[("application", application_id)]
+        assert application["opportunity"]["company"]["name"].startswith("Budget Corp")
+        assert application["resume_used"]["id"] == document_id
+    assert entities[("opportunity", opportunity_id)]["company"]["id"] == company_id
+    assert entities[("contact", contact_id)]["company"]["id"] == company_id
+    assert entities[("company", company_id)]["name"] == "Linked Corp"
+
+
+def test_update_and_delete_query_budget(api_url, auth_headers, query_count):
+    """Ownership check and write share one UPDATE/DELETE ... RETURNING statement."""
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Write Corp"}, headers=auth_headers).json()['id']
+    opportunity_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Write Job",
+        "application_type": "job_posting"
+    }, headers=auth_headers).json()['id']
+    contact_id = requests.post(f"{api_url}/contacts/", json={
+        "first_name": "Write", "last_name": "Contact"
+    }, headers=auth_headers).json()['id']
+    association_id = requests.post(f"{api_url}/opportunity-contacts/", json={
+        "opportunity_id": opportunity_id,
+        "contact_id": contact_id
+    }, headers=auth_headers).json()['id']
+
+    response = requests.put(f"{api_url}/companies/{company_id}", json={"industry": "Software"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["industry"] == "Software"
+    assert response.json()["updated_at"] is not None
+    # auth + UPDATE ... RETURNING (nothing reloaded after commit)
+    assert query_count(response) <= 2
+
+    response = requests.put(f"{api_url}/opportunity-contacts/{association_id}", json={"contact_role": "HR"}, headers=auth_headers)
+    assert response.status_code == 200
+    # + lazy loads of the nested opportunity and contact
+    assert query_count(response) <= 5
+
+    response = requests.delete(f"{api_url}/opportunity-contacts/{association_id}", headers=auth_headers)
+    assert response.status_code == 204
+    assert query_count(response) <= 2
+
+    response = requests.delete(f"{api_url}/companies/{company_id}", headers=auth_headers)
+    assert response.status_code == 204
+    assert query_count(response) <= 2
+
+    response = requests.delete(f"{api_url}/companies/{company_id}", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_create_query_budget(api_url, auth_headers, query_count):
+    """Creating an entity is one INSERT ... RETURNING, without a reload after commit."""
+    response = requests.post(f"{api_url}/companies/", json={"name": "Insert Corp"}, headers=auth_headers)
+    assert response.status_code == 201
+    company = response.json()
+    assert company["id"] and company["created_at"] is not None
+    # auth + INSERT ... RETURNING id, created_at
+    assert query_count(response) == 2
+
+    response = requests.post(f"{api_url}/scheduled-events/", json={
+        "title": "Insert Interview",
+        "scheduled_date": "2025-06-01T10:00:00Z"
+    }, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["created_at"] is not None
+    assert query_count(response) == 2
+
+    response = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Insert Job",
+        "application_type": "job_posting",
+        "company_id": company["id"]
+    }, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["company"]["name"] == "Insert Corp"
+    # + company ownership check + lazy load of the nested company
+    assert query_count(response) <= 4
@@ -0,0 +1,187 @@
+"""
+Query plan regression tests.
+
+The list endpoints filter by owner_id first. On a dataset with many tenants, their
+queries must be answered from an index, never by scanning a whole table.
+Each endpoint is called in-process on the seeded database: the SELECT statements
+it executes are captured on the engine, with their parameters, and EXPLAINed, so
+the plans checked are those of the statements the routers actually issue.
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.security import create_access_token
+from app.database import SessionLocal, engine
+from app.main import app
+from app.utils.validators.document_validators import check_user_quota
+
+TENANTS = 1000
+ROWS_PER_TENANT = 10
+
+SEED_SQL = f"""
+    SET session_replication_role = replica;
+
+    INSERT INTO users (id, email, hashed_password, is_active)
+    SELECT u, 'plan-' || u || '@example.com', 'x', true
+    FROM generate_series(1, {TENANTS}) u;
+
+    INSERT INTO companies (id, owner_id, name, is_intermediary)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, 'Company ' || n, false
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO contacts (id, owner_id, company_id, first_name, last_name, is_independent_recruiter)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, n, 'Camille', 'Martin', n % 5 = 0
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO products (id, owner_id, company_id, name)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, n, 'Product ' || n
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO opportunities (id, owner_id, company_id, job_title, application_type)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, n, 'Backend Developer', 'JOB_POSTING'
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO documents (id, owner_id, name, type, format, path, is_external)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, 'Resume ' || n, 'resume',
+           CASE WHEN n % 2 = 0 THEN 'EXTERNAL' ELSE 'PDF' END::documentformat,
+           'documents/' || n || '.pdf', n % 2 = 0
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO applications (id, owner_id, opportunity_id, application_date, status, is_archived)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, n, current_date,
+           (enum_range(NULL::applicationstatus))[n % 6 + 1], n % 4 = 0
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO scheduled_events (id, owner_id, title, scheduled_date, status)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, 'Interview', now() + n * interval '1 hour', 'PENDING'
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO actions (id, owner_id, application_id, type, scheduled_event_id, created_at)
+    SELECT n, (n - 1) / {ROWS_PER_TENANT} + 1, n, 'follow_up', n, now() - n * interval '1 minute'
+    FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO opportunity_contacts (id, opportunity_id, contact_id, is_primary_contact)
+    SELECT n, n, n, true FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO opportunity_products (id, opportunity_id, product_id)
+    SELECT n, n, n FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    INSERT INTO document_associations (id, document_id, entity_type, entity_id)
+    SELECT n, n, 'APPLICATION', n FROM generate_series(1, {TENANTS * ROWS_PER_TENANT}) n;
+
+    SET session_replication_role = DEFAULT;
+    ANALYZE;
+"""
+
+OWNER_ID = TENANTS // 2
+# First row of the owner in each seeded table (ids are contiguous per tenant)
+OWNED_ID = (OWNER_ID - 1) * ROWS_PER_TENANT + 1
+
+# Endpoint -> (method, URL, JSON body, index expected in its plans or None for any index)
+ENDPOINTS = {
+    "GET /applications/": ("GET", "/api/v1/applications/", None, None),
+    "GET /applications/?status=pending&is_archived=false": (
+        "GET", "/api/v1/applications/?status=pending&is_archived=false", None,
+        "ix_applications_owner_id_status_active",
+    ),
+    "GET /applications/?opportunity_id=": (
+        "GET", f"/api/v1/applications/?opportunity_id={OWNED_ID}", None, None,
+    ),
+    "GET /applications/?expand=opportunity.company,resume_used,cover_letter": (
+        "GET", "/api/v1/applications/?expand=opportunity.company,resume_used,cover_letter", None, None,
+    ),
+    "GET /opportunities/": ("GET", "/api/v1/opportunities/", None, None),
+    "GET /companies/": ("GET", "/api/v1/companies/", None, None),
+    "GET /contacts/": ("GET", "/api/v1/contacts/", None, None),
+    "GET /products/": ("GET", "/api/v1/products/", None, None),
+    "GET /documents/": ("GET", "/api/v1/documents/", None, None),
+    "GET /scheduled-events/": ("GET", "/api/v1/scheduled-events/", None, None),
+    "GET /actions/": ("GET", "/api/v1/actions/", None, "ix_actions_owner_id_created_at"),
+    "GET /opportunity-contacts/": ("GET", "/api/v1/opportunity-contacts/", None, None),
+    "GET /opportunity-products/": ("GET", "/api/v1/opportunity-products/", None, None),
+    "GET /document-associations/": ("GET", "/api/v1/document-associations/", None, None),
+    "POST /document-associations/counts": (
+        "POST", "/api/v1/document-associations/counts",
+        {"entities": [
+            {"entity_type": "application", "entity_id": OWNED_ID},
+            {"entity_type": "application", "entity_id": OWNED_ID + 1},
+        ]},
+        "ix_document_associations_entity",
+    ),
+}
+
+
+def plan_nodes(plan):
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+@pytest.fixture(scope="function")
+def seeded_connection(db_connection):
+    """Test database seeded with many tenants (truncated again by cleanup_database)."""
+    with db_connection.cursor() as cur:
+        cur.execute(SEED_SQL)
+    return db_connection
+
+
+@pytest.fixture
+def captured_selects():
+    """SELECT statements (and their parameters) executed by the app meanwhile."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip()[:6].upper() == "SELECT":
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def assert_plans_use_indexes(connection, label, statements, expected_index):
+    """EXPLAIN each statement: no sequential scan, and indexes used (expected_index among them)."""
+    assert statements, f"{label}: no SELECT executed"
+
+    indexes = []
+    for statement, parameters in statements:
+        with connection.cursor() as cur:
+            cur.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = cur.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+        nodes = list(plan_nodes(plan[0]["Plan"]))
+        seq_scans = [node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"]
+        assert not seq_scans, f"{label}: sequential scan on {seq_scans} in\n{statement}"
+        indexes.extend(node["Index Name"] for node in nodes if "Index Name" in node)
+
+    assert indexes, f"{label}: no index used"
+    if expected_index is not None:
+        assert expected_index in indexes, f"{label}: expected {expected_index}, got {indexes}"
+
+
+@pytest.mark.parametrize("endpoint", list(ENDPOINTS))
+def test_list_query_uses_index(seeded_connection, captured_selects, endpoint):
+    method, url, body, expected_index = ENDPOINTS[endpoint]
+    token = create_access_token(f"plan-{OWNER_ID}@example.com")
+
+    response = TestClient(app).request(method, url, json=body, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+
+    assert_plans_use_indexes(seeded_connection, endpoint, captured_selects, expected_index)
+
+
+def test_user_quota_query_uses_index(seeded_connection, captured_selects):
+    db = SessionLocal()
+    try:
+        asyncio.run(check_user_quota(db, OWNER_ID))
+    finally:
+        db.close()
+
+    assert_plans_use_indexes(seeded_connection, "check_user_quota", captured_selects, "ix_documents_owner_id_is_external")
@@ -0,0 +1,48 @@
+"""
+Unit tests for per-request SQL statement counting (QueryStatsMiddleware).
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.query_stats import QueryStatsMiddleware, instrument_engine
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    app = FastAPI()
+
+    @app.get("/statements")
+    def run_statements():
+        with sqlite_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            try:
+                conn.execute(text("SELECT * FROM missing"))
+            except OperationalError:
+                pass
+            return {"connection_info": sorted(conn.info)}
+
+    app.add_middleware(QueryStatsMiddleware)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_failed_statements_are_counted(client):
+    response = client.get("/statements")
+
+    assert response.status_code == 200
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+    # Nothing is left on the pooled connection
+    assert response.json() == {"connection_info": []}
@@ -0,0 +1,174 @@
+"""
+Tests for read replica routing (RoutingSession, ReplicaPool, route_reads_to_replica).
+
+The routing tests run offline: a primary and two "replicas" are separate sqlite
+databases holding different rows, so each read tells which engine served it.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import requests
+from sqlalchemy import Column, Integer, String, create_engine, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import declarative_base
+
+from app import database
+from app.database import ReplicaPool, RoutingSession, get_db, route_reads_to_replica
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    created = {}
+    for name in ("primary", "replica-a", "replica-b"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(Item.__table__.insert(), {"id": 1, "name": name})
+        created[name] = engine
+    yield created
+    for engine in created.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def replica_pool(engines, monkeypatch):
+    pool = ReplicaPool([engines["replica-a"], engines["replica-b"]], retry_after=60)
+    monkeypatch.setattr(database, "replica_pool", pool)
+    return pool
+
+
+@pytest.fixture
+def make_session(engines):
+    sessions = []
+
+    def make(read_only=True, last_write_at=None):
+        db = RoutingSession(bind=engines["primary"], autoflush=False)
+        db.info["read_only"] = read_only
+        route_reads_to_replica(db, last_write_at)
+        sessions.append(db)
+        return db
+
+    yield make
+    for db in sessions:
+        db.close()
+
+
+def read_name(db, item_id=1):
+    return db.scalar(select(Item.name).where(Item.id == item_id))
+
+
+@pytest.mark.unit
+def test_read_only_request_reads_from_replica(replica_pool, make_session):
+    db = make_session()
+    assert read_name(db) == "replica-a"
+    assert db.get(Item, 1).name == "replica-a"
+
+
+@pytest.mark.unit
+def test_write_request_stays_on_primary(replica_pool, make_session):
+    assert read_name(make_session(read_only=False)) == "primary"
+
+
+@pytest.mark.unit
+def test_replicas_are_used_round_robin(replica_pool, make_session):
+    names = [read_name(make_session()) for _ in range(4)]
+    assert names == ["replica-a", "replica-b", "replica-a", "replica-b"]
+
+
+@pytest.mark.unit
+def test_flush_pins_the_session_to_primary(replica_pool, make_session):
+    db = make_session()
+    assert read_name(db) == "replica-a"
+
+    db.add(Item(id=2, name="written"))
+    db.flush()
+
+    assert read_name(db, 2) == "written"
+    assert read_name(db) == "primary"
+
+
+@pytest.mark.unit
+def test_update_statement_pins_the_session_to_primary(replica_pool, make_session):
+    db = make_session()
+    db.execute(update(Item).where(Item.id == 1).values(name="updated"))
+
+    assert read_name(db) == "updated"
+
+
+@pytest.mark.unit
+def test_recent_write_reads_from_primary(replica_pool, make_session):
+    now = datetime.now(timezone.utc)
+    window = timedelta(seconds=database.settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+    assert read_name(make_session(last_write_at=now)) == "primary"
+    assert read_name(make_session(last_write_at=now - window - timedelta(seconds=1))) == "replica-a"
+
+
+@pytest.mark.unit
+def test_down_replica_is_skipped(engines, tmp_path, monkeypatch, make_session):
+    down = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica'}.db")
+    pool = ReplicaPool([down, engines["replica-a"]], retry_after=60)
+    monkeypatch.setattr(database, "replica_pool", pool)
+
+    # The connection failure marks the replica down (handle_error event)
+    with pytest.raises(OperationalError):
+        read_name(make_session())
+
+    assert [read_name(make_session()) for _ in range(3)] == ["replica-a"] * 3
+
+    # Every replica down: reads fall back to the primary
+    pool.mark_down(engines["replica-a"])
+    assert read_name(make_session()) == "primary"
+    down.dispose()
+
+
+@pytest.mark.unit
+def test_get_db_marks_read_only_methods():
+    for method, read_only in (("GET", True), ("HEAD", True), ("POST", False), ("PUT", False)):
+        sessions = get_db(SimpleNamespace(method=method))
+        db = next(sessions)
+        assert db.info["read_only"] is read_only
+        sessions.close()
+
+
+def test_writes_stamp_user_last_write_at(api_url, auth_headers, db_connection):
+    """users.last_write_at (read-your-writes routing) is set by writes only."""
+    user_id = requests.get(f"{api_url}/users/me", headers=auth_headers).json()["id"]
+
+    def last_write_at():
+        with db_connection.cursor() as cur:
+            cur.execute("SELECT last_write_at FROM users WHERE id = %s", (user_id,))
+            return cur.fetchone()[0]
+
+    assert last_write_at() is None
+
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Stamp Corp"}, headers=auth_headers).json()['id']
+    created_at = last_write_at()
+    assert created_at is not None
+
+    requests.get(f"{api_url}/companies/{company_id}", headers=auth_headers)
+    assert last_write_at() == created_at
+
+    # Inherited ownership (through the opportunity) stamps the owner as well
+    opportunity_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Stamp Job",
+        "application_type": "job_posting"
+    }, headers=auth_headers).json()['id']
+    opportunity_written_at = last_write_at()
+    contact_id = requests.post(f"{api_url}/contacts/", json={"first_name": "Stamp", "last_name": "Contact"}, headers=auth_headers).json()['id']
+    contact_written_at = last_write_at()
+    requests.post(f"{api_url}/opportunity-contacts/", json={
+        "opportunity_id": opportunity_id,
+        "contact_id": contact_id
+    }, headers=auth_headers)
+    assert created_at < opportunity_written_at < contact_written_at < last_write_at()
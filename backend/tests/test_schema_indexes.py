@@ -0,0 +1,34 @@
+"""
+Schema checks: indexes backing the foreign keys.
+"""
+
+# Foreign keys whose columns are not the leading columns of any index
+UNINDEXED_FOREIGN_KEYS_SQL = """
+    SELECT c.conrelid::regclass::text, c.conname
+    FROM pg_constraint c
+    WHERE c.contype = 'f'
+      AND c.connamespace = 'public'::regnamespace
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_index i
+          WHERE i.indrelid = c.conrelid
+            AND (i.indkey::int2[])[0:cardinality(c.conkey) - 1] @> c.conkey
+      )
+    ORDER BY 1, 2
+"""
+
+
+def test_every_foreign_key_is_indexed(db_connection):
+    """Cascades on the parent and ?<fk>= filters must not scan the child table."""
+    with db_connection.cursor() as cur:
+        cur.execute(UNINDEXED_FOREIGN_KEYS_SQL)
+        assert cur.fetchall() == []
+
+
+def test_foreign_key_indexes_are_valid(db_connection):
+    """A failed CREATE INDEX CONCURRENTLY leaves an invalid index behind."""
+    with db_connection.cursor() as cur:
+        cur.execute("""
+            SELECT indexrelid::regclass::text FROM pg_index
+            WHERE NOT indisvalid AND indrelid::regclass::text NOT LIKE 'pg_%'
+        """)
+        assert cur.fetchall() == []
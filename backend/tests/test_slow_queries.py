@@ -0,0 +1,84 @@
+"""
+Unit tests for the slow query log (parameter redaction and threshold).
+"""
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.slow_queries import SlowQueryLogger, redact_parameters
+
+pytestmark = pytest.mark.unit
+
+
+def test_redact_parameters_dict():
+    redacted = redact_parameters({"email": "ada@example.com", "owner_id": 42, "notes": None, "blob": b"\x00\x01"})
+    assert redacted == {"email": "<str:15>", "owner_id": "<int>", "notes": "NULL", "blob": "<bytes:2>"}
+
+
+def test_redact_parameters_tuple():
+    assert redact_parameters(("secret-password", 3.5)) == ["<str:15>", "<float>"]
+
+
+def test_redact_parameters_executemany():
+    rows = [{"name": "Ada"}, {"name": "Grace"}, {"name": "Linus"}]
+    assert redact_parameters(rows, executemany=True) == "<3 parameter sets>"
+
+
+@pytest.fixture
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def test_slow_statement_is_logged_redacted(sqlite_engine, caplog):
+    slow_query_logger = SlowQueryLogger(sqlite_engine, threshold_ms=0, explain_sample_rate=0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.slow_queries"):
+            with sqlite_engine.connect() as conn:
+                conn.execute(text("SELECT :email AS email"), {"email": "ada@example.com"})
+    finally:
+        slow_query_logger.close()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 1
+    assert "Slow query" in messages[0]
+    assert "SELECT ? AS email" in messages[0]
+    assert "<str:15>" in messages[0]
+    assert "ada@example.com" not in messages[0]
+
+
+def test_fast_statement_is_not_logged(sqlite_engine, caplog):
+    slow_query_logger = SlowQueryLogger(sqlite_engine, threshold_ms=60_000, explain_sample_rate=0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.slow_queries"):
+            with sqlite_engine.connect() as conn:
+                conn.execute(text("SELECT :email AS email"), {"email": "ada@example.com"})
+    finally:
+        slow_query_logger.close()
+
+    assert caplog.records == []
+
+
+def test_failed_statement_is_logged_and_leaves_no_state(sqlite_engine, caplog):
+    slow_query_logger = SlowQueryLogger(sqlite_engine, threshold_ms=0, explain_sample_rate=0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.slow_queries"):
+            with sqlite_engine.connect() as conn:
+                for _ in range(3):
+                    with pytest.raises(OperationalError):
+                        conn.execute(text("SELECT * FROM missing WHERE email = :email"), {"email": "ada@example.com"})
+                conn.execute(text("SELECT 1"))
+                connection_info = dict(conn.info)
+    finally:
+        slow_query_logger.close()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 4
+    assert all("failed: OperationalError" in message for message in messages[:3])
+    assert "<str:15>" in messages[0]
+    assert "ada@example.com" not in messages[0]
+    assert "failed" not in messages[3]
+    assert connection_info == {}
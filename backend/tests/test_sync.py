@@ -0,0 +1,85 @@
+"""
+Tests for the delta sync feed (/sync?since=<token>).
+"""
+import requests
+
+
+def test_sync_returns_upserts_then_tombstones(api_url, auth_headers, second_user_headers):
+    company_id = requests.post(f"{api_url}/companies/", json={"name": "Sync Corp"}, headers=auth_headers).json()['id']
+    contact_id = requests.post(f"{api_url}/contacts/", json={
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "company_id": company_id
+    }, headers=auth_headers).json()['id']
+    requests.post(f"{api_url}/companies/", json={"name": "Other User Corp"}, headers=second_user_headers)
+
+    # Full sync: both entities as upserts, nothing from the other user
+    full = requests.get(f"{api_url}/sync/?since=0", headers=auth_headers).json()
+    synced = {(c["entity_type"], c["entity_id"]): c for c in full["changes"]}
+    assert set(synced) == {("companies", company_id), ("contacts", contact_id)}
+    assert synced[("companies", company_id)]["operation"] == "upsert"
+    assert synced[("companies", company_id)]["data"]["name"] == "Sync Corp"
+    assert full["has_more"] is False
+    token = full["next_token"]
+
+    # Nothing changed since the token
+    assert requests.get(f"{api_url}/sync/?since={token}", headers=auth_headers).json()["changes"] == []
+
+    # Update then delete: collapsed into a single tombstone
+    requests.put(f"{api_url}/contacts/{contact_id}", json={"first_name": "Augusta"}, headers=auth_headers)
+    requests.delete(f"{api_url}/contacts/{contact_id}", headers=auth_headers)
+    requests.put(f"{api_url}/companies/{company_id}", json={"name": "Sync Corp 2"}, headers=auth_headers)
+
+    delta = requests.get(f"{api_url}/sync/?since={token}", headers=auth_headers).json()
+    changes = {(c["entity_type"], c["entity_id"]): c for c in delta["changes"]}
+    assert changes[("contacts", contact_id)]["operation"] == "delete"
+    assert changes[("contacts", contact_id)]["data"] is None
+    assert changes[("companies", company_id)]["data"]["name"] == "Sync Corp 2"
+    assert len(changes) == 2
+    assert delta["next_token"] > token
+
+
+def test_sync_pagination(api_url, auth_headers):
+    for i in range(3):
+        requests.post(f"{api_url}/companies/", json={"name": f"Page Corp {i}"}, headers=auth_headers)
+
+    first = requests.get(f"{api_url}/sync/?since=0&limit=2", headers=auth_headers).json()
+    assert len(first["changes"]) == 2
+    assert first["has_more"] is True
+
+    second = requests.get(f"{api_url}/sync/?since={first['next_token']}&limit=2", headers=auth_headers).json()
+    assert len(second["changes"]) == 1
+    assert second["has_more"] is False
+
+
+
+def test_sync_carries_actions_and_applications(api_url, auth_headers):
+    """Entities with required nested objects in their response schema sync as columns only."""
+    opportunity_id = requests.post(f"{api_url}/opportunities/", json={
+        "job_title": "Sync Job",
+        "application_type": "job_posting"
+    }, headers=auth_headers).json()['id']
+    application_id = requests.post(f"{api_url}/applications/", json={
+        "opportunity_id": opportunity_id,
+        "application_date": "2025-03-01"
+    }, headers=auth_headers).json()['id']
+    action_id = requests.post(f"{api_url}/actions/", json={
+        "application_id": application_id,
+        "type": "follow_up"
+    }, headers=auth_headers).json()['id']
+
+    full = requests.get(f"{api_url}/sync/?since=0", headers=auth_headers)
+    assert full.status_code == 200
+    synced = {(c["entity_type"], c["entity_id"]): c for c in full.json()["changes"]}
+    action = synced[("actions", action_id)]["data"]
+    assert action["application_id"] == application_id
+    assert "application" not in action
+    assert "opportunity" not in synced[("applications", application_id)]["data"]
+
+    # Update: the action comes back with its new columns
+    requests.put(f"{api_url}/actions/{action_id}", json={"notes": "Called back"}, headers=auth_headers)
+    delta = requests.get(f"{api_url}/sync/?since={full.json()['next_token']}", headers=auth_headers)
+    assert delta.status_code == 200
+    changes = delta.json()["changes"]
+    assert [(c["entity_type"], c["entity_id"], c["operation"]) for c in changes] == [("actions", action_id, "upsert")]
+    assert changes[0]["data"]["notes"] == "Called back"
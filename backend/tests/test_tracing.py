@@ -0,0 +1,96 @@
+"""
+Unit tests for request tracing, with the file exporter.
+
+Runs a small in-process app shaped like the API (traced sync dependency querying
+an instrumented engine, response_model endpoint) and reads the exported spans.
+"""
+import json
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import create_engine, text
+
+from app.core import tracing
+
+pytestmark = pytest.mark.unit
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture(scope="module")
+def spans_file(tmp_path_factory):
+    # The tracer provider is global: configured once for this module
+    path = tmp_path_factory.mktemp("traces") / "spans.jsonl"
+    provider = tracing.configure_tracing("file", service_name="candidash-test", file_path=str(path), otlp_endpoint="")
+    yield path, provider
+    provider.shutdown()
+
+
+@pytest.fixture
+def client():
+    engine = create_engine("sqlite://")
+    tracing.instrument_engine(engine)
+
+    @tracing.traced("test.load_item")
+    def load_item(item_id: int) -> dict:
+        with engine.connect() as conn:
+            name = conn.execute(text("SELECT 'Widget ' || :item_id"), {"item_id": item_id}).scalar_one()
+        return {"id": item_id, "name": name}
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", response_model=Item)
+    def get_item(item: dict = Depends(load_item)):
+        return item
+
+    app.add_middleware(tracing.TracingMiddleware)
+    tracing.instrument_routes(app)
+
+    with TestClient(app) as test_client:
+        yield test_client
+    engine.dispose()
+
+
+def read_spans(spans_file):
+    path, provider = spans_file
+    provider.force_flush()
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_request_spans_are_exported(spans_file, client):
+    response = client.get("/items/7")
+    assert response.status_code == 200
+    assert response.json() == {"id": 7, "name": "Widget 7"}
+
+    spans = {span["name"]: span for span in read_spans(spans_file)}
+    server = spans["GET /items/{item_id}"]
+    assert server["kind"] == "SpanKind.SERVER"
+    assert server["attributes"]["http.route"] == "/items/{item_id}"
+    assert server["attributes"]["http.response.status_code"] == 200
+
+    # One trace: dependency (traced) -> SQL statement, endpoint, serialization
+    trace_id = server["context"]["trace_id"]
+    assert {span["context"]["trace_id"] for span in spans.values()} == {trace_id}
+
+    server_id = server["context"]["span_id"]
+    load_item = spans["test.load_item"]
+    assert load_item["parent_id"] == server_id
+    sql = spans["SELECT"]
+    assert sql["parent_id"] == load_item["context"]["span_id"]
+    assert sql["attributes"]["db.statement"].startswith("SELECT 'Widget '")
+    assert spans["endpoint.get_item"]["parent_id"] == server_id
+    assert spans["serialize_response"]["parent_id"] == server_id
+
+
+def test_incoming_traceparent_is_continued(spans_file, client):
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    response = client.get("/items/8", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+    assert response.status_code == 200
+
+    servers = [span for span in read_spans(spans_file) if span["name"] == "GET /items/{item_id}"]
+    assert servers[-1]["context"]["trace_id"] == f"0x{trace_id}"
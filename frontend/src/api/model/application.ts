@@ -10,7 +10,7 @@ import type { ApplicationSalaryExpectation } from './applicationSalaryExpectatio
 import type { ApplicationResumeUsedId } from './applicationResumeUsedId';
 import type { ApplicationCoverLetterId } from './applicationCoverLetterId';
 import type { ApplicationUpdatedAt } from './applicationUpdatedAt';
-import type { Opportunity } from './opportunity';
+import type { ApplicationOpportunity } from './applicationOpportunity';
 import type { ApplicationResumeUsed } from './applicationResumeUsed';
 import type { ApplicationCoverLetter } from './applicationCoverLetter';
 
@@ -41,7 +41,7 @@ export interface Application {
   created_at: string;
   /** Last update timestamp */
   updated_at?: ApplicationUpdatedAt;
-  opportunity: Opportunity;
+  opportunity?: ApplicationOpportunity;
   resume_used?: ApplicationResumeUsed;
   cover_letter?: ApplicationCoverLetter;
 }
@@ -31,4 +31,12 @@ status?: ApplicationStatus | null;
  * Filter by archive status
  */
 is_archived?: boolean | null;
+/**
+ * Comma-separated list of fields to return (e.g. id,status,application_date)
+ */
+fields?: string | null;
+/**
+ * Comma-separated relationships to include: opportunity, opportunity.company, resume_used, cover_letter
+ */
+expand?: string | null;
 };
@@ -33,6 +33,7 @@ export * from './applicationCreateWithoutOpportunityId';
 export * from './applicationCreateWithoutOpportunityIdCoverLetterId';
 export * from './applicationCreateWithoutOpportunityIdResumeUsedId';
 export * from './applicationCreateWithoutOpportunityIdSalaryExpectation';
+export * from './applicationOpportunity';
 export * from './applicationResumeUsed';
 export * from './applicationResumeUsedId';
 export * from './applicationSalaryExpectation';
@@ -18,7 +18,7 @@ export function ApplicationDetailsContent({
   opportunity,
 }: {
   application: Application;
-  opportunity: Opportunity
+  opportunity?: Opportunity | null;
 }) {
   const { downloadDocument, isDownloading } = useDownloadDocument();
   const resume = application.resume_used;
@@ -3,6 +3,9 @@ import { useAuth } from '@/hooks/shared/use-auth';
 import { ApplicationStatus } from '@/api/model';
 import { keepPreviousData } from '@tanstack/react-query';
 
+// Nested objects rendered by application cards (list endpoint returns ids only by default)
+const APPLICATION_LIST_EXPAND = 'opportunity.company,resume_used,cover_letter';
+
 interface UseApplicationsParams {
   skip?: number;
   limit?: number;
@@ -28,7 +31,8 @@ export function useApplications({
       limit,
       opportunity_id: opportunityId,
       status,
-      is_archived: isArchived
+      is_archived: isArchived,
+      expand: APPLICATION_LIST_EXPAND
     },
     {
       query: {
@@ -0,0 +1,32 @@
+#!/bin/bash
+set -e
+
+echo "🚀 STARTING LOAD TEST..."
+
+# 1. Cleanup
+docker compose -f compose.loadtest.yaml down -v --remove-orphans
+
+# Volumes and duration: LOADTEST_TENANTS, LOADTEST_OPPORTUNITIES, LOADTEST_APPLICATIONS,
+# LOADTEST_ACTIONS, LOADTEST_USERS, LOADTEST_DURATION, LOADTEST_WORKERS
+
+# 2. Seed the database (Build + Run to completion)
+echo "🌱 Building and seeding the load test database..."
+docker compose -f compose.loadtest.yaml build seeder
+docker compose -f compose.loadtest.yaml run --rm seeder
+
+# 3. Start the backend and run the load generator
+echo "📈 Running the load test..."
+
+set +e
+docker compose -f compose.loadtest.yaml up \
+    --exit-code-from loadtester \
+    --abort-on-container-exit \
+    backend loadtester
+
+EXIT_CODE=$?
+
+# 4. Final Cleanup
+echo "🧹 Cleaning up load test environment..."
+docker compose -f compose.loadtest.yaml down -v
+
+exit $EXIT_CODE